@@ -43,9 +43,13 @@ setup(
         ],
     },
     extras_require={
+        "fastmatch": [
+            "pyahocorasick>=2.0.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-qt>=4.2.0",
+            "pytest-xdist>=3.3.0",
             "black>=23.0.0",
             "mypy>=1.5.0",
         ],
@@ -53,5 +57,6 @@ setup(
     include_package_data=True,
     package_data={
         "": ["*.json", "*.yaml", "*.yml", "*.md", "*.txt"],
+        "src.gui": ["resources/*.qss", "resources/*.qrc"],
     },
 ) 
\ No newline at end of file
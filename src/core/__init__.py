@@ -11,7 +11,7 @@
 - file_filter: ファイルフィルタリング機能を提供するクラス
 """
 
-from .file_info import FileInfo
+from .file_info import FileInfo, hash_many
 from .metadata_extractor import MetadataExtractor
 from .path_generator import (
     PathElement, LiteralElement, MetadataElement, 
@@ -23,6 +23,7 @@ from .file_filter import FileFilter, FilterStats
 
 __all__ = [
     'FileInfo',
+    'hash_many',
     'MetadataExtractor',
     'PathElement',
     'LiteralElement',
@@ -1,28 +1,137 @@
 import hashlib
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from .models import FileStatus
+
+# メディア種別ごとの拡張子（モジュールロード時に一度だけ構築）
+_VIDEO_EXTENSIONS = frozenset({"mp4", "mov", "avi", "wmv", "m4v", "mts", "m2ts"})
+_IMAGE_EXTENSIONS = frozenset(
+    {"jpg", "jpeg", "png", "gif", "tiff", "tif", "bmp", "heic", "heif"}
+)
+_AUDIO_EXTENSIONS = frozenset({"mp3", "wav", "aac", "flac", "m4a"})
+_RAW_EXTENSIONS = frozenset({"arw", "raw", "cr2", "cr3", "nef", "orf", "rw2", "dng"})
+
+# 拡張子 → メディア種別の統合ルックアップテーブル
+_EXTENSION_TO_MEDIA_TYPE: Dict[str, str] = {
+    **{ext: "video" for ext in _VIDEO_EXTENSIONS},
+    **{ext: "image" for ext in _IMAGE_EXTENSIONS},
+    **{ext: "audio" for ext in _AUDIO_EXTENSIONS},
+    **{ext: "raw" for ext in _RAW_EXTENSIONS},
+}
+
+# iOS/Androidのスクリーンショットファイル名パターンを統合したコンパイル済み正規表現
+# （判定対象は小文字化済みファイル名）
+_SCREENSHOT_FILENAME_RE = re.compile(
+    r"^(?:img_\d{4}\.png"  # IMG_0001.PNG (iOS)
+    r"|screenshot.*\.png"  # Screenshot_*.png (iOS/Android)
+    r"|スクリーンショット.*\.png)$"  # 日本語設定の場合
+)
+
+# スクリーンショット用フォルダのパターンを統合したコンパイル済み正規表現
+# （判定対象は小文字化・区切り正規化済みパス）
+_SCREENSHOT_PATH_RE = re.compile(
+    r"/(?:pictures/screenshots/|dcim/screenshots/|screenshot/|スクリーンショット/)"
+)
+
+# iOSデバイスの画面解像度パターン
+_IOS_SCREEN_RESOLUTIONS = [
+    (1125, 2436),
+    (1242, 2688),
+    (828, 1792),  # iPhone X系
+    (750, 1334),
+    (1242, 2208),  # iPhone 6/7/8系
+    (640, 1136),
+    (640, 960),
+    (320, 480),  # 古いiPhone
+    (1668, 2388),
+    (2048, 2732),
+    (1536, 2048),  # iPad
+]
+
+# 縦横両方向を展開した判定用セット（O(1)でルックアップできる）
+_IOS_SCREEN_RESOLUTION_SET = frozenset(
+    _IOS_SCREEN_RESOLUTIONS + [(h, w) for w, h in _IOS_SCREEN_RESOLUTIONS]
+)
+
+
+# クイックハッシュで読み込む先頭プレフィックスのサイズ
+_QUICK_HASH_PREFIX_SIZE = 64 * 1024
+
+# スクリーンショット判定チャネルのビットフラグ（_screenshot_signals用）
+SCREENSHOT_SIGNAL_FILENAME = 1
+SCREENSHOT_SIGNAL_PATH = 2
+SCREENSHOT_SIGNAL_METADATA = 4
+SCREENSHOT_SIGNAL_ALL = (
+    SCREENSHOT_SIGNAL_FILENAME | SCREENSHOT_SIGNAL_PATH | SCREENSHOT_SIGNAL_METADATA
+)
 
 
 class FileInfo:
     """ファイル情報を保持するクラス"""
 
-    def __init__(self, original_path: str, source_device: Optional[str] = None):
+    # インスタンスごとの__dict__を持たず、メモリ使用量と属性アクセスを削減する
+    #
+    # 補足: status/target_path/mtimeを並列配列で持つSoA（Structure of
+    # Arrays）レイアウトへの移行も検討したが、FileInfoはGUIのテーブル
+    # モデルや関連ファイルのリンクから同一オブジェクトとして共有・更新
+    # されるため、配列とオブジェクトの二重管理（同期コスト）が
+    # キャッシュ局所性の利得を上回ると判断し、__slots__付きAoSのまま
+    # としている。
+    __slots__ = (
+        "original_path",
+        "original_filename",
+        "original_extension",
+        "source_device",
+        "size",
+        "last_modified",
+        "media_type",
+        "metadata",
+        "hash",
+        "quick_hash",
+        "target_path",
+        "target_filename",
+        "status",
+        "associated_files",
+        "error_message",
+        "_is_screenshot_cache",
+        "_original_filename_lower",
+        "_original_path_norm",
+        "_stat_cache",
+        "_metadata_loaded",
+    )
+
+    def __init__(
+        self,
+        original_path: str,
+        source_device: Optional[str] = None,
+        stat_result: Optional[os.stat_result] = None,
+    ):
         """
         Args:
             original_path: 元のファイルのパス
             source_device: ソースデバイスタイプ (iOS, Android, Camera等)
+            stat_result: 取得済みのstat結果（os.scandirベースの走査で
+                取得済みの場合に渡すと、os.statの再呼び出しを省略できる）
         """
         self.original_path = original_path
         self.original_filename = os.path.basename(original_path)
+        # original_extensionは常に小文字（各判定メソッドは再lower()しない前提）
         self.original_extension = os.path.splitext(self.original_filename)[1].lower()[
             1:
         ]
         self.source_device = source_device
 
-        # ファイルの基本情報
-        stat = os.stat(original_path)
+        # 小文字化・正規化済み文字列のキャッシュ（フィルタ判定で繰り返し参照される）
+        self._original_filename_lower = self.original_filename.lower()
+        self._original_path_norm = original_path.lower().replace("\\", "/")
+
+        # ファイルの基本情報（statは1回だけ実行し、結果をキャッシュする）
+        stat = stat_result if stat_result is not None else os.stat(original_path)
+        self._stat_cache: Optional[os.stat_result] = stat
         self.size = stat.st_size
         self.last_modified = datetime.fromtimestamp(stat.st_mtime)
 
@@ -32,44 +141,46 @@ class FileInfo:
         # 後で設定される情報
         self.metadata: Dict[str, Any] = {}
         self.hash: Optional[str] = None
+        self.quick_hash: Optional[bytes] = None
         self.target_path: Optional[str] = None
         self.target_filename: Optional[str] = None
-        self.status: Literal["pending", "copied", "skipped", "error"] = "pending"
+        # FileStatusはstr継承のため、既存の文字列比較もそのまま成立する
+        self.status: FileStatus = FileStatus.PENDING
         self.associated_files: List["FileInfo"] = []
         self.error_message: Optional[str] = None
 
         # スクリーンショット判定結果のキャッシュ
         self._is_screenshot_cache: Optional[bool] = None
 
+        # メタデータ抽出済みフラグ（ensure_metadataの再実行防止）
+        self._metadata_loaded = False
+
+    @classmethod
+    def from_dir_entry(
+        cls, entry: "os.DirEntry[str]", source_device: Optional[str] = None
+    ) -> "FileInfo":
+        """
+        os.DirEntryからFileInfoを作成
+
+        scandirベースの走査ではDirEntryがstat情報をキャッシュしているため、
+        このコンストラクタを使うとファイルあたりのstat syscallを省略できる。
+
+        Args:
+            entry: os.scandirが返すディレクトリエントリ
+            source_device: ソースデバイスタイプ (iOS, Android, Camera等)
+
+        Returns:
+            作成されたFileInfoオブジェクト
+        """
+        return cls(
+            entry.path,
+            source_device,
+            stat_result=entry.stat(follow_symlinks=False),
+        )
+
     def _guess_media_type(self) -> Literal["video", "image", "audio", "raw", "unknown"]:
         """ファイル拡張子からメディア種別を推定"""
-        video_extensions = {"mp4", "mov", "avi", "wmv", "m4v", "mts", "m2ts"}
-        image_extensions = {
-            "jpg",
-            "jpeg",
-            "png",
-            "gif",
-            "tiff",
-            "tif",
-            "bmp",
-            "heic",
-            "heif",
-        }
-        audio_extensions = {"mp3", "wav", "aac", "flac", "m4a"}
-        raw_extensions = {"arw", "raw", "cr2", "cr3", "nef", "orf", "rw2", "dng"}
-
-        ext = self.original_extension.lower()
-
-        if ext in video_extensions:
-            return "video"
-        elif ext in image_extensions:
-            return "image"
-        elif ext in audio_extensions:
-            return "audio"
-        elif ext in raw_extensions:
-            return "raw"
-        else:
-            return "unknown"
+        return _EXTENSION_TO_MEDIA_TYPE.get(self.original_extension, "unknown")
 
     def is_screenshot(self) -> bool:
         """
@@ -104,54 +215,49 @@ class FileInfo:
         self._is_screenshot_cache = False
         return False
 
-    def _is_screenshot_by_filename(self) -> bool:
-        """ファイル名パターンでスクリーンショットかどうかを判定"""
-        filename = self.original_filename.lower()
+    def _screenshot_signals(self, channels: int = SCREENSHOT_SIGNAL_ALL) -> int:
+        """
+        スクリーンショット判定チャネルの発火状況をビットマスクで取得
 
-        # iOSスクリーンショットパターン
-        ios_patterns = [
-            r"^img_\d{4}\.png$",  # IMG_0001.PNG
-            r"^screenshot.*\.png$",  # Screenshot_*.png
-            r"^スクリーンショット.*\.png$",  # 日本語設定の場合
-        ]
+        個別の述語を呼び分ける代わりに、必要なチャネルだけを1回の
+        呼び出しでまとめて評価する。発火したチャネルのビットを返す。
 
-        # Androidスクリーンショットパターン
-        android_patterns = [
-            r"^screenshot.*\.png$",
-            r"^screenshot_\d{4}-\d{2}-\d{2}-\d{2}-\d{2}-\d{2}.*\.png$",
-            r"^スクリーンショット.*\.png$",
-        ]
-
-        all_patterns = ios_patterns + android_patterns
+        Args:
+            channels: 評価するチャネルのビットマスク
+                （SCREENSHOT_SIGNAL_FILENAME | PATH | METADATA）
 
-        for pattern in all_patterns:
-            if re.match(pattern, filename):
-                return True
+        Returns:
+            発火したチャネルのビットマスク
+        """
+        signals = 0
+        if channels & SCREENSHOT_SIGNAL_FILENAME and self._is_screenshot_by_filename():
+            signals |= SCREENSHOT_SIGNAL_FILENAME
+        if channels & SCREENSHOT_SIGNAL_PATH and self._is_screenshot_by_path():
+            signals |= SCREENSHOT_SIGNAL_PATH
+        if channels & SCREENSHOT_SIGNAL_METADATA and self._is_screenshot_by_metadata():
+            signals |= SCREENSHOT_SIGNAL_METADATA
+        return signals
 
-        return False
+    def _is_screenshot_by_filename(self) -> bool:
+        """ファイル名パターンでスクリーンショットかどうかを判定"""
+        return _SCREENSHOT_FILENAME_RE.match(self._original_filename_lower) is not None
 
     def _is_screenshot_by_path(self) -> bool:
         """ファイルパスでスクリーンショットかどうかを判定"""
-        path_lower = self.original_path.lower().replace("\\", "/")
-
-        # スクリーンショット用フォルダのパターン
-        screenshot_paths = [
-            "/pictures/screenshots/",
-            "/pictures/",  # Android/iOS共通
-            "/dcim/screenshots/",
-            "/screenshot/",
-            "/スクリーンショット/",
-        ]
+        path_lower = self._original_path_norm
 
-        # DCIM以外のPicturesフォルダの場合はスクリーンショットの可能性が高い（iOS）
-        if "/pictures/" in path_lower and "/dcim/" not in path_lower:
-            # ただし、拡張子がPNGの場合のみ
-            if self.original_extension.lower() == "png":
-                return True
+        # スクリーンショット用フォルダのパターンを1回の走査でチェック
+        if _SCREENSHOT_PATH_RE.search(path_lower):
+            return True
 
-        for screenshot_path in screenshot_paths:
-            if screenshot_path in path_lower:
-                return True
+        # DCIM以外のPicturesフォルダの場合はスクリーンショットの可能性が高い（iOS）
+        # ただし、拡張子がPNGの場合のみ
+        if (
+            self.original_extension == "png"
+            and "/pictures/" in path_lower
+            and "/dcim/" not in path_lower
+        ):
+            return True
 
         return False
 
@@ -181,30 +287,12 @@ class FileInfo:
 
     def _is_ios_screenshot_by_metadata(self) -> bool:
         """iOS特有のメタデータでスクリーンショット判定"""
-        # iOSデバイスの画面解像度パターン
-        ios_screen_resolutions = [
-            (1125, 2436),
-            (1242, 2688),
-            (828, 1792),  # iPhone X系
-            (750, 1334),
-            (1242, 2208),  # iPhone 6/7/8系
-            (640, 1136),
-            (640, 960),
-            (320, 480),  # 古いiPhone
-            (1668, 2388),
-            (2048, 2732),
-            (1536, 2048),  # iPad
-        ]
-
         width = self.metadata.get("width", 0)
         height = self.metadata.get("height", 0)
 
-        if width and height:
-            # 縦横どちらでも一致すればスクリーンショットの可能性
-            for w, h in ios_screen_resolutions:
-                if (width == w and height == h) or (width == h and height == w):
-                    # PNGファイルならスクリーンショットの可能性が高い
-                    return self.original_extension.lower() == "png"
+        if width and height and (width, height) in _IOS_SCREEN_RESOLUTION_SET:
+            # PNGファイルならスクリーンショットの可能性が高い
+            return self.original_extension == "png"
 
         return False
 
@@ -214,6 +302,41 @@ class FileInfo:
         # 主にファイルパスや名前で判定する
         return False
 
+    def ensure_metadata(self) -> Dict[str, Any]:
+        """
+        メタデータを必要になった時点で抽出（1回だけ実行）
+
+        メタデータを参照するフィルターが呼び出すことで、安価なフィルターで
+        除外されたファイルのEXIF読み込みを完全にスキップできる。
+        すでにメタデータが設定されている場合は再抽出しない。
+
+        Returns:
+            メタデータの辞書
+        """
+        if not self._metadata_loaded and not self.metadata:
+            # 循環importを避けるため遅延import
+            from .metadata_extractor import MetadataExtractor
+
+            MetadataExtractor.extract_metadata(self)
+            self._metadata_loaded = True
+
+        return self.metadata
+
+    def get_stat(self) -> os.stat_result:
+        """
+        statの結果を取得（初回のみsyscallを発行し、以降はキャッシュを返す）
+
+        Returns:
+            os.stat_resultオブジェクト
+        """
+        if self._stat_cache is None:
+            self._stat_cache = os.stat(self.original_path)
+        return self._stat_cache
+
+    def invalidate_stat(self) -> None:
+        """statキャッシュを破棄（コピー後などファイルが変化した際に呼び出し）"""
+        self._stat_cache = None
+
     def reset_screenshot_cache(self) -> None:
         """スクリーンショット判定キャッシュをリセット（メタデータ更新後に呼び出し）"""
         self._is_screenshot_cache = None
@@ -224,15 +347,11 @@ class FileInfo:
         if self.size == 0:
             return "0 B"
 
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(self.size)
-        unit_index = 0
-
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
+        # bit_lengthから単位インデックスを直接求める（1024による除算ループを回避）
+        unit_index = min((self.size.bit_length() - 1) // 10, 4)
+        size = self.size / (1 << (unit_index * 10))
 
-        return f"{size:.1f} {units[unit_index]}"
+        return f"{size:.1f} {('B', 'KB', 'MB', 'GB', 'TB')[unit_index]}"
 
     def calculate_hash(self, algorithm: str = "sha256") -> str:
         """
@@ -247,20 +366,56 @@ class FileInfo:
         if self.hash:
             return self.hash
 
-        hash_func = {
-            "md5": hashlib.md5,
-            "sha1": hashlib.sha1,
-            "sha256": hashlib.sha256,
-        }.get(algorithm.lower(), hashlib.sha256)()
+        algorithm_name = algorithm.lower()
+        if algorithm_name not in ("md5", "sha1", "sha256"):
+            algorithm_name = "sha256"
 
         with open(self.original_path, "rb") as f:
-            # バッファリングしてファイルを読み込む
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_func.update(chunk)
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: GILを解放しつつ大きなバッファで直接読み込む
+                hash_func = hashlib.file_digest(f, algorithm_name)
+            else:
+                # 旧バージョン向けフォールバック（1MiBチャンクで読み込む）
+                hash_func = hashlib.new(algorithm_name)
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hash_func.update(chunk)
 
         self.hash = hash_func.hexdigest()
         return self.hash
 
+    def calculate_quick_hash(self, algorithm: str = "sha256") -> bytes:
+        """
+        ファイル先頭64KiBのクイックハッシュを計算
+
+        重複検出の前段フィルタ用。先頭バイトが異なるファイルは重複に
+        なり得ないため、フルハッシュより大幅に安価に候補を絞り込める。
+        ファイル全体が64KiB以下の場合はフルハッシュと等価なので、
+        self.hashにも結果を記録して2回目の読み込みを省略する。
+
+        Args:
+            algorithm: ハッシュアルゴリズム ("sha256", "md5", "sha1")
+
+        Returns:
+            ハッシュ値の先頭16バイト
+        """
+        if self.quick_hash is not None:
+            return self.quick_hash
+
+        algorithm_name = algorithm.lower()
+        if algorithm_name not in ("md5", "sha1", "sha256"):
+            algorithm_name = "sha256"
+
+        hash_func = hashlib.new(algorithm_name)
+        with open(self.original_path, "rb") as f:
+            hash_func.update(f.read(_QUICK_HASH_PREFIX_SIZE))
+
+        if self.size <= _QUICK_HASH_PREFIX_SIZE:
+            # プレフィックス＝ファイル全体なのでフルハッシュとして再利用できる
+            self.hash = hash_func.hexdigest()
+
+        self.quick_hash = hash_func.digest()[:16]
+        return self.quick_hash
+
     def set_target_path(self, full_path: str) -> None:
         """コピー先のパスを設定"""
         self.target_path = full_path
@@ -268,17 +423,18 @@ class FileInfo:
 
     def set_status(
         self,
-        status: Literal["pending", "copied", "skipped", "error"],
+        status: Union[FileStatus, str],
         error_message: Optional[str] = None,
     ) -> None:
         """
         処理状態を設定
 
         Args:
-            status: 処理状態
+            status: 処理状態（FileStatusまたはその値の文字列）
             error_message: エラーメッセージ（エラー時のみ）
         """
-        self.status = status
+        # 文字列で渡された場合も列挙子に正規化して保持する
+        self.status = FileStatus(status)
         if error_message:
             self.error_message = error_message
 
@@ -287,7 +443,33 @@ class FileInfo:
         self.associated_files.append(file_info)
 
     def __str__(self) -> str:
-        return f"FileInfo({self.original_filename}, {self.media_type}, {self.status})"
+        return f"FileInfo({self.original_filename}, {self.media_type}, {self.status.value})"
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+def hash_many(
+    files: List[FileInfo],
+    algorithm: str = "sha256",
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """
+    複数ファイルのハッシュ値をスレッドプールで並列計算
+
+    hashlibはダイジェスト更新中にGILを解放するため、
+    ディスクI/Oとハッシュ計算をファイル間でオーバーラップできる。
+
+    Args:
+        files: ファイル情報オブジェクトのリスト
+        algorithm: ハッシュアルゴリズム ("sha256", "md5", "sha1")
+        max_workers: ワーカースレッド数（Noneの場合はCPUコア数）
+
+    Returns:
+        filesと同じ順序のハッシュ値リスト
+    """
+    if not files:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(lambda f: f.calculate_hash(algorithm), files))
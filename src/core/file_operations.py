@@ -1,9 +1,14 @@
 import os
 import shutil
 import logging
-from typing import List, Dict, Optional, Literal, Callable
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterator, List, Dict, Optional, Literal, Callable
 
-from .file_info import FileInfo
+from .file_info import FileInfo, hash_many
+from .models import FileStatus
 from .metadata_extractor import MetadataExtractor
 from .path_generator import PathElement, PathGenerator
 from .file_filter import FileFilter, FilterStats
@@ -14,7 +19,68 @@ logger = logging.getLogger(__name__)
 
 class FileOperations:
     """ファイル操作を行うクラス"""
-    
+
+    @staticmethod
+    def _iter_files(source_dir: str, recursive: bool = True):
+        """
+        os.scandirベースでファイルエントリを列挙するジェネレータ
+
+        DirEntryはd_typeとstat情報をキャッシュしているため、os.walkや
+        os.listdir + os.path.isfileの組み合わせよりsyscall数が少ない。
+        サブディレクトリは明示的なスタックで辿る（再帰呼び出しを回避）。
+
+        備考: Linuxのio_uringでstatxをバッチ発行する案も検討したが、
+        標準ライブラリにインターフェースがなく、ネイティブ拡張
+        （liburingバインディング）を導入するほどの効果が見込めないため
+        同期scandir + DirEntry.stat()のまま（ファイルあたりstat 1回）とする。
+
+        Args:
+            source_dir: スキャン対象のディレクトリ
+            recursive: サブディレクトリも再帰的にスキャンするかどうか
+
+        Yields:
+            ファイルを指すos.DirEntryオブジェクト
+        """
+        stack = [source_dir]
+
+        while stack:
+            current_dir = stack.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except (FileNotFoundError, NotADirectoryError):
+                logger.error(f"Source directory not found: {current_dir}")
+            except OSError as e:
+                logger.error(f"Error scanning directory {current_dir}: {str(e)}")
+
+    @staticmethod
+    def _scan_stream(
+        source_dir: str,
+        recursive: bool = True,
+        source_device: Optional[str] = None
+    ) -> Iterator[FileInfo]:
+        """
+        FileInfoを1件ずつ生成するストリーミングスキャナ
+
+        リストに蓄積せず逐次yieldするため、後段でフィルタリングと
+        組み合わせるとピークメモリは「通過ファイル数」分に抑えられる。
+        itertools.isliceと組み合わせればプレビュー用の部分スキャンも可能。
+
+        Args:
+            source_dir: スキャン対象のディレクトリ
+            recursive: サブディレクトリも再帰的にスキャンするかどうか
+            source_device: ソースデバイスタイプ (iOS, Android, Camera等)
+
+        Yields:
+            ファイル情報オブジェクト
+        """
+        for entry in FileOperations._iter_files(source_dir, recursive):
+            yield FileInfo.from_dir_entry(entry, source_device)
+
     @staticmethod
     def scan_directory(
         source_dir: str,
@@ -36,47 +102,26 @@ class FileOperations:
         """
         file_info_list = []
         filter_stats = FilterStats() if file_filter else None
-        
-        if not os.path.exists(source_dir):
-            logger.error(f"Source directory not found: {source_dir}")
-            return file_info_list
-        
+
+        # 存在チェックはしない（scandir側のtry/exceptに任せる）。
+        # 事前のstatはリムーバブルメディアのスピンアップ待ちで
+        # ブロックし得るうえ、直後のscandirと二重になる
         try:
-            if recursive:
-                for root, dirs, files in os.walk(source_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        file_info = FileInfo(file_path, source_device)
-                        
-                        # フィルタリング
-                        if file_filter:
-                            if file_filter.should_include_file(file_info):
-                                file_info_list.append(file_info)
-                                if filter_stats:
-                                    filter_stats.add_file(True)
-                            else:
-                                if filter_stats:
-                                    filter_stats.add_file(False, "filter")
-                        else:
-                            file_info_list.append(file_info)
-            else:
-                for file in os.listdir(source_dir):
-                    file_path = os.path.join(source_dir, file)
-                    if os.path.isfile(file_path):
-                        file_info = FileInfo(file_path, source_device)
-                        
-                        # フィルタリング
-                        if file_filter:
-                            if file_filter.should_include_file(file_info):
-                                file_info_list.append(file_info)
-                                if filter_stats:
-                                    filter_stats.add_file(True)
-                            else:
-                                if filter_stats:
-                                    filter_stats.add_file(False, "filter")
-                        else:
-                            file_info_list.append(file_info)
-        
+            for entry in FileOperations._iter_files(source_dir, recursive):
+                file_info = FileInfo.from_dir_entry(entry, source_device)
+
+                # フィルタリング
+                if file_filter:
+                    if file_filter.should_include_file(file_info):
+                        file_info_list.append(file_info)
+                        if filter_stats:
+                            filter_stats.add_file(True)
+                    else:
+                        if filter_stats:
+                            filter_stats.add_file(False, "filter")
+                else:
+                    file_info_list.append(file_info)
+
         except Exception as e:
             logger.error(f"Error scanning directory {source_dir}: {str(e)}")
         
@@ -86,13 +131,13 @@ class FileOperations:
             logger.info(f"Filter results: {stats['included_files']}/{stats['total_files']} files included "
                        f"({stats['inclusion_rate']:.1%})")
             if stats['excluded_files'] > 0:
+                # exclusion_breakdownは件数降順・正のカウントのみ
                 breakdown = stats['exclusion_breakdown']
-                excluded_details = []
-                for reason, count in breakdown.items():
-                    if count > 0:
-                        excluded_details.append(f"{reason}: {count}")
-                if excluded_details:
-                    logger.info(f"Excluded files breakdown: {', '.join(excluded_details)}")
+                if breakdown:
+                    logger.info(
+                        "Excluded files breakdown: %s",
+                        ", ".join(f"{reason}: {count}" for reason, count in breakdown.items())
+                    )
         
         return file_info_list
     
@@ -117,48 +162,32 @@ class FileOperations:
         Returns:
             ファイル情報のリスト
         """
-        if not os.path.exists(source_dir):
-            logger.error(f"Source directory not found: {source_dir}")
-            return []
-        
-        # すべてのファイルをスキャン
-        all_files = []
+        # スキャンとフィルタリングをパイプライン化する。FileInfoは
+        # 生成された直後にフィルター判定され、除外されたものはすぐに
+        # 破棄されるため、ピークメモリは全ファイル数ではなく
+        # 通過ファイル数に比例する。
+        # メタデータを必要とするフィルターはFileInfo.ensure_metadata経由で
+        # 遅延抽出するため、安価なフィルターで除外されたファイルは
+        # EXIF読み込み自体が発生しない
         try:
-            if recursive:
-                for root, dirs, files in os.walk(source_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        file_info = FileInfo(file_path, source_device)
-                        all_files.append(file_info)
+            stream = FileOperations._scan_stream(source_dir, recursive, source_device)
+            if filter_chain:
+                filtered_files = [
+                    file_info
+                    for file_info in stream
+                    if filter_chain.should_include_file(file_info)[0]
+                ]
             else:
-                for file in os.listdir(source_dir):
-                    file_path = os.path.join(source_dir, file)
-                    if os.path.isfile(file_path):
-                        file_info = FileInfo(file_path, source_device)
-                        all_files.append(file_info)
+                filtered_files = list(stream)
         except Exception as e:
             logger.error(f"Error scanning directory {source_dir}: {str(e)}")
             return []
-        
-        # メタデータ抽出（フィルタリングで必要になる場合があるため）
+
+        # 通過したファイルのメタデータを並列抽出（抽出済みのものはスキップ）
         if extract_metadata:
-            for file_info in all_files:
-                try:
-                    MetadataExtractor.extract_metadata(file_info)
-                except Exception as e:
-                    logger.error(f"Failed to extract metadata for {file_info.original_filename}: {str(e)}")
-        
-        # フィルターチェーンでフィルタリング
-        if filter_chain:
-            filtered_files = []
-            for file_info in all_files:
-                include, reason, metadata = filter_chain.should_include_file(file_info)
-                if include:
-                    filtered_files.append(file_info)
-            
-            return filtered_files
-        else:
-            return all_files
+            MetadataExtractor.extract_metadata_batch(filtered_files)
+
+        return filtered_files
     
     @staticmethod
     def scan_directory_with_detailed_filtering(
@@ -181,51 +210,27 @@ class FileOperations:
         """
         file_info_list = []
         filter_stats = FilterStats()
-        
-        if not os.path.exists(source_dir):
-            logger.error(f"Source directory not found: {source_dir}")
-            return file_info_list, filter_stats
-        
+
+        # 設定に特化した判定クロージャを1回だけ生成
+        # （ファイルごとの6回のメソッドディスパッチを1呼び出しに削減）
+        compiled_check = file_filter.compile() if file_filter else None
+
         try:
-            for root, dirs, files in os.walk(source_dir) if recursive else [(source_dir, [], os.listdir(source_dir))]:
-                for file in files:
-                    if not recursive and not os.path.isfile(os.path.join(source_dir, file)):
-                        continue
-                    
-                    file_path = os.path.join(root, file)
-                    file_info = FileInfo(file_path, source_device)
-                    
-                    # 個別フィルタチェック（詳細統計用）
-                    if file_filter and file_filter.enabled:
-                        exclusion_reason = None
-                        
-                        # メディアタイプチェック
-                        if not file_filter._check_media_type_filter(file_info):
-                            exclusion_reason = "media_type"
-                        # 拡張子チェック
-                        elif not file_filter._check_extension_filter(file_info):
-                            exclusion_reason = "extension"
-                        # ファイルサイズチェック
-                        elif not file_filter._check_size_filter(file_info):
-                            exclusion_reason = "size"
-                        # ファイル名パターンチェック
-                        elif not file_filter._check_filename_filter(file_info):
-                            exclusion_reason = "filename"
-                        # パスパターンチェック
-                        elif not file_filter._check_path_filter(file_info):
-                            exclusion_reason = "path"
-                        # スクリーンショットチェック
-                        elif file_filter.exclude_screenshots and file_filter._is_screenshot_by_filter(file_info):
-                            exclusion_reason = "screenshot"
-                        
-                        if exclusion_reason:
-                            filter_stats.add_file(False, exclusion_reason)
-                        else:
-                            file_info_list.append(file_info)
-                            filter_stats.add_file(True)
+            for entry in FileOperations._iter_files(source_dir, recursive):
+                file_info = FileInfo.from_dir_entry(entry, source_device)
+
+                # 個別フィルタチェック（詳細統計用）
+                if file_filter and file_filter.enabled:
+                    exclusion_reason = compiled_check(file_info)
+
+                    if exclusion_reason:
+                        filter_stats.add_file(False, exclusion_reason)
                     else:
                         file_info_list.append(file_info)
                         filter_stats.add_file(True)
+                else:
+                    file_info_list.append(file_info)
+                    filter_stats.add_file(True)
         
         except Exception as e:
             logger.error(f"Error scanning directory {source_dir}: {str(e)}")
@@ -274,29 +279,28 @@ class FileOperations:
         """
         # ファイル間の関連付けを管理する辞書
         associations = {}
-        
-        # ファイル情報をパスをキーにした辞書に変換
-        file_info_dict = {info.original_path: info for info in file_info_list}
-        
+
+        # 関連ファイル拡張子は小文字化してセット化（ループ外で1回だけ）
+        ext_set = frozenset(
+            ext.lower().lstrip(".") for ext in associated_file_extensions
+        )
+
         # ベース名（拡張子なし）ごとにグループ化
-        base_name_groups = {}
+        base_name_groups = defaultdict(list)
         for file_info in file_info_list:
             base_name = os.path.splitext(file_info.original_filename)[0]
             base_dir = os.path.dirname(file_info.original_path)
-            key = (base_dir, base_name)
-            
-            if key not in base_name_groups:
-                base_name_groups[key] = []
-            base_name_groups[key].append(file_info)
-        
+            base_name_groups[(base_dir, base_name)].append(file_info)
+
         # 関連ファイルの特定
         for (base_dir, base_name), group in base_name_groups.items():
             # メインファイルとサブファイルを識別
             main_files = []
             sub_files = []
-            
+
             for file_info in group:
-                if file_info.original_extension.lower() in [ext.lower() for ext in associated_file_extensions]:
+                # original_extensionは小文字化済みなのでO(1)のセット参照で判定できる
+                if file_info.original_extension in ext_set:
                     sub_files.append(file_info)
                 else:
                     main_files.append(file_info)
@@ -365,25 +369,60 @@ class FileOperations:
         Returns:
             同じハッシュ値を持つファイルのリストを値とする辞書
         """
+        # ターゲットパスが設定されているファイルのみ対象
+        candidates = [f for f in file_info_list if f.target_path]
+
+        # サイズが異なるファイルは重複になり得ないため、まずサイズで
+        # グループ化し、2件以上のグループのみハッシュを計算する
+        # （典型的なスキャンではハッシュ対象が大幅に減る）
+        size_groups: Dict[int, List[FileInfo]] = {}
+        for file_info in candidates:
+            size_groups.setdefault(file_info.size, []).append(file_info)
+
+        # 同サイズのグループ内でも、先頭64KiBのクイックハッシュが異なる
+        # ファイルは重複になり得ない。フルハッシュの前に安価な前段
+        # フィルタとして絞り込む（64KiB以下のファイルはクイックハッシュが
+        # フルハッシュを兼ねるため、2回目の読み込みは発生しない）
+        quick_groups: Dict[tuple, List[FileInfo]] = {}
+        for group in size_groups.values():
+            if len(group) <= 1:
+                continue
+            for file_info in group:
+                try:
+                    quick = file_info.calculate_quick_hash(hash_algorithm)
+                except Exception as e:
+                    logger.error(f"Failed to calculate quick hash: {str(e)}")
+                    continue
+                quick_groups.setdefault((file_info.size, quick), []).append(file_info)
+
+        hash_targets = [
+            file_info
+            for group in quick_groups.values()
+            if len(group) > 1
+            for file_info in group
+        ]
+
+        # ハッシュを並列計算（結果はFileInfo側にキャッシュされる）
+        try:
+            hash_many(hash_targets, hash_algorithm)
+        except Exception:
+            # 個別ファイルのエラーは下のループで捕捉・記録する
+            pass
+
         # ハッシュ値をキーにしたファイル情報のリストの辞書
         hash_groups = {}
-        
-        for file_info in file_info_list:
+
+        for file_info in hash_targets:
             try:
-                # ターゲットパスが設定されていない場合はスキップ
-                if not file_info.target_path:
-                    continue
-                
-                # ハッシュ値を計算
                 file_hash = file_info.calculate_hash(hash_algorithm)
-                
+
                 if file_hash not in hash_groups:
                     hash_groups[file_hash] = []
-                
+
                 hash_groups[file_hash].append(file_info)
             except Exception as e:
                 logger.error(f"Failed to calculate hash: {str(e)}")
-        
+
         # 重複しているグループのみを返す
         return {h: files for h, files in hash_groups.items() if len(files) > 1}
     
@@ -399,31 +438,22 @@ class FileOperations:
             file_info_list: ファイル情報のリスト
             duplicate_handling: 重複時の処理方法
         """
-        # パスをキーにしたファイル情報のリストの辞書
-        path_groups = {}
-        
-        # パスごとのグループを作成
-        for file_info in file_info_list:
-            if not file_info.target_path:
-                continue
-                
-            if file_info.target_path not in path_groups:
-                path_groups[file_info.target_path] = []
-            
-            path_groups[file_info.target_path].append(file_info)
-            
-            # 関連ファイルも処理
-            for assoc_file in file_info.associated_files:
-                if not assoc_file.target_path:
-                    continue
-                    
-                if assoc_file.target_path not in path_groups:
-                    path_groups[assoc_file.target_path] = []
-                
-                path_groups[assoc_file.target_path].append(assoc_file)
-        
-        # 衝突するパスについて処理
-        for target_path, info_list in path_groups.items():
+        # メインファイルと関連ファイルをまとめてソートし、同一パスの
+        # 連続区間をグループとして処理する。辞書への挿入・参照を
+        # ファイル数分繰り返すより、C実装の1回のソート + 線形走査の方が
+        # 速く、ソート後は隣接要素を順に舐めるだけでキャッシュにも優しい
+        candidates = [f for f in file_info_list if f.target_path]
+        candidates.extend(
+            assoc
+            for f in file_info_list
+            for assoc in f.associated_files
+            if assoc.target_path
+        )
+        candidates.sort(key=attrgetter("target_path"))
+
+        # 衝突するパス（2件以上の連続区間）について処理
+        for target_path, group in groupby(candidates, key=attrgetter("target_path")):
+            info_list = list(group)
             if len(info_list) <= 1:
                 continue
             
@@ -452,72 +482,149 @@ class FileOperations:
             
             # "ask"の場合はUIが処理するので、ここでは何もしない
     
+    @staticmethod
+    def _fast_copy(src: str, dst: str) -> None:
+        """
+        カーネル内コピーパスを使ってファイルをコピー
+
+        Linuxではos.copy_file_rangeを使用する。同一ファイルシステム上の
+        CoW対応FS（Btrfs/XFS等）ではreflinkとなりデータ移動がほぼ発生せず、
+        それ以外でもユーザー空間バッファを経由しないためメモリ帯域を節約できる。
+        未対応の環境やエラー時はshutil.copy2にフォールバックする。
+
+        Args:
+            src: コピー元パス
+            dst: コピー先パス
+        """
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(
+                            fsrc.fileno(), fdst.fileno(), remaining
+                        )
+                        if copied == 0:
+                            break
+                        remaining -= copied
+
+                # タイムスタンプ等のメタデータを複製（copy2相当）
+                shutil.copystat(src, dst)
+                return
+            except OSError:
+                # ファイルシステム間コピー（EXDEV）や特殊ファイルなどは
+                # 通常のコピーで処理する
+                pass
+
+        shutil.copy2(src, dst)
+
     @staticmethod
     def copy_files(
         file_info_list: List[FileInfo],
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_workers: Optional[int] = None
     ) -> int:
         """
         ファイルをコピー
-        
+
+        コピータスクはスレッドプールで並列実行される。_fast_copyは
+        カーネル内コピーでI/O待ちが支配的なため、スレッド並列で
+        読み書きストリームをオーバーラップできる。
+
         Args:
             file_info_list: ファイル情報のリスト
             progress_callback: 進捗を通知するコールバック関数
-            
+            max_workers: ワーカースレッド数（HDDなどシーク負荷を避けたい
+                場合は1を指定すると従来どおり逐次コピーになる）
+
         Returns:
             コピーに成功したファイルの数
         """
-        # コピー対象ファイルの情報
-        total_files = sum(
-            1 for f in file_info_list
-            if f.status == "pending" and f.target_path is not None
-        )
+        # コピー対象（ペンディング状態でパスが設定されているメインファイル）
+        pending_files = [
+            f for f in file_info_list
+            if f.status is FileStatus.PENDING and f.target_path
+        ]
+        total_files = len(pending_files)
         processed_files = 0
         success_count = 0
-        
-        # ファイルをコピー
-        for file_info in file_info_list:
-            # ペンディング状態でパスが設定されている場合のみ処理
-            if file_info.status != "pending" or not file_info.target_path:
-                continue
-            
+
+        # コピー先ディレクトリを先にまとめて作成
+        # （ファイルごとのos.makedirs呼び出しはディレクトリ数分に削減され、
+        # ワーカースレッドがmakedirsで競合することもなくなる）
+        created_dirs = set()
+        pending_targets = [f.target_path for f in pending_files]
+        pending_targets.extend(
+            assoc.target_path
+            for f in pending_files
+            for assoc in f.associated_files
+            if assoc.status is FileStatus.PENDING and assoc.target_path
+        )
+        for target_path in pending_targets:
+            target_dir = os.path.dirname(target_path)
+            if target_dir not in created_dirs:
+                os.makedirs(target_dir, exist_ok=True)
+                created_dirs.add(target_dir)
+
+        def _copy_task(file_info: FileInfo) -> int:
+            """1つのメインファイルと関連ファイルをコピーし、成功数を返す"""
+            copied = 0
+
             try:
-                # コピー先ディレクトリを作成
+                # コピー先ディレクトリを作成（事前作成から漏れた場合のみ）
                 target_dir = os.path.dirname(file_info.target_path)
-                os.makedirs(target_dir, exist_ok=True)
-                
+                if target_dir not in created_dirs:
+                    os.makedirs(target_dir, exist_ok=True)
+                    created_dirs.add(target_dir)
+
                 # ファイルをコピー
-                shutil.copy2(file_info.original_path, file_info.target_path)
+                FileOperations._fast_copy(file_info.original_path, file_info.target_path)
                 file_info.set_status("copied")
-                success_count += 1
-                
+                copied += 1
+
                 # 関連ファイルもコピー
                 for assoc_file in file_info.associated_files:
-                    if assoc_file.status != "pending" or not assoc_file.target_path:
+                    if assoc_file.status is not FileStatus.PENDING or not assoc_file.target_path:
                         continue
-                    
+
                     try:
-                        # 関連ファイルのコピー先ディレクトリを作成
+                        # 関連ファイルのコピー先ディレクトリを作成（事前作成から漏れた場合のみ）
                         assoc_target_dir = os.path.dirname(assoc_file.target_path)
-                        os.makedirs(assoc_target_dir, exist_ok=True)
-                        
+                        if assoc_target_dir not in created_dirs:
+                            os.makedirs(assoc_target_dir, exist_ok=True)
+                            created_dirs.add(assoc_target_dir)
+
                         # 関連ファイルをコピー
-                        shutil.copy2(assoc_file.original_path, assoc_file.target_path)
+                        FileOperations._fast_copy(assoc_file.original_path, assoc_file.target_path)
                         assoc_file.set_status("copied")
-                        success_count += 1
+                        copied += 1
                     except Exception as e:
                         logger.error(f"Failed to copy associated file: {str(e)}")
                         assoc_file.set_status("error", str(e))
-            
+
             except Exception as e:
                 logger.error(f"Failed to copy file: {str(e)}")
                 file_info.set_status("error", str(e))
-            
-            # 進捗を通知
-            processed_files += 1
-            if progress_callback:
-                progress_callback(
-                    processed_files, total_files, file_info.original_filename
-                )
-        
-        return success_count 
\ No newline at end of file
+
+            return copied
+
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 4)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_copy_task, file_info): file_info
+                for file_info in pending_files
+            }
+            for future in as_completed(futures):
+                success_count += future.result()
+
+                # 進捗を通知
+                processed_files += 1
+                if progress_callback:
+                    progress_callback(
+                        processed_files, total_files,
+                        futures[future].original_filename
+                    )
+
+        return success_count
@@ -3,6 +3,8 @@
 """
 
 from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from time import perf_counter_ns
 from typing import Dict, Any, Optional, List, Tuple
 import logging
 
@@ -10,10 +12,23 @@ from .file_info import FileInfo
 
 logger = logging.getLogger(__name__)
 
+# メタデータ非収集時に共有する空辞書（呼び出し側は読み取り専用で扱うこと）
+_NO_METADATA: Dict[str, Any] = {}
+
 
 class FilterResult:
     """フィルタ判定結果を表すクラス"""
-    
+
+    # ファイルごと・フィルターごとに生成されるため、__dict__を持たずに
+    # インスタンスサイズと属性アクセスを削減する
+    __slots__ = ("include", "reason", "metadata")
+
+    # 付帯情報なしの包含判定用シングルトン（クラス定義後に設定）。
+    # 大多数のファイルは各フィルターを素通りするため、accept側の
+    # 結果オブジェクトを毎回生成する必要はない。共有されるので
+    # 呼び出し側はmetadataを読み取り専用で扱うこと
+    ACCEPT: "FilterResult"
+
     def __init__(self, include: bool, reason: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None):
         """
         Args:
@@ -26,9 +41,19 @@ class FilterResult:
         self.metadata = metadata or {}
 
 
+FilterResult.ACCEPT = FilterResult(True)
+
+
 class BaseFilter(ABC):
     """ファイルフィルターの基底クラス"""
-    
+
+    # 1ファイルあたりの判定コストの目安（拡張子チェック=1、EXIF依存=100程度）
+    estimated_cost: float = 10.0
+    # 通過すると予想されるファイルの割合（小さいほど選択的）
+    selectivity_hint: float = 0.5
+    # 判定に必要なメタデータフィールド（空なら抽出不要）
+    required_metadata: frozenset = frozenset()
+
     def __init__(self, config: Dict[str, Any], filter_id: str):
         """
         Args:
@@ -53,6 +78,22 @@ class BaseFilter(ABC):
         """
         pass
     
+    def check_files(self, file_infos: List[FileInfo]) -> List[bool]:
+        """
+        ファイルリストを一括判定（デフォルトはcheck_fileの逐次適用）
+
+        列単位で安価に判定できるフィルターはオーバーライドすることで、
+        ファイルごとのFilterResult生成とメソッドディスパッチを省略できる。
+
+        Args:
+            file_infos: ファイル情報オブジェクトのリスト
+
+        Returns:
+            file_infosと同じ順序の包含判定リスト
+        """
+        check_file = self.check_file
+        return [check_file(file_info).include for file_info in file_infos]
+
     @abstractmethod
     def get_filter_name(self) -> str:
         """フィルター名を取得"""
@@ -74,43 +115,252 @@ class BaseFilter(ABC):
 
 class FilterChain:
     """複数のフィルターを順次実行するチェインクラス"""
-    
-    def __init__(self):
+
+    # 負キャッシュの最大エントリ数
+    _NEGATIVE_CACHE_MAX = 10_000
+    # 適応並べ替えを行う評価ファイル数の間隔
+    _REORDER_INTERVAL = 1024
+
+    def __init__(self, adaptive: bool = True):
+        """
+        Args:
+            adaptive: Trueの場合、実行時に観測した選択性と判定コストに
+                基づいてフィルター順序を定期的に並べ替える。Falseの場合は
+                priority（と静的コストヒント）による順序を常に維持する
+        """
         self.filters: List[BaseFilter] = []
         self.stats = FilterStats()
+        self.adaptive = adaptive
+        # フィルターごとの観測値: filter_id -> [評価回数, 除外回数, 合計ns]
+        # estimated_cost/selectivity_hintは静的な目安でしかないため、
+        # 実データでの除外率・所要時間を計測して並べ替えに使う
+        self._observed: Dict[str, List[int]] = {}
+        self._evaluations_since_reorder = 0
+        # 構築時の静的解析で恒偽（どのファイルも通過し得ない）と
+        # 判定された場合のフラグと理由（validateが設定する）
+        self._always_false = False
+        self._false_reason: Optional[str] = None
+        self._false_filter_id: Optional[str] = None
+        # 除外済みファイルの負キャッシュ: (パス, mtime_ns) -> (理由, フィルタID)
+        # 監視モードや再スキャンで同じファイルを再評価するコストを省く
+        self._negative_cache: "OrderedDict[Tuple[str, int], Tuple[Optional[str], str]]" = (
+            OrderedDict()
+        )
     
     def add_filter(self, filter_instance: BaseFilter) -> None:
         """フィルターをチェインに追加"""
         if filter_instance.enabled:
             self.filters.append(filter_instance)
-            # 優先度順にソート
-            self.filters.sort(key=lambda f: f.priority)
+            # フィルタ構成が変わったため過去の除外判定は無効
+            self._negative_cache.clear()
+            # 優先度順にソート。同一優先度内では「コスト/選択性」の小さい
+            # （安くて選択的な）フィルターを先に実行し、高価なフィルターの
+            # 実行回数を短絡評価で減らす
+            self.filters.sort(
+                key=lambda f: (
+                    f.priority,
+                    f.estimated_cost / max(f.selectivity_hint, 0.01),
+                )
+            )
+            # 構成が変わるたびに恒偽チェックを再実行
+            self.validate()
+
+    def validate(self) -> None:
+        """フィルター構成を静的に解析し、恒偽の組み合わせを検出
+
+        includeTypesが互いに素なMediaTypeFilterの組のように、どの
+        ファイルも通過し得ない構成を構築時に検出した場合、以降の
+        should_include_fileはフィルターを1つも実行せず除外を返す。
+        個別フィルターの設定異常（日付範囲の逆転など）はvalidate_config
+        経由で警告ログに出すだけに留める（日付不明ファイルは通過する
+        ため、チェーン全体を恒偽には畳み込めない）。
+        """
+        self._always_false = False
+        self._false_reason = None
+        self._false_filter_id = None
+
+        # 包含メディアタイプ指定を持つフィルター同士の積集合をチェック
+        # （filtersパッケージとの循環importを避けるため、isinstanceでは
+        # なくinclude_types属性の有無で判別する）
+        typed = [f for f in self.filters if getattr(f, "include_types", None)]
+        for i, first in enumerate(typed):
+            for second in typed[i + 1:]:
+                if not (first.include_types & second.include_types):
+                    self._always_false = True
+                    self._false_reason = (
+                        "Contradictory media type filters: "
+                        f"{sorted(first.include_types)} and "
+                        f"{sorted(second.include_types)} have no common type"
+                    )
+                    self._false_filter_id = second.filter_id
+                    logger.warning(self._false_reason)
+                    return
+
+        # 個別フィルターの設定妥当性をチェックし、問題は警告として報告
+        for filter_instance in self.filters:
+            valid, errors = filter_instance.validate_config()
+            if not valid:
+                for error in errors:
+                    logger.warning(
+                        f"Filter {filter_instance.filter_id}: {error}"
+                    )
     
-    def should_include_file(self, file_info: FileInfo) -> Tuple[bool, Optional[str], Dict[str, Any]]:
+    def should_include_file(
+        self, file_info: FileInfo, collect_metadata: bool = False
+    ) -> Tuple[bool, Optional[str], Dict[str, Any]]:
         """
         ファイルがフィルタチェーンを通過するかどうかを判定
-        
+
         Args:
             file_info: ファイル情報オブジェクト
-            
+            collect_metadata: Trueの場合、フィルターごとの判定メタデータを
+                蓄積して返す。通常の包含/除外判定だけが必要な呼び出し元では
+                Falseのまま、ファイルごとの辞書構築・挿入を省く
+
         Returns:
             (含める場合True, 除外理由, フィルタメタデータ)
         """
-        filter_metadata = {}
-        
+        # 恒偽構成ならフィルターを実行せず即座に除外
+        if self._always_false:
+            self.stats.add_file(False, self._false_filter_id)
+            return False, self._false_reason, _NO_METADATA
+
+        # 負キャッシュチェック（同一パス・mtimeで除外済みなら再評価しない）
+        cache_key = (file_info.original_path, file_info.get_stat().st_mtime_ns)
+        cached = self._negative_cache.get(cache_key)
+        if cached is not None:
+            self._negative_cache.move_to_end(cache_key)
+            reason, filter_id = cached
+            self.stats.add_file(False, filter_id)
+            return False, reason, _NO_METADATA
+
+        filter_metadata = {} if collect_metadata else _NO_METADATA
+        adaptive = self.adaptive
+
         for filter_instance in self.filters:
-            result = filter_instance.check_file(file_info)
-            
-            # フィルタメタデータを蓄積
-            filter_metadata[filter_instance.filter_id] = result.metadata
-            
+            # メタデータが必要なフィルターの直前で遅延抽出する
+            # （安価なフィルターで除外済みのファイルはEXIF読み込み自体が走らない）
+            if filter_instance.required_metadata:
+                file_info.ensure_metadata()
+
+            if adaptive:
+                start_ns = perf_counter_ns()
+                result = filter_instance.check_file(file_info)
+                elapsed_ns = perf_counter_ns() - start_ns
+                observed = self._observed.get(filter_instance.filter_id)
+                if observed is None:
+                    observed = [0, 0, 0]
+                    self._observed[filter_instance.filter_id] = observed
+                observed[0] += 1
+                observed[2] += elapsed_ns
+                if not result.include:
+                    observed[1] += 1
+            else:
+                result = filter_instance.check_file(file_info)
+
+            # フィルタメタデータを蓄積（要求された場合のみ）
+            if collect_metadata:
+                filter_metadata[filter_instance.filter_id] = result.metadata
+
             if not result.include:
                 self.stats.add_file(False, filter_instance.filter_id)
+                if adaptive:
+                    self._note_evaluation()
+
+                # 除外結果を負キャッシュに登録（LRUで上限管理）
+                self._negative_cache[cache_key] = (
+                    result.reason,
+                    filter_instance.filter_id,
+                )
+                while len(self._negative_cache) > self._NEGATIVE_CACHE_MAX:
+                    self._negative_cache.popitem(last=False)
+
                 return False, result.reason, filter_metadata
-        
+
         self.stats.add_file(True)
+        if adaptive:
+            self._note_evaluation()
         return True, None, filter_metadata
+
+    def _note_evaluation(self) -> None:
+        """評価ファイル数を数え、一定間隔で適応並べ替えを実行"""
+        self._evaluations_since_reorder += 1
+        if self._evaluations_since_reorder >= self._REORDER_INTERVAL:
+            self._reorder_filters()
+
+    def _reorder_filters(self) -> None:
+        """観測値に基づいてフィルター順序を並べ替え
+
+        除外率が高く（選択的）、かつ1回あたりの判定が速いフィルターほど
+        前に配置する（スコア = 除外率 / 平均判定時間）。安くて選択的な
+        フィルターが先に短絡することで、高価なフィルターの実行回数が減る。
+        加算スムージングにより観測の少ないフィルターの極端なスコアを避け、
+        同点時はsortの安定性でpriority順が保たれる。
+        """
+        self._evaluations_since_reorder = 0
+        observed = self._observed
+
+        def score(filter_instance: BaseFilter) -> float:
+            evaluated, rejected, total_ns = observed.get(
+                filter_instance.filter_id, (0, 0, 0)
+            )
+            avg_ns = total_ns / evaluated if evaluated else 0.0
+            return (rejected + 1) / (evaluated + 1) / (avg_ns + 1)
+
+        self.filters.sort(key=score, reverse=True)
     
+    def should_include_files(self, file_infos: List[FileInfo]) -> List[bool]:
+        """
+        ファイルリストを一括でフィルタ判定
+
+        フィルターごとに生存ファイルのリスト全体を処理し、除外された
+        ファイルは次のフィルターに渡さない（フィルター単位のバッチ
+        評価）。1ファイルずつshould_include_fileを呼ぶよりPythonの
+        ディスパッチ回数が少なく、高価な後段フィルターは前段を通過した
+        ファイルにしか触れない。理由・メタデータが不要な走査パス向けの
+        軽量APIで、負キャッシュと適応並べ替えの観測は行わない。
+
+        Args:
+            file_infos: ファイル情報オブジェクトのリスト
+
+        Returns:
+            file_infosと同じ順序の包含判定リスト
+        """
+        if self._always_false:
+            for _ in file_infos:
+                self.stats.add_file(False, self._false_filter_id)
+            return [False] * len(file_infos)
+
+        # 生存インデックスを圧縮しながらフィルターを順に適用
+        mask = [True] * len(file_infos)
+        survivors = list(range(len(file_infos)))
+        for filter_instance in self.filters:
+            if not survivors:
+                break
+
+            # メタデータが必要なフィルターの直前で、生存ファイルのみ遅延抽出
+            if filter_instance.required_metadata:
+                for index in survivors:
+                    file_infos[index].ensure_metadata()
+
+            includes = filter_instance.check_files(
+                [file_infos[index] for index in survivors]
+            )
+
+            next_survivors = []
+            append = next_survivors.append
+            for index, include in zip(survivors, includes):
+                if include:
+                    append(index)
+                else:
+                    mask[index] = False
+                    self.stats.add_file(False, filter_instance.filter_id)
+            survivors = next_survivors
+
+        for _ in survivors:
+            self.stats.add_file(True)
+        return mask
+
     def get_filter_summary(self) -> Dict[str, Any]:
         """フィルタチェーンのサマリーを取得"""
         return {
@@ -134,7 +384,7 @@ class FilterStats:
         self.total_files = 0
         self.included_files = 0
         self.excluded_files = 0
-        self.exclusion_by_filter = {}  # filter_id -> count
+        self.exclusion_by_filter: Counter = Counter()  # filter_id -> count
     
     def add_file(self, included: bool, filter_id: Optional[str] = None):
         """ファイル処理結果を統計に追加"""
@@ -145,7 +395,7 @@ class FilterStats:
         else:
             self.excluded_files += 1
             if filter_id:
-                self.exclusion_by_filter[filter_id] = self.exclusion_by_filter.get(filter_id, 0) + 1
+                self.exclusion_by_filter[filter_id] += 1
     
     def get_summary(self) -> Dict[str, Any]:
         """統計サマリーを取得"""
@@ -153,23 +403,30 @@ class FilterStats:
             "total_files": self.total_files,
             "included_files": self.included_files,
             "excluded_files": self.excluded_files,
-            "exclusion_by_filter": self.exclusion_by_filter,
+            # 件数の多いフィルタから順に並ぶ（most_common）
+            "exclusion_by_filter": dict(self.exclusion_by_filter.most_common()),
             "inclusion_rate": self.included_files / self.total_files if self.total_files > 0 else 0
         }
 
 
 class FilterRegistry:
     """フィルタープラグインの登録と管理を行うクラス"""
-    
+
+    # 登録辞書と一覧キャッシュだけを持つ軽量オブジェクト
+    __slots__ = ("_filter_classes", "_available_cache")
+
     def __init__(self):
-        self._filter_classes = {}
-    
+        self._filter_classes: Dict[str, type] = {}
+        # get_available_filters用のキャッシュ（登録変更で無効化）
+        self._available_cache: Optional[Tuple[str, ...]] = None
+
     def register_filter(self, filter_id: str, filter_class: type) -> None:
         """フィルタークラスを登録"""
         if not issubclass(filter_class, BaseFilter):
             raise ValueError(f"Filter class must inherit from BaseFilter: {filter_class}")
-        
+
         self._filter_classes[filter_id] = filter_class
+        self._available_cache = None
         logger.info(f"Registered filter: {filter_id}")
     
     def create_filter(self, filter_id: str, config: Dict[str, Any]) -> BaseFilter:
@@ -180,13 +437,22 @@ class FilterRegistry:
         filter_class = self._filter_classes[filter_id]
         return filter_class(config, filter_id)
     
-    def get_available_filters(self) -> List[str]:
-        """利用可能なフィルターIDのリストを取得"""
-        return list(self._filter_classes.keys())
+    def get_available_filters(self) -> Tuple[str, ...]:
+        """利用可能なフィルターIDのタプルを取得
+
+        結果は次の登録までキャッシュされ、GUI等で繰り返し参照しても
+        毎回リストを作り直さない。不変なタプルのため呼び出し側が
+        誤って書き換える心配もない。
+        """
+        if self._available_cache is None:
+            self._available_cache = tuple(self._filter_classes)
+        return self._available_cache
     
-    def create_filter_chain(self, filters_config: Dict[str, Dict[str, Any]]) -> FilterChain:
+    def create_filter_chain(
+        self, filters_config: Dict[str, Dict[str, Any]], adaptive: bool = True
+    ) -> FilterChain:
         """設定からフィルターチェーンを作成"""
-        chain = FilterChain()
+        chain = FilterChain(adaptive=adaptive)
         
         for filter_id, filter_config in filters_config.items():
             try:
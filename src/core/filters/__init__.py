@@ -25,9 +25,15 @@ def register_default_filters():
     # filter_registry.register_filter("gps_location", GpsLocationFilter)
 
 
-def create_filter_chain_from_config(config: dict):
-    """設定からフィルターチェーンを作成"""
-    return filter_registry.create_filter_chain(config)
+def create_filter_chain_from_config(config: dict, adaptive: bool = True):
+    """設定からフィルターチェーンを作成
+
+    Args:
+        config: フィルターID -> フィルター設定の辞書
+        adaptive: Trueの場合、実行時の観測値でフィルター順序を適応的に
+            並べ替える。priority順を厳密に維持したい場合はFalseを指定
+    """
+    return filter_registry.create_filter_chain(config, adaptive=adaptive)
 
 
 # モジュールインポート時にデフォルトフィルターを登録
@@ -3,14 +3,98 @@
 """
 
 from datetime import datetime, date
-from typing import Dict, Any, Optional, Union
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Union
 from ..filter_base import BaseFilter, FilterResult
 from ..file_info import FileInfo
 
+# フォールバック用のstrptimeフォーマット表
+_DATE_FORMATS = (
+    "%Y-%m-%d",           # 2024-01-15
+    "%Y/%m/%d",           # 2024/01/15
+    "%Y-%m-%d %H:%M:%S",  # 2024-01-15 12:30:45
+    "%Y:%m:%d %H:%M:%S",  # 2024:01:15 12:30:45 (EXIF形式)
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_fast(date_str: str) -> Optional[datetime]:
+    """
+    日付文字列をdatetimeオブジェクトに変換（ファイルごとの高頻度呼び出し用）
+
+    支配的な形状（EXIFの"YYYY:MM:DD HH:MM:SS"とISOの"YYYY-MM-DD"系）は
+    文字位置から直接intを切り出してdatetimeを構築し、strptimeの
+    フォーマット表走査と例外機構を回避する。連写ではEXIF日時が秒単位で
+    重複するため、結果はlru_cacheで再利用する。
+
+    Args:
+        date_str: 日付文字列
+
+    Returns:
+        変換後のdatetime、どのフォーマットにも合致しない場合None
+    """
+    n = len(date_str)
+    if n >= 10 and date_str[4] in "-:/" and date_str[7] == date_str[4]:
+        try:
+            year = int(date_str[0:4])
+            month = int(date_str[5:7])
+            day = int(date_str[8:10])
+            if n == 10:
+                return datetime(year, month, day)
+            if (
+                n == 19
+                and date_str[10] == " "
+                and date_str[13] == ":"
+                and date_str[16] == ":"
+            ):
+                return datetime(
+                    year, month, day,
+                    int(date_str[11:13]),
+                    int(date_str[14:16]),
+                    int(date_str[17:19]),
+                )
+        except ValueError:
+            return None
+
+    # 形状チェックに合わない場合のみstrptime表を走査する
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_ordinal(date_str: str) -> Optional[int]:
+    """日付文字列を先発グレゴリオ暦の通算日（int）に変換
+
+    範囲判定は日単位なので、ホットパスではdatetimeオブジェクトの
+    比較ではなくintの大小比較だけで済むようにする。結果は文字列ごとに
+    キャッシュされ、連写で同一日時が続く場合は辞書参照1回になる。
+
+    Args:
+        date_str: 日付文字列
+
+    Returns:
+        通算日、どのフォーマットにも合致しない場合None
+    """
+    parsed = _parse_date_fast(date_str)
+    return parsed.toordinal() if parsed is not None else None
+
 
 class DateRangeFilter(BaseFilter):
-    """指定された日付範囲内のファイルのみを含めるフィルター"""
-    
+    """指定された日付範囲内のファイルのみを含めるフィルター
+
+    範囲判定は日単位（両端を含む）。startDate/endDateは構築時に
+    通算日のintへ変換され、ファイルごとの判定は整数比較2回になる。
+    """
+
+    # メタデータ参照と日付パースを伴う高コストフィルター
+    estimated_cost = 100.0
+    required_metadata = frozenset({"datetime", "dateTimeOriginal", "dateTimeDigitized"})
+
     def __init__(self, config: Dict[str, Any], filter_id: str):
         super().__init__(config, filter_id)
         
@@ -19,110 +103,129 @@ class DateRangeFilter(BaseFilter):
         self.use_metadata_date = config.get("useMetadataDate", True)
         self.use_file_modified_date = config.get("useFileModifiedDate", False)
         self.date_field = config.get("dateField", "datetime")  # メタデータから使用する日付フィールド
+
+        # 指定フィールド＋標準EXIFフィールドの探索順（重複除去済み）を
+        # 構築時に確定させ、ファイルごとの「試行済み」チェックを省く
+        self._date_keys = tuple(
+            dict.fromkeys(
+                (self.date_field, "datetime", "dateTimeOriginal", "dateTimeDigitized")
+            )
+        )
+
+        # 範囲の両端を通算日に畳み込む（日単位・両端含む）。ファイル
+        # ごとの範囲判定はこの2つのintとの比較だけで完結する
+        self._start_ord = self.start_date.toordinal() if self.start_date else None
+        self._end_ord = self.end_date.toordinal() if self.end_date else None
+
+        # 範囲の両端は固定なので、表示用・メタデータ用の文字列も
+        # 構築時に1回だけフォーマットしておく（strftimeは重いC呼び出し）
+        self._start_str = self.start_date.strftime("%Y-%m-%d") if self.start_date else None
+        self._end_str = self.end_date.strftime("%Y-%m-%d") if self.end_date else None
+        self._start_iso = self.start_date.isoformat() if self.start_date else None
+        self._end_iso = self.end_date.isoformat() if self.end_date else None
+
+        # 日付ソース表記も設定から一意に決まるため構築時に確定させる
+        if self.use_metadata_date:
+            self._date_source = f"metadata_{self.date_field}"
+        elif self.use_file_modified_date:
+            self._date_source = "file_modified"
+        else:
+            self._date_source = "unknown"
+
+        # 範囲が未設定なら全ファイルが自明に通過する。判定を丸ごと
+        # スキップし、メタデータの遅延抽出も要求しない
+        self._active = self.start_date is not None or self.end_date is not None
+        if not self._active:
+            self.required_metadata = frozenset()
     
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
         """日付文字列をdatetimeオブジェクトに変換"""
         if not date_str:
             return None
-        
-        # 複数の日付フォーマットに対応
-        formats = [
-            "%Y-%m-%d",           # 2024-01-15
-            "%Y/%m/%d",           # 2024/01/15
-            "%Y-%m-%d %H:%M:%S",  # 2024-01-15 12:30:45
-            "%Y:%m:%d %H:%M:%S",  # 2024:01:15 12:30:45 (EXIF形式)
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        
-        raise ValueError(f"Invalid date format: {date_str}")
+
+        parsed = _parse_date_fast(date_str)
+        if parsed is None:
+            raise ValueError(f"Invalid date format: {date_str}")
+        return parsed
     
     def check_file(self, file_info: FileInfo) -> FilterResult:
         """日付範囲によるフィルタリング判定"""
-        file_date = self._get_file_date(file_info)
-        
-        if file_date is None:
-            return FilterResult(
-                include=True,  # 日付不明ファイルは包含
-                metadata={"file_date": None, "date_source": "unknown"}
-            )
-        
-        # 日付範囲チェック
-        include = True
-        exclusion_reason = None
-        
-        if self.start_date and file_date < self.start_date:
-            include = False
-            exclusion_reason = f"File date {file_date.strftime('%Y-%m-%d')} is before start date {self.start_date.strftime('%Y-%m-%d')}"
-        
-        if self.end_date and file_date > self.end_date:
-            include = False
-            exclusion_reason = f"File date {file_date.strftime('%Y-%m-%d')} is after end date {self.end_date.strftime('%Y-%m-%d')}"
-        
+        # 範囲未設定時は日付抽出もパースも行わず共有結果を返す
+        if not self._active:
+            return FilterResult.ACCEPT
+
+        file_ord = self._get_file_ordinal(file_info)
+
+        if file_ord is None:
+            # 日付不明ファイルは包含
+            return FilterResult.ACCEPT
+
+        # 日付範囲チェック（整数比較2回。除外時のみ文字列を組み立てる）
+        start_ord = self._start_ord
+        end_ord = self._end_ord
+
+        if start_ord is not None and file_ord < start_ord:
+            file_date_str = date.fromordinal(file_ord).isoformat()
+            exclusion_reason = f"File date {file_date_str} is before start date {self._start_str}"
+        elif end_ord is not None and file_ord > end_ord:
+            file_date_str = date.fromordinal(file_ord).isoformat()
+            exclusion_reason = f"File date {file_date_str} is after end date {self._end_str}"
+        else:
+            # 範囲内: accept側は付帯情報を持たないため共有シングルトンを返す
+            return FilterResult.ACCEPT
+
         return FilterResult(
-            include=include,
+            include=False,
             reason=exclusion_reason,
             metadata={
-                "file_date": file_date.isoformat(),
-                "date_source": self._get_date_source(),
-                "start_date": self.start_date.isoformat() if self.start_date else None,
-                "end_date": self.end_date.isoformat() if self.end_date else None
+                "file_date": file_date_str,
+                "date_source": self._date_source,
+                "start_date": self._start_iso,
+                "end_date": self._end_iso
             }
         )
-    
-    def _get_file_date(self, file_info: FileInfo) -> Optional[datetime]:
-        """ファイルの日付を取得"""
-        
-        # メタデータの日付を優先使用
+
+    def _get_file_ordinal(self, file_info: FileInfo) -> Optional[int]:
+        """ファイルの日付を通算日として取得"""
+
+        # メタデータの日付を優先使用。指定フィールド → 標準EXIF
+        # フィールドの順にフラットに探索し、パース結果はキャッシュ済み
         if self.use_metadata_date and file_info.metadata:
-            metadata_date = self._extract_metadata_date(file_info)
-            if metadata_date:
-                return metadata_date
-        
+            metadata_get = file_info.metadata.get
+            for key in self._date_keys:
+                date_str = metadata_get(key)
+                if date_str:
+                    ordinal = _parse_date_ordinal(str(date_str))
+                    if ordinal is not None:
+                        return ordinal
+
         # ファイルの最終更新日を使用
         if self.use_file_modified_date:
-            return file_info.last_modified
-        
-        return None
-    
-    def _extract_metadata_date(self, file_info: FileInfo) -> Optional[datetime]:
-        """メタデータから日付を抽出"""
-        
-        # 指定されたフィールドから日付を取得
-        date_str = file_info.metadata.get(self.date_field)
-        if date_str:
-            try:
-                return self._parse_date(str(date_str))
-            except ValueError:
-                pass
-        
-        # フォールバック: 標準的なEXIF日付フィールドを試行
-        fallback_fields = ["datetime", "dateTimeOriginal", "dateTimeDigitized"]
-        for field in fallback_fields:
-            if field == self.date_field:
-                continue  # 既に試行済み
-            
-            date_str = file_info.metadata.get(field)
-            if date_str:
-                try:
-                    return self._parse_date(str(date_str))
-                except ValueError:
-                    continue
-        
+            return file_info.last_modified.toordinal()
+
         return None
     
+    def validate_config(self) -> Tuple[bool, List[str]]:
+        """設定の妥当性をチェック（日付範囲の逆転を検出）
+
+        endDate < startDateの場合、日付が判明しているファイルは
+        1件も通過できない。日付不明ファイルは包含される仕様のため
+        恒偽ではないが、ほぼ確実に設定ミスなので警告対象とする。
+        """
+        if (
+            self.start_date is not None
+            and self.end_date is not None
+            and self.end_date < self.start_date
+        ):
+            return False, [
+                f"endDate {self._end_str} is before startDate {self._start_str}: "
+                "no dated file can pass this filter"
+            ]
+        return True, []
+
     def _get_date_source(self) -> str:
-        """使用している日付ソースを取得"""
-        if self.use_metadata_date:
-            return f"metadata_{self.date_field}"
-        elif self.use_file_modified_date:
-            return "file_modified"
-        else:
-            return "unknown"
+        """使用している日付ソースを取得（構築時に確定済み）"""
+        return self._date_source
     
     def get_filter_name(self) -> str:
         return "Date Range Filter"
@@ -146,12 +249,12 @@ class DateRangeFilter(BaseFilter):
                 "startDate": {
                     "type": "string",
                     "format": "date",
-                    "description": "Start date (YYYY-MM-DD format)"
+                    "description": "Start date (YYYY-MM-DD format, inclusive)"
                 },
                 "endDate": {
                     "type": "string",
                     "format": "date", 
-                    "description": "End date (YYYY-MM-DD format)"
+                    "description": "End date (YYYY-MM-DD format, inclusive)"
                 },
                 "useMetadataDate": {
                     "type": "boolean",
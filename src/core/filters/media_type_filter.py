@@ -2,19 +2,32 @@
 メディアタイプによるフィルタリング
 """
 
-from typing import Dict, Any, Set
+import sys
+from typing import Dict, Any, FrozenSet, List
 from ..filter_base import BaseFilter, FilterResult
 from ..file_info import FileInfo
 
 
 class MediaTypeFilter(BaseFilter):
     """メディアタイプによるファイルフィルター"""
-    
+
+    # 属性比較のみの軽量フィルター
+    estimated_cost = 1.0
+
     def __init__(self, config: Dict[str, Any], filter_id: str):
         super().__init__(config, filter_id)
         
-        self.include_types: Set[str] = set(config.get("includeTypes", []))
-        self.exclude_types: Set[str] = set(config.get("excludeTypes", []))
+        # メディアタイプは5種程度の列挙値なのでintern済み文字列の
+        # frozensetとして構築時に確定させる。FileInfo.media_typeは
+        # リテラル由来の共有文字列（ハッシュ計算済み）のため、
+        # ファイルごとの照合は実質ポインタ比較＋キャッシュ済み
+        # ハッシュの参照1回で済む
+        self.include_types: FrozenSet[str] = frozenset(
+            sys.intern(media_type) for media_type in config.get("includeTypes", [])
+        )
+        self.exclude_types: FrozenSet[str] = frozenset(
+            sys.intern(media_type) for media_type in config.get("excludeTypes", [])
+        )
     
     def check_file(self, file_info: FileInfo) -> FilterResult:
         """メディアタイプによるフィルタリング判定"""
@@ -36,11 +49,26 @@ class MediaTypeFilter(BaseFilter):
                 metadata={"media_type": media_type, "allowed_types": list(self.include_types)}
             )
         
-        return FilterResult(
-            include=True,
-            metadata={"media_type": media_type}
-        )
+        # accept側は付帯情報を持たないため共有シングルトンを返す
+        return FilterResult.ACCEPT
     
+    def check_files(self, file_infos: List[FileInfo]) -> List[bool]:
+        """メディアタイプの一括判定（FilterResultを生成しない高速パス）"""
+        include_types = self.include_types
+        exclude_types = self.exclude_types
+
+        results = []
+        append = results.append
+        for file_info in file_infos:
+            media_type = file_info.media_type
+            if exclude_types and media_type in exclude_types:
+                append(False)
+            elif include_types and media_type not in include_types:
+                append(False)
+            else:
+                append(True)
+        return results
+
     def get_filter_name(self) -> str:
         return "Media Type Filter"
     
@@ -2,14 +2,86 @@
 スクリーンショット除外フィルター
 """
 
-from typing import Dict, Any, List
+import logging
+import re
+from typing import Dict, Any, List, Optional, Pattern
+
 from ..filter_base import BaseFilter, FilterResult
-from ..file_info import FileInfo
+from ..file_info import (
+    FileInfo,
+    SCREENSHOT_SIGNAL_FILENAME,
+    SCREENSHOT_SIGNAL_METADATA,
+    SCREENSHOT_SIGNAL_PATH,
+)
+
+try:
+    # 任意依存: 多数のリテラルパターンを一括照合する高速マッチャ
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+# ファイル名・パスのスクリーンショット判定に現れるリテラルトークン。
+# これらがパスにまったく含まれないファイルは該当パターンに一致し得ない。
+# "/pictures/" はDCIM外のPicturesフォルダ直下のPNGをスクリーンショットと
+# みなすパス判定（FileInfo._is_screenshot_by_path）のためのトークン
+_SCREENSHOT_LITERAL_TOKENS = ("screenshot", "スクリーンショット", "img_", "/pictures/")
+
+# 発火チャネルの最下位ビット → 検出方法名
+_SIGNAL_METHOD_NAMES = {
+    SCREENSHOT_SIGNAL_FILENAME: "filename_pattern",
+    SCREENSHOT_SIGNAL_PATH: "path_pattern",
+    SCREENSHOT_SIGNAL_METADATA: "metadata_pattern",
+}
+
+# iOSデバイスの画面解像度
+_IOS_RESOLUTIONS = [
+    (1125, 2436), (1242, 2688), (828, 1792),  # iPhone X系
+    (750, 1334), (1242, 2208),  # iPhone 6/7/8系
+    (640, 1136), (640, 960), (320, 480),  # 古いiPhone
+    (1668, 2388), (2048, 2732), (1536, 2048),  # iPad
+]
+
+# Android一般的解像度（参考値）
+_ANDROID_RESOLUTIONS = [
+    (1080, 1920), (1440, 2560), (1080, 2340),
+    (720, 1280), (1080, 2160), (1440, 3120),
+]
+
+
+def _resolution_set(resolutions) -> frozenset:
+    """(短辺, 長辺) に正規化した解像度セットを構築
+
+    照合側も同じ正規化を行うため、縦横どちらの向きでも1回の
+    ハッシュ参照で一致判定できる（両向きを持つよりセットが半分で済む）。
+
+    備考: この照合をNumbaでJITコンパイルする案も検討したが、
+    既にファイルあたり1回のハッシュ参照（C実装）であり、候補も
+    20件弱しかないため、JITのコンパイルコストと依存追加に見合う
+    改善余地がない。
+    """
+    return frozenset((min(w, h), max(w, h)) for w, h in resolutions)
+
+
+# デバイスタイプ → 正規化済み解像度セット（インポート時に1回だけ構築）。
+# フィルター構築のたびにセットを組み直さず、__init__は辞書参照1回で済む
+_RESOLUTION_SETS_BY_DEVICE = {
+    "iOS": _resolution_set(_IOS_RESOLUTIONS),
+    "Android": _resolution_set(_ANDROID_RESOLUTIONS),
+    "auto": _resolution_set(_IOS_RESOLUTIONS + _ANDROID_RESOLUTIONS),
+}
 
 
 class ScreenshotFilter(BaseFilter):
     """スクリーンショットファイルの除外フィルター"""
-    
+
+    # 正規表現・メタデータ参照を伴う高コストフィルター
+    estimated_cost = 100.0
+    # スクリーンショットは少数派で、大半のファイルは通過する
+    selectivity_hint = 0.9
+    required_metadata = frozenset({"width", "height", "image_description", "software"})
+
     def __init__(self, config: Dict[str, Any], filter_id: str):
         super().__init__(config, filter_id)
         
@@ -22,18 +94,57 @@ class ScreenshotFilter(BaseFilter):
         self.enable_metadata_pattern = detection_config.get("enableMetadataPattern", True)
         self.enable_resolution_detection = detection_config.get("enableResolutionDetection", True)
         self.custom_patterns: List[str] = detection_config.get("customPatterns", [])
-        
+
         # デバイス特有設定
         self.device_type = config.get("deviceType", "auto")  # iOS, Android, auto
-    
+
+        # カスタムパターンは1つの選択肢正規表現に統合して構築時に
+        # 一度だけコンパイルする（ファイルごとの再コンパイルを回避）
+        self._custom_pattern_re: Optional[Pattern[str]] = None
+        if self.custom_patterns:
+            try:
+                self._custom_pattern_re = re.compile(
+                    "|".join(f"(?:{p.lower()})" for p in self.custom_patterns)
+                )
+            except re.error as e:
+                logger.error(f"Invalid custom screenshot pattern: {str(e)}")
+
+        # 有効な判定チャネルをビットマスクに集約（ファイルごとの
+        # enable_*フラグ分岐を1回のマスク演算に置き換える）
+        self._channel_mask = 0
+        if self.enable_filename_pattern:
+            self._channel_mask |= SCREENSHOT_SIGNAL_FILENAME
+        if self.enable_path_pattern:
+            self._channel_mask |= SCREENSHOT_SIGNAL_PATH
+        if self.enable_metadata_pattern:
+            self._channel_mask |= SCREENSHOT_SIGNAL_METADATA
+
+        # ファイル名・パス判定の前段として、リテラルトークンを1回の
+        # 線形走査で照合するAho-Corasickオートマトンを構築する
+        # （大多数の非スクリーンショットはこの1パスで正規表現判定を回避）
+        self._literal_automaton = None
+        if ahocorasick is not None and (
+            self.enable_filename_pattern or self.enable_path_pattern
+        ):
+            automaton = ahocorasick.Automaton()
+            for token in _SCREENSHOT_LITERAL_TOKENS:
+                automaton.add_word(token, token)
+            automaton.make_automaton()
+            self._literal_automaton = automaton
+
+        # デバイスタイプに応じた解像度セット（構築済みの共有セットを参照）
+        self._resolution_set = _RESOLUTION_SETS_BY_DEVICE.get(
+            self.device_type, _RESOLUTION_SETS_BY_DEVICE["auto"]
+        )
+
     def check_file(self, file_info: FileInfo) -> FilterResult:
         """スクリーンショット判定によるフィルタリング"""
         if not self.exclude_screenshots:
-            return FilterResult(include=True)
-        
+            return FilterResult.ACCEPT
+
         # 画像以外はスクリーンショットではない
         if file_info.media_type != "image":
-            return FilterResult(include=True, metadata={"is_screenshot": False})
+            return FilterResult.ACCEPT
         
         # スクリーンショット判定実行
         is_screenshot, detection_method = self._detect_screenshot(file_info)
@@ -49,35 +160,37 @@ class ScreenshotFilter(BaseFilter):
                 }
             )
         
-        return FilterResult(
-            include=True,
-            metadata={"is_screenshot": False}
-        )
+        # accept側は付帯情報を持たないため共有シングルトンを返す
+        return FilterResult.ACCEPT
     
     def _detect_screenshot(self, file_info: FileInfo) -> tuple[bool, str]:
         """スクリーンショット検出を実行"""
         
-        # カスタムパターンチェック
-        if self.custom_patterns:
-            for pattern in self.custom_patterns:
-                import re
-                if re.match(pattern.lower(), file_info.original_filename.lower()):
-                    return True, "custom_pattern"
-        
-        # ファイル名パターン判定
-        if self.enable_filename_pattern:
-            if file_info._is_screenshot_by_filename():
-                return True, "filename_pattern"
+        # カスタムパターンチェック（コンパイル済み選択肢正規表現で1回判定。
+        # 小文字化済みファイル名はFileInfo側のキャッシュを再利用する）
+        if self._custom_pattern_re is not None:
+            if self._custom_pattern_re.match(file_info._original_filename_lower):
+                return True, "custom_pattern"
         
-        # パスパターン判定
-        if self.enable_path_pattern:
-            if file_info._is_screenshot_by_path():
-                return True, "path_pattern"
-        
-        # メタデータパターン判定
-        if self.enable_metadata_pattern:
-            if file_info._is_screenshot_by_metadata():
-                return True, "metadata_pattern"
+        # ファイル名・パス・メタデータ判定を1回の呼び出しに集約
+        channels = self._channel_mask
+
+        # 前段: リテラルトークンが1つも現れないパスは、ファイル名・
+        # パスの正規表現判定まで進めても一致しないため丸ごとスキップする
+        if self._literal_automaton is not None and channels & (
+            SCREENSHOT_SIGNAL_FILENAME | SCREENSHOT_SIGNAL_PATH
+        ):
+            if (
+                next(self._literal_automaton.iter(file_info._original_path_norm), None)
+                is None
+            ):
+                channels &= ~(SCREENSHOT_SIGNAL_FILENAME | SCREENSHOT_SIGNAL_PATH)
+
+        if channels:
+            signals = file_info._screenshot_signals(channels)
+            if signals:
+                # 最下位の発火ビット＝従来の判定順で最初に一致したチャネル
+                return True, _SIGNAL_METHOD_NAMES[signals & -signals]
         
         # 解像度判定（デバイス特有）
         if self.enable_resolution_detection:
@@ -88,46 +201,20 @@ class ScreenshotFilter(BaseFilter):
     
     def _detect_by_resolution(self, file_info: FileInfo) -> bool:
         """解像度によるスクリーンショット検出"""
-        width = file_info.metadata.get('width', 0)
-        height = file_info.metadata.get('height', 0)
-        
+        meta = file_info.metadata
+        width = meta.get('width', 0)
+        height = meta.get('height', 0)
+
         if not width or not height:
             return False
         
         # PNGファイルのみ対象
         if file_info.original_extension.lower() != 'png':
             return False
-        
-        # iOSデバイスの画面解像度
-        ios_resolutions = [
-            (1125, 2436), (1242, 2688), (828, 1792),  # iPhone X系
-            (750, 1334), (1242, 2208),  # iPhone 6/7/8系
-            (640, 1136), (640, 960), (320, 480),  # 古いiPhone
-            (1668, 2388), (2048, 2732), (1536, 2048),  # iPad
-        ]
-        
-        # Android一般的解像度（参考値）
-        android_resolutions = [
-            (1080, 1920), (1440, 2560), (1080, 2340),
-            (720, 1280), (1080, 2160), (1440, 3120),
-        ]
-        
-        all_resolutions = ios_resolutions + android_resolutions
-        
-        # デバイスタイプ指定がある場合は該当するもののみチェック
-        if self.device_type == "iOS":
-            check_resolutions = ios_resolutions
-        elif self.device_type == "Android":
-            check_resolutions = android_resolutions
-        else:
-            check_resolutions = all_resolutions
-        
+
         # 縦横どちらでも一致すればスクリーンショットの可能性
-        for w, h in check_resolutions:
-            if (width == w and height == h) or (width == h and height == w):
-                return True
-        
-        return False
+        # （(短辺, 長辺) に正規化して構築済みセットをO(1)参照）
+        return (min(width, height), max(width, height)) in self._resolution_set
     
     def get_filter_name(self) -> str:
         return "Screenshot Filter"
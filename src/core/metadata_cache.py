@@ -0,0 +1,128 @@
+"""
+メタデータ抽出結果のLRUキャッシュ
+
+同じソースを繰り返しスキャンする場合（再インポートやフォルダ監視）に、
+変化していないファイルのEXIF再解析を省略する。キーに (絶対パス, mtime_ns,
+サイズ) を使うため、ファイルが更新されると自動的にキャッシュミスとなる。
+"""
+
+import atexit
+import logging
+import os
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# キャッシュの最大エントリ数
+_DEFAULT_MAX_ENTRIES = 10_000
+
+# 永続化先（再起動をまたいでキャッシュを再利用する）
+_DEFAULT_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "omoide_porter", "metadata_cache.pkl"
+)
+
+_CacheKey = Tuple[str, int, int]
+
+
+class MetadataCache:
+    """(パス, mtime_ns, サイズ) をキーとするメタデータのLRUキャッシュ"""
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        cache_file: Optional[str] = _DEFAULT_CACHE_FILE,
+    ):
+        """
+        Args:
+            max_entries: 保持する最大エントリ数（超過時は最も古いものを破棄）
+            cache_file: 永続化先のファイルパス（Noneの場合はメモリのみ）
+        """
+        self.max_entries = max_entries
+        self.cache_file = cache_file
+        self._entries: "OrderedDict[_CacheKey, Dict[str, Any]]" = OrderedDict()
+
+        if cache_file:
+            self._load()
+
+    @staticmethod
+    def _make_key(path: str, stat: os.stat_result) -> _CacheKey:
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        キャッシュからメタデータを取得
+
+        Args:
+            path: ファイルパス
+            stat: ファイルのstat結果
+
+        Returns:
+            キャッシュ済みメタデータ、未登録または無効化済みの場合None
+        """
+        key = self._make_key(path, stat)
+        try:
+            value = self._entries.pop(key)
+        except KeyError:
+            return None
+
+        # LRU: ヒットしたエントリを末尾（最新）へ移動
+        self._entries[key] = value
+        return value
+
+    def put(self, path: str, stat: os.stat_result, metadata: Dict[str, Any]) -> None:
+        """
+        メタデータをキャッシュに登録
+
+        Args:
+            path: ファイルパス
+            stat: ファイルのstat結果
+            metadata: 抽出済みメタデータ
+        """
+        key = self._make_key(path, stat)
+        self._entries.pop(key, None)
+        self._entries[key] = metadata
+
+        # 上限超過時は最も古いエントリから破棄
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """キャッシュを全消去"""
+        self._entries.clear()
+
+    def save(self) -> None:
+        """キャッシュをディスクに永続化（失敗しても処理は継続する）"""
+        if not self.cache_file:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_path = self.cache_file + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(dict(self._entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to save metadata cache: {str(e)}")
+
+    def _load(self) -> None:
+        """永続化済みキャッシュを読み込む（失敗時は空のまま開始）"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, "rb") as f:
+                    entries = pickle.load(f)
+                self._entries = OrderedDict(entries)
+        except Exception as e:
+            logger.warning(f"Failed to load metadata cache: {str(e)}")
+            self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# グローバルメタデータキャッシュインスタンス
+metadata_cache = MetadataCache()
+
+# プロセス終了時に永続化
+atexit.register(metadata_cache.save)
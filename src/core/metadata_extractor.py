@@ -1,18 +1,117 @@
 import os
+import struct
 import exifread
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from tinytag import TinyTag
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 from PIL import Image
 
 from .file_info import FileInfo
+from .metadata_cache import metadata_cache
 
 logger = logging.getLogger(__name__)
 
 
+def _read_image_dimensions(file_path: str) -> Optional[Tuple[int, int, str]]:
+    """
+    画像ヘッダのみを読んで寸法を取得
+
+    PNG/GIF/JPEGはヘッダの既知オフセットまたはSOFマーカーから
+    幅・高さを直接読み取れるため、PILのデコーダ初期化を省略できる。
+    未知のフォーマットや壊れたヘッダの場合はNoneを返し、
+    呼び出し側がPILにフォールバックする。
+
+    Args:
+        file_path: 画像ファイルのパス
+
+    Returns:
+        (幅, 高さ, フォーマット名) のタプル、判定できない場合None
+    """
+    try:
+        with open(file_path, "rb") as f:
+            header = f.read(26)
+
+            # PNG: IHDRチャンクのオフセット16/20に幅・高さ（ビッグエンディアン）
+            if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+                width, height = struct.unpack(">II", header[16:24])
+                return width, height, "PNG"
+
+            # GIF: オフセット6/8に幅・高さ（リトルエンディアン）
+            if header[:6] in (b"GIF87a", b"GIF89a"):
+                width, height = struct.unpack("<HH", header[6:10])
+                return width, height, "GIF"
+
+            # JPEG: SOFnマーカーまでセグメントを読み飛ばす
+            if header[:2] == b"\xff\xd8":
+                f.seek(2)
+                while True:
+                    byte = f.read(1)
+                    if not byte:
+                        return None
+                    if byte != b"\xff":
+                        continue
+
+                    marker = f.read(1)
+                    if not marker:
+                        return None
+                    m = marker[0]
+
+                    # パディング・スタンドアロンマーカーはスキップ
+                    if m == 0xFF or m == 0x01 or 0xD0 <= m <= 0xD9:
+                        continue
+
+                    segment = f.read(2)
+                    if len(segment) < 2:
+                        return None
+                    length = struct.unpack(">H", segment)[0]
+
+                    # SOF0〜SOF15（DHT/JPG/DACを除く）が寸法を持つ
+                    if 0xC0 <= m <= 0xCF and m not in (0xC4, 0xC8, 0xCC):
+                        body = f.read(5)
+                        if len(body) < 5:
+                            return None
+                        height, width = struct.unpack(">HH", body[1:5])
+                        return width, height, "JPEG"
+
+                    f.seek(length - 2, 1)
+    except OSError:
+        return None
+
+    return None
+
+
 class MetadataExtractor:
     """ファイルからメタデータを抽出するクラス"""
 
+    # ディレクトリごとのベース名インデックス: dir -> {stem: [DirEntry, ...]}
+    # find_associated_filesをメインファイルごとに呼んでもディレクトリの
+    # 走査は1回で済む（O(N·M) → インデックス構築O(M) + 参照O(1)）
+    _dir_index_cache: Dict[str, Dict[str, List]] = {}
+
+    @classmethod
+    def _get_dir_index(cls, source_dir: str) -> Dict[str, List]:
+        """ディレクトリのベース名インデックスを取得（未構築なら1回だけ走査）"""
+        index = cls._dir_index_cache.get(source_dir)
+        if index is None:
+            grouped = defaultdict(list)
+            try:
+                with os.scandir(source_dir) as entries:
+                    for entry in entries:
+                        stem = os.path.splitext(entry.name)[0]
+                        grouped[stem].append(entry)
+            except OSError:
+                pass
+            index = dict(grouped)
+            cls._dir_index_cache[source_dir] = index
+        return index
+
+    @classmethod
+    def clear_dir_index(cls) -> None:
+        """ベース名インデックスを破棄（再スキャン前に呼ぶ）"""
+        cls._dir_index_cache.clear()
+
     @staticmethod
     def extract_metadata(file_info: FileInfo) -> Dict[str, Any]:
         """
@@ -24,12 +123,23 @@ class MetadataExtractor:
         Returns:
             メタデータの辞書
         """
-        if not os.path.exists(file_info.original_path):
+        # 事前のexistsチェックは行わない。scandir由来のFileInfoは
+        # stat結果をキャッシュ済みで、欠損ファイルは下のstat/openの
+        # 例外で同様に検出できる（ファイルごとのsyscallを1つ削減）
+        try:
+            # キャッシュチェック（同一パス・mtime・サイズなら再抽出しない）
+            stat = file_info.get_stat()
+        except OSError:
             logger.error(f"File not found: {file_info.original_path}")
             return {}
-        
+        cached = metadata_cache.get(file_info.original_path, stat)
+        if cached is not None:
+            file_info.metadata = dict(cached)
+            file_info.reset_screenshot_cache()
+            return file_info.metadata
+
         metadata = {}
-        
+
         try:
             if file_info.media_type == "image" or file_info.media_type == "raw":
                 metadata = MetadataExtractor._extract_image_metadata(file_info.original_path)
@@ -37,7 +147,8 @@ class MetadataExtractor:
                 metadata = MetadataExtractor._extract_audio_video_metadata(file_info.original_path)
         except Exception as e:
             logger.error(f"Failed to extract metadata: {str(e)}")
-        
+
+        metadata_cache.put(file_info.original_path, stat, metadata)
         file_info.metadata = metadata
         
         # メタデータ更新後にスクリーンショット判定キャッシュをリセット
@@ -45,33 +156,82 @@ class MetadataExtractor:
         
         return metadata
     
+    @staticmethod
+    def extract_metadata_batch(
+        file_info_list: List[FileInfo],
+        max_workers: Optional[int] = None
+    ) -> None:
+        """
+        複数ファイルのメタデータをスレッドプールで並列抽出
+
+        EXIF/タグの読み込みはファイルごとに独立しており、read中は
+        GILが解放されるため、スレッド並列でI/O待ちをオーバーラップできる。
+        抽出済みのファイルはensure_metadata側でスキップされる。
+        個別ファイルのエラーはログに記録して続行する。
+
+        Args:
+            file_info_list: ファイル情報のリスト
+            max_workers: ワーカースレッド数（省略時はCPU数に応じて決定）
+        """
+        if not file_info_list:
+            return
+
+        def _extract(file_info: FileInfo) -> None:
+            try:
+                file_info.ensure_metadata()
+            except Exception as e:
+                logger.error(
+                    "Failed to extract metadata for %s: %s",
+                    file_info.original_filename, str(e)
+                )
+
+        if max_workers is None:
+            max_workers = min(4, os.cpu_count() or 1)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # mapを消費し切って全ファイルの抽出完了を待つ
+            list(executor.map(_extract, file_info_list, chunksize=64))
+
     @staticmethod
     def _extract_image_metadata(file_path: str) -> Dict[str, Any]:
         """画像ファイルからメタデータを抽出"""
         metadata = {}
         
-        try:
-            # PILを使用して基本的な画像情報を取得
-            with Image.open(file_path) as img:
-                metadata['width'] = img.width
-                metadata['height'] = img.height
-                metadata['format'] = img.format
-        except Exception as e:
-            logger.warning(f"Failed to get image dimensions with PIL: {str(e)}")
+        # まずヘッダのみの軽量パーサで寸法を取得し、判定できない
+        # フォーマット（HEIC/WebP等）のみPILにフォールバックする
+        dimensions = _read_image_dimensions(file_path)
+        if dimensions:
+            metadata['width'], metadata['height'], metadata['format'] = dimensions
+        else:
+            try:
+                # PILを使用して基本的な画像情報を取得
+                with Image.open(file_path) as img:
+                    metadata['width'] = img.width
+                    metadata['height'] = img.height
+                    metadata['format'] = img.format
+            except Exception as e:
+                logger.warning(f"Failed to get image dimensions with PIL: {str(e)}")
         
         try:
             # exifreadを使用してEXIFデータを抽出
+            # details=FalseでMakerNoteの解析を、extract_thumbnail=Falseで
+            # 埋め込みサムネイルJPEGの取り出しをスキップする
+            # （ここで読むのは日時・カメラ・GPS等の基本タグのみ）
             with open(file_path, 'rb') as f:
-                tags = exifread.process_file(f, details=False)
+                tags = exifread.process_file(
+                    f, details=False, extract_thumbnail=False
+                )
                 
                 # 日時情報
                 if 'EXIF DateTimeOriginal' in tags:
                     dt_str = str(tags['EXIF DateTimeOriginal'])
                     metadata['datetime'] = dt_str
-                    parts = dt_str.split(' ')[0].split(':')
-                    metadata['year'] = parts[0]
-                    metadata['month'] = parts[1]
-                    metadata['day'] = parts[2]
+                    # EXIF日時は"YYYY:MM:DD HH:MM:SS"固定なので、
+                    # splitのリスト生成を挟まず位置で直接切り出す
+                    if len(dt_str) >= 10 and dt_str[4] == ':' and dt_str[7] == ':':
+                        metadata['year'] = dt_str[0:4]
+                        metadata['month'] = dt_str[5:7]
+                        metadata['day'] = dt_str[8:10]
                 
                 # カメラ情報
                 if 'Image Make' in tags:
@@ -121,11 +281,18 @@ class MetadataExtractor:
             if tag.date:
                 metadata['datetime'] = str(tag.date)
             
-            # その他利用可能なタグ
-            for field in ['title', 'artist', 'album', 'albumartist', 'composer']:
-                value = getattr(tag, field, None)
-                if value:
-                    metadata[field] = str(value)
+            # その他利用可能なタグ（TinyTagはこれらをstrで返すため、
+            # 文字列名のgetattrやstr()変換を挟まず直接読み取る）
+            if tag.title:
+                metadata['title'] = tag.title
+            if tag.artist:
+                metadata['artist'] = tag.artist
+            if tag.album:
+                metadata['album'] = tag.album
+            if tag.albumartist:
+                metadata['albumartist'] = tag.albumartist
+            if tag.composer:
+                metadata['composer'] = tag.composer
         
         except Exception as e:
             logger.error(f"Error extracting audio/video metadata: {str(e)}")
@@ -150,24 +317,23 @@ class MetadataExtractor:
             関連ファイルのFileInfoオブジェクトのリスト
         """
         associated_files = []
-        
-        if not os.path.exists(source_dir):
-            return associated_files
-        
+
+        # 拡張子セットはループ外で1回だけ小文字化（O(1)の包含判定）
+        ext_set = {ext.lower() for ext in extensions}
+
         # 拡張子を除いたファイル名（ベース名）
         base_name = os.path.splitext(file_info.original_filename)[0]
-        
-        # 同じディレクトリ内のファイルをスキャン
-        for filename in os.listdir(source_dir):
+
+        # ベース名インデックスから同名グループをO(1)で取得
+        # （ディレクトリの走査は呼び出し回数に関わらず1回だけ）
+        for entry in MetadataExtractor._get_dir_index(source_dir).get(base_name, []):
             # すでに対象のファイル自体である場合はスキップ
-            if filename == file_info.original_filename:
+            if entry.name == file_info.original_filename:
                 continue
-            
-            # ベース名が一致し、拡張子が指定リストにあるファイルを探す
-            file_base, file_ext = os.path.splitext(filename)
-            if file_base == base_name and file_ext[1:].lower() in [ext.lower() for ext in extensions]:
-                full_path = os.path.join(source_dir, filename)
-                associated_file = FileInfo(full_path)
-                associated_files.append(associated_file)
-        
+
+            # 拡張子が指定リストにあるファイルのみ関連ファイルとみなす
+            file_ext = os.path.splitext(entry.name)[1]
+            if file_ext[1:].lower() in ext_set:
+                associated_files.append(FileInfo.from_dir_entry(entry))
+
         return associated_files 
\ No newline at end of file
@@ -3,6 +3,8 @@
 設計書 docs/data_structure.md に基づくクラス定義
 """
 
+import re
+import sys
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -10,6 +12,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# ファイルサイズ表示用の単位表
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 class DeviceType(Enum):
     """デバイスタイプ列挙型"""
@@ -42,8 +47,13 @@ class TransferProtocol(Enum):
     UNKNOWN = "unknown"
 
 
-class FileStatus(Enum):
-    """ファイル処理状態列挙型"""
+class FileStatus(str, Enum):
+    """ファイル処理状態列挙型
+
+    strを継承しているため、既存の文字列比較（status == "pending"）と
+    JSONシリアライズはそのまま動作する。列挙子同士の比較は
+    ハッシュ計算を伴わない同一性チェックで済む。
+    """
 
     PENDING = "pending"
     COPYING = "copying"
@@ -135,7 +145,11 @@ class DeviceInfo:
 
 @dataclass
 class FileInfo:
-    """ファイル情報クラス"""
+    """ファイル情報クラス
+
+    補足: @dataclass(slots=True)によるメモリ削減はPython 3.10以降が
+    必要なため、サポート下限（3.8）を引き上げるまで見送っている。
+    """
 
     # 元ファイル情報
     original_path: str = ""
@@ -179,6 +193,12 @@ class FileInfo:
             if not self.original_extension:
                 self.original_extension = path.suffix
 
+        # 取り得る値が少ない短い文字列はinternして、大量のファイルで
+        # 同じ値のコピーを持たないようにする（比較も同一性チェックで済む）
+        self.original_extension = sys.intern(self.original_extension)
+        self.media_type = sys.intern(self.media_type)
+        self.mime_type = sys.intern(self.mime_type)
+
     @property
     def size_mb(self) -> float:
         """ファイルサイズをMBで取得"""
@@ -190,15 +210,11 @@ class FileInfo:
         if self.size == 0:
             return "0 B"
 
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(self.size)
-        unit_index = 0
-
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
+        # 2^10ごとに単位が上がるため、ビット長から単位をO(1)で決定できる
+        unit_index = min((self.size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        size = self.size / (1 << (unit_index * 10))
 
-        return f"{size:.1f} {units[unit_index]}"
+        return f"{size:.1f} {_SIZE_UNITS[unit_index]}"
 
     @property
     def is_image(self) -> bool:
@@ -224,8 +240,14 @@ class FileInfo:
         """メタデータに値を設定"""
         self.metadata[key] = value
 
-    def to_dict(self) -> Dict[str, Any]:
-        """辞書形式に変換"""
+    def to_dict(self, include_device: bool = True) -> Dict[str, Any]:
+        """辞書形式に変換
+
+        Args:
+            include_device: ネストしたデバイス情報も変換するかどうか。
+                大量のファイルを一括シリアライズする場合はFalseにすると
+                デバイス辞書の再構築を省ける
+        """
         return {
             "original_path": self.original_path,
             "original_filename": self.original_filename,
@@ -237,7 +259,9 @@ class FileInfo:
             ),
             "source_type": self.source_type.value,
             "source_device": (
-                self.source_device.to_dict() if self.source_device else None
+                self.source_device.to_dict()
+                if include_device and self.source_device
+                else None
             ),
             "media_type": self.media_type,
             "mime_type": self.mime_type,
@@ -250,6 +274,23 @@ class FileInfo:
             "is_associated_file": self.is_associated_file,
         }
 
+    def to_tuple(self) -> tuple:
+        """一覧表示に必要な最小限のフィールドをタプルで取得
+
+        大量ファイルの一括シリアライズでto_dictの15キー超の辞書構築を
+        避けたい場合のための軽量版。
+
+        Returns:
+            (ファイル名, メディア種別, サイズ, 状態, コピー先パス)
+        """
+        return (
+            self.original_filename,
+            self.media_type,
+            self.size,
+            self.status.value,
+            self.target_path,
+        )
+
 
 @dataclass
 class DeviceProfile:
@@ -264,11 +305,18 @@ class DeviceProfile:
     requires_authentication: bool = False
     transfer_protocol: TransferProtocol = TransferProtocol.UNKNOWN
 
-    def matches_device(self, device_info: DeviceInfo) -> bool:
-        """デバイスがこのプロファイルにマッチするかチェック"""
-        import re
+    def __post_init__(self):
+        """初期化後処理
 
+        パターンはプロファイル構築時に1回だけコンパイルする
+        （matches_deviceはプロファイル×デバイスの組ごとに呼ばれる）。
+        不正なパターンはマッチなし扱いとする。
+        """
         try:
-            return bool(re.match(self.device_id_pattern, device_info.device_id))
+            self._pattern: Optional[re.Pattern] = re.compile(self.device_id_pattern)
         except re.error:
-            return False
+            self._pattern = None
+
+    def matches_device(self, device_info: DeviceInfo) -> bool:
+        """デバイスがこのプロファイルにマッチするかチェック"""
+        return bool(self._pattern and self._pattern.match(device_info.device_id))
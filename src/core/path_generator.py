@@ -1,10 +1,45 @@
 import os
-import re
+from functools import lru_cache
 from typing import Dict, List, Any, Tuple
 from datetime import datetime
 
 from .file_info import FileInfo
 
+# パス・ファイル名に使えない文字と、それを"_"へ1パスで置換する変換テーブル
+# （str.translateはC実装の単一走査で、正規表現エンジンを経由しない）
+_INVALID_CHARS = '<>:"/\\|?*'
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in _INVALID_CHARS})
+
+# 最終更新日時から生成するデフォルト値のフォーマット表
+_DEFAULT_MTIME_FORMATS = {"year": "%Y", "month": "%m", "day": "%d"}
+
+# パス結合用のOS区切り文字。生成パーツはサニタイズ済みで区切り文字を
+# 含み得ないため、os.path.joinの引数ごとの絶対パス判定・区切り正規化を
+# 省いてstr.joinで直接連結できる
+_SEP = os.sep
+
+
+# 同一インポート内のファイルは撮影日時・EXIF文字列が高頻度で重複するため、
+# 整形結果をメモ化して strftime / replace の再実行を避ける
+
+
+@lru_cache(maxsize=4096)
+def _fmt_exif_datetime(dt_str: str) -> str:
+    """EXIF形式の日時文字列 (2023:01:15 12:30:45) をパス用に整形"""
+    return dt_str.replace(":", "").replace(" ", "_")
+
+
+@lru_cache(maxsize=512)
+def _fmt_mtime(epoch: int, fmt: str) -> str:
+    """最終更新日時（エポック秒）を指定フォーマットの文字列に変換"""
+    return datetime.fromtimestamp(epoch).strftime(fmt)
+
+
+@lru_cache(maxsize=4096)
+def _sanitize(value: str) -> str:
+    """パスに使えない文字を置換（結果はメモ化）"""
+    return value.translate(_SANITIZE_TABLE)
+
 
 class PathElement:
     """パス要素の基底クラス"""
@@ -33,39 +68,27 @@ class MetadataElement(PathElement):
     def generate(self, file_info: FileInfo) -> str:
         # 特殊な日時フォーマット
         if self.key == "datetime":
-            # メタデータから日時情報を取得
+            # メタデータから日時情報を取得（EXIF形式 2023:01:15 12:30:45）
             dt_str = file_info.metadata.get("datetime")
             if dt_str:
-                try:
-                    # EXIF形式 (2023:01:15 12:30:45) を処理
-                    dt_str = dt_str.replace(":", "").replace(" ", "_")
-                    return dt_str
-                except Exception:
-                    pass
+                return _fmt_exif_datetime(str(dt_str))
             # 日時情報がない場合はファイルの最終更新日時を使用
-            return file_info.last_modified.strftime("%Y%m%d_%H%M%S")
-        
+            return _fmt_mtime(
+                int(file_info.last_modified.timestamp()), "%Y%m%d_%H%M%S"
+            )
+
         # 基本的なメタデータフィールド
         value = file_info.metadata.get(self.key)
         if value:
-            # 特殊文字を置換
-            value = str(value).strip()
-            # パスに使えない文字を置換
-            value = re.sub(r'[<>:"/\\|?*]', "_", value)
-            return value
-        
-        # メタデータがない場合のデフォルト値
-        defaults = {
-            "year": lambda: file_info.last_modified.strftime("%Y"),
-            "month": lambda: file_info.last_modified.strftime("%m"),
-            "day": lambda: file_info.last_modified.strftime("%d"),
-            "camera_make": lambda: "Unknown",
-            "camera_model": lambda: "Unknown"
-        }
-        
-        if self.key in defaults:
-            return defaults[self.key]()
-        
+            # 特殊文字・パスに使えない文字を置換
+            return _sanitize(str(value).strip())
+
+        # メタデータがない場合は最終更新日時からのデフォルト値
+        fmt = _DEFAULT_MTIME_FORMATS.get(self.key)
+        if fmt:
+            return _fmt_mtime(int(file_info.last_modified.timestamp()), fmt)
+
+        # camera_make / camera_model などはデフォルト値で代替
         return "Unknown"
 
 
@@ -83,10 +106,72 @@ class SequenceElement(PathElement):
     def __init__(self, digits: int = 3):
         self.digits = digits
         self._counter = 0
-    
+        # 桁数は固定なのでフォーマット文字列を構築時に確定させる
+        # （f-stringの入れ子書式はファイルごとに書式文字列を再解析する）
+        self._fmt = f"%0{digits}d"
+
     def generate(self, file_info: FileInfo) -> str:
         self._counter += 1
-        return f"{self._counter:0{self.digits}d}"
+        return self._fmt % self._counter
+
+
+class ConflictResolver:
+    """コピー先パスの衝突を解決するクラス
+
+    従来のos.path.existsによる逐次プローブは候補ごとにsyscallを発行し、
+    同一フォルダに集中するインポートでは "_1", "_2", ... と試行回数が
+    積み上がる。本クラスはフォルダごとにos.listdirを1回だけ実行して
+    既存名のセットを保持し、以降の判定をメモリ上のO(1)参照で行う。
+    採番位置も (フォルダ, ベース名, 拡張子) 単位で記憶し、次回は
+    前回の続きから試行する。
+    """
+
+    def __init__(self):
+        # フォルダ -> 既存ファイル名のセット（予約分も追加していく）
+        self._dir_cache: Dict[str, set] = {}
+        # (フォルダ, ベース名, 拡張子) -> 次に試す連番
+        self._next: Dict[Tuple[str, str, str], int] = {}
+
+    def _names_in(self, directory: str) -> set:
+        """フォルダ内の既存ファイル名セットを取得（初回のみlistdir）"""
+        names = self._dir_cache.get(directory)
+        if names is None:
+            try:
+                names = set(os.listdir(directory))
+            except OSError:
+                # フォルダ未作成なら衝突は起こり得ない
+                names = set()
+            self._dir_cache[directory] = names
+        return names
+
+    def resolve(self, target_path: str) -> str:
+        """
+        パスの衝突を解決し、解決後のパスを予約する
+
+        Args:
+            target_path: 生成されたパス
+
+        Returns:
+            衝突が解決されたパス
+        """
+        directory, filename = os.path.split(target_path)
+        names = self._names_in(directory)
+
+        if filename not in names:
+            names.add(filename)
+            return target_path
+
+        base, extension = os.path.splitext(filename)
+        key = (directory, base, extension)
+        counter = self._next.get(key, 1)
+
+        while True:
+            candidate = f"{base}_{counter}{extension}"
+            counter += 1
+            if candidate not in names:
+                names.add(candidate)
+                self._next[key] = counter
+                return os.path.join(directory, candidate)
 
 
 class PathGenerator:
@@ -169,8 +254,7 @@ class PathGenerator:
             part = element.generate(file_info)
             if part:
                 # パスに使えない文字を置換
-                part = re.sub(r'[<>:"/\\|?*]', "_", part)
-                path_parts.append(part)
+                path_parts.append(part.translate(_SANITIZE_TABLE))
         
         # パーツを結合してフォルダパスを生成
         folder_path = os.path.join(destination_root, *path_parts)
@@ -200,8 +284,7 @@ class PathGenerator:
             part = element.generate(file_info)
             if part:
                 # ファイル名に使えない文字を置換
-                part = re.sub(r'[<>:"/\\|?*]', "_", part)
-                filename_parts.append(part)
+                filename_parts.append(part.translate(_SANITIZE_TABLE))
         
         # パーツを結合してファイル名を生成
         filename = "".join(filename_parts)
@@ -212,6 +295,118 @@ class PathGenerator:
         
         return f"{filename}.{extension}"
     
+    @staticmethod
+    def compile_folder_path(
+        folder_elements: List[PathElement],
+        destination_root: str
+    ):
+        """
+        フォルダパス生成をテンプレート特化クロージャにコンパイル
+
+        テンプレートはコピージョブ全体で固定なので、要素の種別分岐や
+        リテラルのサニタイズを構築時に1回だけ行い、ファイルごとの
+        処理を「生成関数の呼び出し列＋結合」に縮約する。
+
+        Args:
+            folder_elements: フォルダ構造のパス要素リスト
+            destination_root: コピー先のルートディレクトリ
+
+        Returns:
+            FileInfoを受け取りフォルダパスを返すクロージャ
+        """
+        ops = []
+        for element in folder_elements:
+            if isinstance(element, LiteralElement):
+                # リテラルは構築時にサニタイズまで済ませて定数化
+                literal = element.value.translate(_SANITIZE_TABLE)
+                if literal:
+                    ops.append(lambda file_info, _v=literal: _v)
+            else:
+                ops.append(element.generate)
+
+        # ルートの末尾区切りは構築時に正規化し、閉包内はstr.joinのみ
+        root = destination_root.rstrip(_SEP)
+
+        def generate(
+            file_info: FileInfo,
+            _ops=tuple(ops),
+            _table=_SANITIZE_TABLE,
+            _sep=_SEP,
+        ) -> str:
+            parts = [
+                part.translate(_table)
+                for part in (op(file_info) for op in _ops)
+                if part
+            ]
+            if not parts:
+                return destination_root
+            return root + _sep + _sep.join(parts)
+
+        return generate
+
+    @staticmethod
+    def compile_filename(filename_elements: List[PathElement]):
+        """
+        ファイル名生成をテンプレート特化クロージャにコンパイル
+
+        Args:
+            filename_elements: ファイル名パターンのパス要素リスト
+
+        Returns:
+            FileInfoを受け取りファイル名（拡張子付き）を返すクロージャ
+        """
+        ops = []
+        for element in filename_elements:
+            if isinstance(element, LiteralElement):
+                literal = element.value.translate(_SANITIZE_TABLE)
+                if literal:
+                    ops.append(lambda file_info, _v=literal: _v)
+            else:
+                ops.append(element.generate)
+
+        def generate(
+            file_info: FileInfo,
+            _ops=tuple(ops),
+            _table=_SANITIZE_TABLE,
+        ) -> str:
+            filename = "".join(
+                part.translate(_table)
+                for part in (op(file_info) for op in _ops)
+                if part
+            )
+            if not filename:
+                filename = "file"
+            return f"{filename}.{file_info.original_extension}"
+
+        return generate
+
+    @staticmethod
+    def compile_target_path(
+        folder_elements: List[PathElement],
+        filename_elements: List[PathElement],
+        destination_root: str
+    ):
+        """
+        コピー先フルパス生成をテンプレート特化クロージャにコンパイル
+
+        Args:
+            folder_elements: フォルダ構造のパス要素リスト
+            filename_elements: ファイル名パターンのパス要素リスト
+            destination_root: コピー先のルートディレクトリ
+
+        Returns:
+            FileInfoを受け取りフルパスを返すクロージャ
+        """
+        gen_folder = PathGenerator.compile_folder_path(
+            folder_elements, destination_root
+        )
+        gen_filename = PathGenerator.compile_filename(filename_elements)
+
+        def generate(file_info: FileInfo, _sep=_SEP) -> str:
+            return gen_folder(file_info) + _sep + gen_filename(file_info)
+
+        return generate
+
     @staticmethod
     def generate_target_path(
         file_info: FileInfo,
@@ -238,6 +433,34 @@ class PathGenerator:
         
         return os.path.join(folder_path, filename)
     
+    @staticmethod
+    def generate_target_paths(
+        file_info_list: List[FileInfo],
+        folder_elements: List[PathElement],
+        filename_elements: List[PathElement],
+        destination_root: str
+    ) -> None:
+        """
+        複数ファイルのコピー先パスを一括生成して設定
+
+        テンプレートを1回だけコンパイルし（compile_target_path）、
+        衝突解決はConflictResolverを全ファイルで共有するため、
+        フォルダ走査はコピー先フォルダごとに1回で済む。
+
+        Args:
+            file_info_list: ファイル情報のリスト
+            folder_elements: フォルダ構造のパス要素リスト
+            filename_elements: ファイル名パターンのパス要素リスト
+            destination_root: コピー先のルートディレクトリ
+        """
+        generate = PathGenerator.compile_target_path(
+            folder_elements, filename_elements, destination_root
+        )
+        resolver = ConflictResolver()
+
+        for file_info in file_info_list:
+            file_info.set_target_path(resolver.resolve(generate(file_info)))
+
     @staticmethod
     def resolve_path_conflicts(
         target_path: str,
@@ -253,15 +476,7 @@ class PathGenerator:
         Returns:
             衝突が解決されたパス
         """
-        if not os.path.exists(target_path):
-            return target_path
-        
-        # パスが存在する場合、連番を付けて衝突を回避
-        base_path, extension = os.path.splitext(target_path)
-        counter = 1
-        
-        while True:
-            new_path = f"{base_path}_{counter}{extension}"
-            if not os.path.exists(new_path):
-                return new_path
-            counter += 1 
\ No newline at end of file
+        # 候補ごとのexistsプローブではなく、フォルダ一覧を1回読む
+        # ConflictResolverに委譲する（連続呼び出しではリゾルバを
+        # 共有するとフォルダ走査がさらに1回に集約される）
+        return ConflictResolver().resolve(target_path)
\ No newline at end of file
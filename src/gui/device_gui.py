@@ -1,6 +1,9 @@
 import logging
 import os
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from PySide6.QtCore import Qt, QThread, QTimer, Signal, Slot
@@ -34,6 +37,28 @@ from core.device_manager import DeviceManager
 from core.file_operations import FileOperations
 from core.models import ConnectionStatus, DeviceInfo, DeviceType, SourceType
 
+# デバイスタイプ・接続状態の表示装飾（if連鎖ではなく辞書参照で解決）
+_DEVTYPE_ICON = {
+    DeviceType.IOS: "📱",
+    DeviceType.ANDROID: "🤖",
+    DeviceType.CAMERA: "📷",
+}
+
+_STATUS_SUFFIX = {
+    ConnectionStatus.CONNECTED: " ✅",
+    ConnectionStatus.AUTHENTICATING: " 🔒",
+    ConnectionStatus.ERROR: " ❌",
+}
+
+# デバイス情報表示の固定部テンプレート（1回のformat_mapで展開）
+_DEVINFO_TMPL = """デバイス名: {display_name}
+タイプ: {device_type}
+メーカー: {manufacturer}
+モデル: {model}
+プロトコル: {protocol}
+接続状態: {connection_status}
+"""
+
 
 class DeviceWorkerThread(QThread):
     """デバイス操作用のワーカースレッド"""
@@ -47,6 +72,19 @@ class DeviceWorkerThread(QThread):
         self.device = None
         self.destination = ""
         self.operation = ""
+        self._progress_step = 1
+
+    def _emit_progress(self, current: int, total: int, name: str):
+        """進捗シグナルを間引いて発行
+
+        シグナルはキュー経由でGUIスレッドのイベントとなるため、
+        ファイルごとに発行するとイベントループが進捗処理で飽和する。
+        全体の0.5%刻み（最大約200回）と完了時のみ発行する。
+        """
+        if current <= 1:
+            self._progress_step = max(1, total // 200)
+        if current % self._progress_step == 0 or current == total:
+            self.progress_update.emit(current, total, name)
 
     def configure_device_scan(self, device: DeviceInfo):
         """デバイススキャン用の設定"""
@@ -77,16 +115,28 @@ class DeviceWorkerThread(QThread):
             self.operation_complete.emit(False, "デバイスのパスが利用できません")
             return
 
-        # 利用可能なパスからファイルをスキャン
+        # 利用可能なパスを並列にスキャンする。DCIM/Video等の複数パスは
+        # 独立したディレクトリツリーで、走査はI/O待ちが支配的なため、
+        # スレッドで重ねると合計時間が最長パスのスキャン時間に近づく
         all_files = []
-        for path in self.device.available_paths:
-            self.log_message.emit(f"スキャン中: {path}")
-            try:
-                files = FileOperations.scan_directory(path, recursive=True)
-                all_files.extend(files)
-                self.log_message.emit(f"{len(files)}ファイルを発見: {path}")
-            except Exception as e:
-                self.log_message.emit(f"スキャンエラー: {path} - {str(e)}")
+        paths = self.device.available_paths
+        with ThreadPoolExecutor(max_workers=min(4, len(paths))) as executor:
+            futures = {
+                executor.submit(
+                    FileOperations.scan_directory, path, recursive=True
+                ): path
+                for path in paths
+            }
+            self.log_message.emit(f"スキャン中: {len(paths)}パス")
+            for done, future in enumerate(as_completed(futures), 1):
+                path = futures[future]
+                try:
+                    files = future.result()
+                    all_files.extend(files)
+                    self.log_message.emit(f"{len(files)}ファイルを発見: {path}")
+                except Exception as e:
+                    self.log_message.emit(f"スキャンエラー: {path} - {str(e)}")
+                self._emit_progress(done, len(paths), path)
 
         self.log_message.emit(f"スキャン完了: 合計{len(all_files)}ファイル")
         self.operation_complete.emit(True, f"{len(all_files)}ファイルを発見しました")
@@ -237,8 +287,17 @@ class DeviceConnectionWidget(QMainWindow):
 
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        # 古い行を自動破棄してドキュメントの肥大化とUIの劣化を防ぐ
+        self.log_text.document().setMaximumBlockCount(20000)
         layout.addWidget(self.log_text)
 
+        # ログはリングバッファに溜め、タイマーでまとめて反映する。
+        # スキャン中の大量メッセージでも再レイアウトは100msに1回で済む
+        self._log_buffer = deque(maxlen=5000)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+        self._log_flush_timer.start(100)
+
         # ログクリアボタン
         clear_layout = QHBoxLayout()
         clear_layout.addStretch()
@@ -293,28 +352,22 @@ class DeviceConnectionWidget(QMainWindow):
 
     def _update_device_list(self):
         """デバイスリストを更新"""
+        # 表示に影響する属性のフィンガープリントを取り、前回と同じなら
+        # リストの再構築（clear + addItem + 選択解除）を丸ごと省く。
+        # 10秒間隔の定期検出では大半の呼び出しが無変更で終わる
+        fingerprint = tuple(
+            (d.device_id, d.display_name, d.device_type, d.connection_status)
+            for d in self.connected_devices
+        )
+        if fingerprint == getattr(self, "_device_list_fingerprint", None):
+            return
+        self._device_list_fingerprint = fingerprint
+
         self.device_list.clear()
 
         for device in self.connected_devices:
-            # デバイスタイプに応じたアイコン
-            if device.device_type == DeviceType.IOS:
-                icon = "📱"
-            elif device.device_type == DeviceType.ANDROID:
-                icon = "🤖"
-            elif device.device_type == DeviceType.CAMERA:
-                icon = "📷"
-            else:
-                icon = "❓"
-
-            # 接続状態の表示
-            status = ""
-            if device.connection_status == ConnectionStatus.CONNECTED:
-                status = " ✅"
-            elif device.connection_status == ConnectionStatus.AUTHENTICATING:
-                status = " 🔒"
-            elif device.connection_status == ConnectionStatus.ERROR:
-                status = " ❌"
-
+            icon = _DEVTYPE_ICON.get(device.device_type, "❓")
+            status = _STATUS_SUFFIX.get(device.connection_status, "")
             display_text = f"{icon} {device.display_name}{status}"
 
             item = QListWidgetItem(display_text)
@@ -350,25 +403,31 @@ class DeviceConnectionWidget(QMainWindow):
             return
 
         device = self.selected_device
-        info_text = f"""デバイス名: {device.display_name}
-タイプ: {device.device_type.value}
-メーカー: {device.manufacturer or "不明"}
-モデル: {device.model or "不明"}
-プロトコル: {device.protocol.value}
-接続状態: {device.connection_status.value}
-"""
+        # 固定部はテンプレートの1回展開、可変部はリストに溜めて最後に
+        # joinする（+=の文字列連結は行数分の再割り当てを伴う）
+        parts = [
+            _DEVINFO_TMPL.format_map(
+                {
+                    "display_name": device.display_name,
+                    "device_type": device.device_type.value,
+                    "manufacturer": device.manufacturer or "不明",
+                    "model": device.model or "不明",
+                    "protocol": device.protocol.value,
+                    "connection_status": device.connection_status.value,
+                }
+            )
+        ]
 
         if device.total_capacity > 0:
-            info_text += f"容量: {device.capacity_gb:.1f} GB\n"
-            info_text += f"空き容量: {device.free_space_gb:.1f} GB\n"
-            info_text += f"使用率: {device.used_space_percent:.1f}%\n"
+            parts.append(f"容量: {device.capacity_gb:.1f} GB\n")
+            parts.append(f"空き容量: {device.free_space_gb:.1f} GB\n")
+            parts.append(f"使用率: {device.used_space_percent:.1f}%\n")
 
         if device.available_paths:
-            info_text += f"\n利用可能パス:\n"
-            for path in device.available_paths:
-                info_text += f"  • {path}\n"
+            parts.append("\n利用可能パス:\n")
+            parts.extend(f"  • {path}\n" for path in device.available_paths)
 
-        self.device_info_text.setText(info_text)
+        self.device_info_text.setText("".join(parts))
 
     def _browse_destination(self):
         """コピー先フォルダを選択"""
@@ -448,11 +507,18 @@ class DeviceConnectionWidget(QMainWindow):
 
     @Slot(str)
     def _log_message(self, message: str):
-        """ログメッセージを追加"""
-        import datetime
+        """ログメッセージをバッファに追加（表示はタイマーで一括反映）"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._log_buffer.append(f"[{timestamp}] {message}")
+
+    def _flush_log_buffer(self):
+        """溜まったログを1回のappendでまとめて表示に反映"""
+        if not self._log_buffer:
+            return
 
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        lines = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        self.log_text.append(lines)
 
         # 自動スクロール
         cursor = self.log_text.textCursor()
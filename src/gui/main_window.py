@@ -6,9 +6,25 @@
 
 import os
 import sys
-
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QAction, QTextCursor
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QAbstractTableModel,
+    QElapsedTimer,
+    QEvent,
+    QFile,
+    QFileSystemWatcher,
+    QModelIndex,
+    QSignalBlocker,
+    Qt,
+    QThread,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QApplication,
     QButtonGroup,
@@ -22,6 +38,7 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMainWindow,
@@ -31,19 +48,352 @@ from PySide6.QtWidgets import (
     QRadioButton,
     QScrollArea,
     QStatusBar,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QTabWidget,
+    QPlainTextEdit,
     QTextEdit,
     QToolBar,
     QVBoxLayout,
     QWidget,
 )
 
-from ..core.config_manager import ConfigManager
-from ..core.device_manager import DeviceManager
-from ..core.file_operations import FileOperations
+# 重量級のコアモジュール（exifread/PIL/デバイス関連コードを連鎖import
+# する）は初回使用時まで読み込みを遅らせる。models/file_filter/
+# path_generatorは標準ライブラリしか引かない軽量モジュールなので
+# モジュールレベルで1回だけ解決する（クリックごとのimport往復を避ける）
+from ..core.file_filter import FileFilter
 from ..core.models import ConnectionStatus, DeviceInfo, DeviceType, SourceType
+from ..core.path_generator import (
+    LiteralElement,
+    MetadataElement,
+    OriginalFilenameElement,
+)
+from .preset_dialog import PresetManagementDialog
+
+# デバイスポーリングの適応間隔（ミリ秒）
+_DEVICE_POLL_MIN_MS = 2000
+_DEVICE_POLL_MAX_MS = 60000
+
+# 接続状態ごとの表示サフィックス
+_STATUS_SUFFIX = {
+    ConnectionStatus.CONNECTED: " ✅",
+    ConnectionStatus.AUTHENTICATING: " 🔒",
+    ConnectionStatus.AUTHORIZATION_REQUIRED: " 🔐",
+    ConnectionStatus.ERROR: " ❌",
+}
+
+# コンボボックスの選択肢。UI構築のたびにリストを生成し直さないよう
+# モジュールレベルのタプルとして1回だけ確保する
+_PRESET_NAMES = ("デフォルト", "旅行写真", "イベント動画", "RAW写真")
+_FOLDER_PRESET_PATTERNS = (
+    "{撮影年}/{撮影月}/{撮影日}",
+    "{カメラモデル}/{撮影年}-{撮影月}",
+    "{撮影年}/{GPS国}/{GPS都道府県}",
+    "カスタム...",
+)
+_FILENAME_PATTERNS = (
+    "{撮影年月日}_{時分秒}_{連番3桁}",
+    "{カメラモデル}_{撮影年月日}_{元のファイル名}",
+    "{元のファイル名}",
+    "カスタム...",
+)
+_LOG_LEVELS = ("Debug", "Info", "Warning", "Error")
+
+# ダークテーマのカラーパレット。スタイルシート内の@キー@トークンを
+# ここで一元的に解決する（色の変更はこの辞書の1箇所で済む）
+_PALETTE = {
+    "bg": "#1e1e1e",
+    "panel": "#2d2d30",
+    "control": "#3c3c3c",
+    "control_hover": "#4a4a4a",
+    "control_pressed": "#2a2a2a",
+    "border": "#3e3e42",
+    "accent": "#0e639c",
+    "accent_hover": "#1177bb",
+    "accent_pressed": "#0a4d7a",
+    "text": "#ffffff",
+    "text_muted": "#cccccc",
+}
+
+
+def _expand_palette(qss: str) -> str:
+    """スタイルシート内の@キー@トークンをパレットの色に展開"""
+    for key, color in _PALETTE.items():
+        qss = qss.replace(f"@{key}@", color)
+    return qss
+
+
+# アプリ全体のスタイルシートはresources/app.qssに集約されている。
+# ウィジェットごとのsetStyleSheetは呼び出しのたびにQtのCSSパーサと
+# サブツリーのpolish走査が走るため、1枚のシートを1回だけ適用する
+def _load_app_qss() -> str:
+    """アプリ全体のスタイルシートを読み込む
+
+    コンパイル済みQtリソース（:/qss/app.qss）があればメモリマップ済みの
+    ペイロードから読み、未生成の環境ではソースツリー内のapp.qssを直接
+    読む。リソースを再生成するには:
+
+        pyside6-rcc src/gui/resources/resources.qrc -o src/gui/resources_rc.py
+
+    Returns:
+        スタイルシート文字列
+    """
+    try:
+        from . import resources_rc  # noqa: F401
+
+        qss_file = QFile(":/qss/app.qss")
+        if qss_file.open(QFile.OpenModeFlag.ReadOnly):
+            try:
+                return bytes(qss_file.readAll().data()).decode("utf-8")
+            finally:
+                qss_file.close()
+    except ImportError:
+        pass
+
+    qss_path = os.path.join(os.path.dirname(__file__), "resources", "app.qss")
+    with open(qss_path, "r", encoding="utf-8") as fh:
+        return fh.read()
+
+
+_APP_QSS = _expand_palette(_load_app_qss())
+
+
+# 設定セクション共通のQGroupBoxスタイル。7箇所の各セクションが同一の
+# 文字列を都度生成していたため、モジュール定数にして同じstrオブジェクトを
+# Qt側に渡す（パーサキャッシュがポインタ一致で効く経路がある）
+_GROUPBOX_QSS = _expand_palette(
+    """
+    QGroupBox {
+        font-weight: bold;
+        font-size: 14px;
+        color: @text@;
+        border: 1px solid @border@;
+        border-radius: 6px;
+        margin-top: 12px;
+        padding-top: 12px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+"""
+)
+
+@lru_cache(maxsize=4096)
+def _fmt_mtime(year: int, month: int, day: int, hour: int, minute: int) -> str:
+    """更新日時の表示文字列を生成（分単位でメモ化）
+
+    連写された写真は同じ分に集中するため、strftimeより速いf-string
+    整形に加えてキャッシュがほとんどの呼び出しを吸収する。
+    """
+    return f"{year:04d}/{month:02d}/{day:02d} {hour:02d}:{minute:02d}"
+
+
+class FileTableModel(QAbstractTableModel):
+    """ファイル一覧のテーブルモデル
+
+    QTableWidgetはセルごとにフラグ・ロール辞書を持つQTableWidgetItemを
+    確保するため、1万ファイル規模ではアイテムオブジェクトだけで数十MBに
+    なる。本モデルは列ごとの並行リストに表示文字列だけを保持し（SoA）、
+    QTableViewが可視セルのぶんだけdata()を呼ぶオンデマンド描画に乗せる。
+    """
+
+    _HEADERS = ("名前", "サイズ", "タイプ", "更新日時", "カメラ", "状態")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 列ごとの並行リスト（_HEADERSと同順）
+        self._columns = tuple([] for _ in self._HEADERS)
+
+    @staticmethod
+    def build_columns(file_infos):
+        """ファイルリストから表示用の列並行リストを構築
+
+        プロパティ呼び出しとstrftime整形はここに集約されている。
+        UIスレッドを塞がないよう、スキャンのワーカースレッドから
+        呼んで結果をset_columns()へ渡すこともできる。
+
+        Args:
+            file_infos: FileInfoのリスト
+
+        Returns:
+            _HEADERSと同順の列リストのタプル
+        """
+        names = []
+        sizes = []
+        types = []
+        mtimes = []
+        cameras = []
+        statuses = []
+
+        for f in file_infos:
+            names.append(f.original_filename)
+            sizes.append(f.size_human_readable)
+            types.append(f.media_type)
+            dt = f.last_modified
+            mtimes.append(
+                _fmt_mtime(dt.year, dt.month, dt.day, dt.hour, dt.minute)
+                if dt
+                else ""
+            )
+            cameras.append(f.metadata.get("camera_model", ""))
+            statuses.append(f.status.value)
+
+        return (names, sizes, types, mtimes, cameras, statuses)
+
+    def set_columns(self, columns) -> None:
+        """構築済みの列リストでモデル内容を一括差し替え"""
+        self.beginResetModel()
+        self._columns = columns
+        self.endResetModel()
+
+    def set_files(self, file_infos) -> None:
+        """ファイルリストからモデル内容を一括再構築"""
+        self.set_columns(self.build_columns(file_infos))
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._columns[0])
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self._HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._columns[index.column()][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self._HEADERS[section]
+        return None
+
+
+class PreviewListModel(QAbstractListModel):
+    """コピープレビュー行を保持するリストモデル
+
+    QLabelへの巨大文字列setTextと違い、ビューは可視行しか描画しない
+    ため、プレビューを件数上限なしで保持できる。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lines = []
+
+    def set_files(self, file_infos):
+        """プレビュー対象のファイル一覧から表示行を作り直す
+
+        Args:
+            file_infos: target_path生成済みのFileInfoのリスト
+        """
+        self.beginResetModel()
+        self._lines = [
+            f"● {fi.original_path}\n   → {fi.target_path}" for fi in file_infos
+        ]
+        self.endResetModel()
+
+    def set_message(self, text: str):
+        """ファイル一覧の代わりに単一メッセージを表示する"""
+        self.beginResetModel()
+        self._lines = [text] if text else []
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._lines)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._lines[index.row()]
+        return None
+
+
+class ScanWorkerThread(QThread):
+    """ディレクトリスキャンをUIスレッド外で実行するワーカースレッド
+
+    再帰スキャンはリムーバブル・ネットワークメディアでは数秒〜数分
+    かかり得るため、GUIスレッドで同期実行するとその間ウィンドウが
+    固まる。結果はシグナルでUIスレッドへ返す。
+    """
+
+    scan_finished = Signal(list, object)
+    scan_failed = Signal(str)
+
+    def __init__(self, file_operations, source_path: str, file_filter, parent=None):
+        super().__init__(parent)
+        self._file_operations = file_operations
+        self._source_path = source_path
+        self._file_filter = file_filter
+
+    def run(self):
+        """スキャンを実行"""
+        try:
+            files = self._file_operations.scan_directory(
+                self._source_path, recursive=True, file_filter=self._file_filter
+            )
+            # 表示文字列の整形（サイズ・日時など）もワーカー側で済ませ、
+            # UIスレッドはモデル差し替えだけを行う
+            columns = FileTableModel.build_columns(files)
+            self.scan_finished.emit(files, columns)
+        except Exception as e:
+            self.scan_failed.emit(str(e))
+
+
+class DetectWorkerThread(QThread):
+    """デバイス列挙をUIスレッド外で実行するワーカースレッド
+
+    USB/MTPの列挙は環境によって数秒ブロックすることがあるため、
+    ポーリングのたびにGUIスレッドで同期実行しない。
+    """
+
+    devices_scanned = Signal(list)
+    scan_failed = Signal(str)
+
+    def __init__(self, device_manager, parent=None):
+        super().__init__(parent)
+        self._device_manager = device_manager
+
+    def run(self):
+        """デバイススキャンを実行"""
+        try:
+            self.devices_scanned.emit(self._device_manager.scan_devices())
+        except Exception as e:
+            self.scan_failed.emit(str(e))
+
+
+class CopyWorkerThread(QThread):
+    """ファイルコピーをUIスレッド外で実行するワーカースレッド
+
+    GUIスレッドでのコピーはprocessEvents()による再入やUI再描画待ちで
+    スループットが落ちる。進捗はシグナルで通知し、Qtがスレッド間で
+    キューイングするためprocessEvents()は不要になる。
+    """
+
+    progress = Signal(int, int, str)
+    copy_finished = Signal(int)
+    copy_failed = Signal(str)
+
+    def __init__(self, file_operations, files, parent=None):
+        super().__init__(parent)
+        self._file_operations = file_operations
+        self._files = files
+
+    def run(self):
+        """コピーを実行"""
+        try:
+            copied_count = self._file_operations.copy_files(
+                self._files,
+                progress_callback=lambda c, t, f: self.progress.emit(c, t, f),
+            )
+            self.copy_finished.emit(copied_count)
+        except Exception as e:
+            self.copy_failed.emit(str(e))
 
 
 class ModernFileManagerWindow(QMainWindow):
@@ -52,10 +402,10 @@ class ModernFileManagerWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # コアコンポーネントの初期化
-        self.config_manager = ConfigManager()
-        self.device_manager = DeviceManager()
-        self.file_operations = FileOperations()
+        # コアコンポーネントは初回アクセス時に生成（下のproperty参照）
+        self._config_manager = None
+        self._device_manager = None
+        self._file_operations = None
 
         # UI状態管理
         self.current_source_path = ""
@@ -66,14 +416,121 @@ class ModernFileManagerWindow(QMainWindow):
 
         # ワーカースレッド
         self.worker_thread = None
+        self._scan_thread = None
+        self._detect_thread = None
+
+        # スキャン・プレビューのたびに作り直す必要のない定型オブジェクト。
+        # プリセットが設定を持つようになったら_preset_changedで差し替える
+        self._default_file_filter = FileFilter({})
+        self._default_folder_elements = [
+            LiteralElement("写真"),
+            MetadataElement("year"),
+            MetadataElement("month"),
+        ]
+        self._default_filename_elements = [OriginalFilenameElement()]
+
+        # フォルダ選択ダイアログ（初回使用時に構築して以後再利用）
+        self._folder_dialog_instance = None
+
+        # デバイスリストの差分更新用: device_id -> QListWidgetItem
+        self._device_items = {}
+
+        # 遅延構築タブのウィジェット（未構築の間はNone）
+        self.log_text = None
+        self.preview_table = None
+        self.dest_path_edit = None
+
+        # ログはリングバッファに溜め、タイマーで一括反映する。コピー中の
+        # 大量メッセージでもウィジェットの再レイアウトは100msに1回で済み、
+        # maxlen超過分は古い行から自動的に捨てられる
+        self._log_buffer = deque(maxlen=5000)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.start(100)
+
+        # デバイス監視タイマー（遅延初期化までNone）
+        self.device_timer = None
 
         self._setup_ui()
         self._setup_connections()
-        self._apply_modern_styling()
-        self._start_device_monitoring()
 
-        # プリセットを読み込み
-        self._load_presets()
+        # 初回描画に必要なのはUI構築とシグナル接続のみ。スタイル適用・
+        # プリセット読み込み・デバイス監視はイベントループに後置して、
+        # ウィンドウを先に描画させる（体感起動時間の短縮）
+        QTimer.singleShot(0, self._apply_modern_styling)
+        QTimer.singleShot(50, self._load_presets)
+        QTimer.singleShot(100, self._start_device_monitoring)
+
+    @property
+    def config_manager(self):
+        """設定マネージャ（初回アクセス時にimport・生成）"""
+        if self._config_manager is None:
+            from ..core.config_manager import ConfigManager
+
+            self._config_manager = ConfigManager()
+        return self._config_manager
+
+    @property
+    def device_manager(self):
+        """デバイスマネージャ（初回アクセス時にimport・生成）"""
+        if self._device_manager is None:
+            from ..core.device_manager import DeviceManager
+
+            self._device_manager = DeviceManager()
+        return self._device_manager
+
+    @property
+    def file_operations(self):
+        """ファイル操作（初回アクセス時にimport・生成）"""
+        if self._file_operations is None:
+            from ..core.file_operations import FileOperations
+
+            self._file_operations = FileOperations()
+        return self._file_operations
+
+    @staticmethod
+    def _mk_button(
+        text,
+        *,
+        clicked=None,
+        tooltip="",
+        checkable=False,
+        checked=False,
+        fixed_size=None,
+        object_name=None,
+    ) -> QPushButton:
+        """
+        QPushButtonを1呼び出しで構築
+
+        各所に散らばっていた生成+プロパティ設定+シグナル接続の定型を
+        まとめ、必要な属性だけを設定する。
+
+        Args:
+            text: ボタンのラベル
+            clicked: clickedシグナルへ接続するスロット
+            tooltip: ツールチップ文字列
+            checkable: トグルボタンにするか
+            checked: 初期チェック状態
+            fixed_size: (幅, 高さ)の固定サイズ
+            object_name: スタイルシート用のobjectName
+
+        Returns:
+            構築済みのQPushButton
+        """
+        btn = QPushButton(text)
+        if clicked is not None:
+            btn.clicked.connect(clicked)
+        if tooltip:
+            btn.setToolTip(tooltip)
+        if checkable:
+            btn.setCheckable(True)
+            if checked:
+                btn.setChecked(True)
+        if fixed_size is not None:
+            btn.setFixedSize(*fixed_size)
+        if object_name is not None:
+            btn.setObjectName(object_name)
+        return btn
 
     def _setup_ui(self):
         """モダンなUIレイアウトを設定"""
@@ -111,16 +568,9 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_sidebar(self) -> QWidget:
         """サイドバーを作成（デバイス・プリセット・お気に入り）"""
         sidebar = QFrame()
+        sidebar.setObjectName("sidebar")
         sidebar.setFixedWidth(280)
         sidebar.setFrameStyle(QFrame.Shape.StyledPanel)
-        sidebar.setStyleSheet(
-            """
-            QFrame {
-                background-color: #2d2d30;
-                border-right: 1px solid #3e3e42;
-            }
-        """
-        )
 
         layout = QVBoxLayout(sidebar)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -145,20 +595,21 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_source_section(self) -> QWidget:
         """ソース選択セクションを作成"""
         section = QGroupBox("ソース")
-        section.setStyleSheet(self._get_groupbox_style())
+        section.setStyleSheet(_GROUPBOX_QSS)
 
         layout = QVBoxLayout(section)
         layout.setSpacing(8)
 
         # フォルダ選択
-        folder_btn = QPushButton("📁 フォルダを選択")
-        folder_btn.clicked.connect(self._browse_source_folder)
+        folder_btn = self._mk_button(
+            "📁 フォルダを選択", clicked=self._browse_source_folder
+        )
         layout.addWidget(folder_btn)
 
         # 選択されたパス表示
         self.source_path_label = QLabel("未選択")
+        self.source_path_label.setObjectName("sourcePathLabel")
         self.source_path_label.setWordWrap(True)
-        self.source_path_label.setStyleSheet("color: #cccccc; font-size: 11px;")
         layout.addWidget(self.source_path_label)
 
         return section
@@ -166,36 +617,19 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_devices_section(self) -> QWidget:
         """デバイスセクションを作成"""
         section = QGroupBox("接続デバイス")
-        section.setStyleSheet(self._get_groupbox_style())
+        section.setStyleSheet(_GROUPBOX_QSS)
 
         layout = QVBoxLayout(section)
         layout.setSpacing(8)
 
         # デバイス検出ボタン
-        detect_btn = QPushButton("🔍 デバイス検出")
-        detect_btn.clicked.connect(self._detect_devices)
+        detect_btn = self._mk_button("🔍 デバイス検出", clicked=self._detect_devices)
         layout.addWidget(detect_btn)
 
         # デバイスリスト
         self.device_list = QListWidget()
+        self.device_list.setObjectName("deviceList")
         self.device_list.setMaximumHeight(120)
-        self.device_list.setStyleSheet(
-            """
-            QListWidget {
-                background-color: #1e1e1e;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                color: #ffffff;
-            }
-            QListWidget::item {
-                padding: 6px;
-                border-bottom: 1px solid #3e3e42;
-            }
-            QListWidget::item:selected {
-                background-color: #0e639c;
-            }
-        """
-        )
         layout.addWidget(self.device_list)
 
         return section
@@ -203,27 +637,23 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_presets_section(self) -> QWidget:
         """プリセットセクションを作成"""
         section = QGroupBox("プリセット")
-        section.setStyleSheet(self._get_groupbox_style())
+        section.setStyleSheet(_GROUPBOX_QSS)
 
         layout = QVBoxLayout(section)
         layout.setSpacing(8)
 
         # プリセット選択
         self.preset_combo = QComboBox()
-        self.preset_combo.addItems(
-            ["デフォルト", "旅行写真", "イベント動画", "RAW写真"]
-        )
+        self.preset_combo.addItems(_PRESET_NAMES)
         layout.addWidget(self.preset_combo)
 
         # プリセット管理ボタン
         preset_buttons = QHBoxLayout()
 
-        new_preset_btn = QPushButton("新規")
-        new_preset_btn.clicked.connect(self._create_new_preset)
+        new_preset_btn = self._mk_button("新規", clicked=self._create_new_preset)
         preset_buttons.addWidget(new_preset_btn)
 
-        edit_preset_btn = QPushButton("編集")
-        edit_preset_btn.clicked.connect(self._edit_preset)
+        edit_preset_btn = self._mk_button("編集", clicked=self._edit_preset)
         preset_buttons.addWidget(edit_preset_btn)
 
         layout.addLayout(preset_buttons)
@@ -243,45 +673,25 @@ class ModernFileManagerWindow(QMainWindow):
 
         # 中央：メインコンテンツ（タブベース）
         self.main_tabs = QTabWidget()
+        self.main_tabs.setObjectName("mainTabs")
         self.main_tabs.setTabPosition(QTabWidget.TabPosition.North)
-        self.main_tabs.setStyleSheet(
-            """
-            QTabWidget::pane {
-                border: 1px solid #3e3e42;
-                background-color: #1e1e1e;
-            }
-            QTabBar::tab {
-                background-color: #2d2d30;
-                color: #ffffff;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #0e639c;
-            }
-            QTabBar::tab:hover {
-                background-color: #3e3e42;
-            }
-        """
-        )
 
-        # ファイルブラウザタブ
+        # ファイルブラウザタブ（初期表示されるタブのみ即時構築）
         file_browser_tab = self._create_file_browser_tab()
         self.main_tabs.addTab(file_browser_tab, "📁 ファイルブラウザ")
 
-        # 設定タブ
-        settings_tab = self._create_settings_tab()
-        self.main_tabs.addTab(settings_tab, "⚙️ 設定")
-
-        # プレビュータブ
-        preview_tab = self._create_preview_tab()
-        self.main_tabs.addTab(preview_tab, "👁️ プレビュー")
-
-        # ログタブ
-        log_tab = self._create_log_tab()
-        self.main_tabs.addTab(log_tab, "📋 ログ")
+        # 非表示タブは初回アクティブ化まで構築を遅延する。数十個の
+        # QGroupBox/QTableWidget等の生成・polish・レイアウトパスを
+        # 初回描画の前から排除し、見ないタブのコストをゼロにする
+        self._tab_factories = {
+            1: (self._create_settings_tab, "⚙️ 設定"),
+            2: (self._create_preview_tab, "👁️ プレビュー"),
+            3: (self._create_log_tab, "📋 ログ"),
+        }
+        self._tabs_built = {0}
+        for _, label in self._tab_factories.values():
+            self.main_tabs.addTab(QWidget(), label)
+        self.main_tabs.currentChanged.connect(self._build_tab_on_demand)
 
         layout.addWidget(self.main_tabs)
 
@@ -291,18 +701,23 @@ class ModernFileManagerWindow(QMainWindow):
 
         return content_widget
 
+    def _build_tab_on_demand(self, index: int):
+        """タブの初回アクティブ化時に実体ウィジェットを構築"""
+        if index in self._tabs_built:
+            return
+        self._tabs_built.add(index)
+
+        factory, label = self._tab_factories[index]
+        widget = factory()
+        self.main_tabs.removeTab(index)
+        self.main_tabs.insertTab(index, widget, label)
+        self.main_tabs.setCurrentIndex(index)
+
     def _create_navigation_area(self) -> QWidget:
         """ナビゲーション＆コントロールエリアを作成"""
         nav_widget = QFrame()
+        nav_widget.setObjectName("navBar")
         nav_widget.setFrameStyle(QFrame.Shape.StyledPanel)
-        nav_widget.setStyleSheet(
-            """
-            QFrame {
-                background-color: #3c3c3c;
-                border-bottom: 1px solid #3e3e42;
-            }
-        """
-        )
         nav_widget.setFixedHeight(60)
 
         layout = QHBoxLayout(nav_widget)
@@ -310,7 +725,7 @@ class ModernFileManagerWindow(QMainWindow):
 
         # パンくずリスト
         breadcrumb_label = QLabel("ホーム > ドキュメント > 写真")
-        breadcrumb_label.setStyleSheet("color: #ffffff; font-size: 12px;")
+        breadcrumb_label.setObjectName("breadcrumbLabel")
         layout.addWidget(breadcrumb_label)
 
         layout.addStretch()
@@ -318,34 +733,21 @@ class ModernFileManagerWindow(QMainWindow):
         # 表示切り替えボタン
         view_group = QButtonGroup()
 
-        list_view_btn = QPushButton("📋")
-        list_view_btn.setCheckable(True)
-        list_view_btn.setChecked(True)
-        list_view_btn.setToolTip("リスト表示")
+        list_view_btn = self._mk_button(
+            "📋", tooltip="リスト表示", checkable=True, checked=True
+        )
         view_group.addButton(list_view_btn)
         layout.addWidget(list_view_btn)
 
-        grid_view_btn = QPushButton("⊞")
-        grid_view_btn.setCheckable(True)
-        grid_view_btn.setToolTip("グリッド表示")
+        grid_view_btn = self._mk_button("⊞", tooltip="グリッド表示", checkable=True)
         view_group.addButton(grid_view_btn)
         layout.addWidget(grid_view_btn)
 
         # 検索フィールド
         search_field = QLineEdit()
+        search_field.setObjectName("searchField")
         search_field.setPlaceholderText("ファイルを検索...")
         search_field.setFixedWidth(200)
-        search_field.setStyleSheet(
-            """
-            QLineEdit {
-                padding: 4px 8px;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-        """
-        )
         layout.addWidget(search_field)
 
         return nav_widget
@@ -374,40 +776,22 @@ class ModernFileManagerWindow(QMainWindow):
         layout = QVBoxLayout(area_widget)
         layout.setContentsMargins(8, 8, 8, 8)
 
-        # ファイルテーブル
-        self.file_table = QTableWidget()
-        self.file_table.setColumnCount(6)
-        self.file_table.setHorizontalHeaderLabels(
-            ["名前", "サイズ", "タイプ", "更新日時", "カメラ", "状態"]
-        )
+        # ファイルテーブル（モデル/ビュー構成。セルごとのアイテム生成を
+        # せず、可視範囲のみ描画される）
+        self.file_model = FileTableModel(self)
+        self.file_table = QTableView()
+        self.file_table.setObjectName("dataTable")
+        self.file_table.setModel(self.file_model)
 
-        # テーブルの設定
+        # テーブルの設定。ResizeToContentsは行挿入のたびに全行を再計測
+        # するため使わず、一括投入後にresizeColumnsToContentsを1回呼ぶ
         header = self.file_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+        for col in range(1, 6):
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.Interactive)
 
-        self.file_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.file_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.file_table.setAlternatingRowColors(True)
-        self.file_table.setStyleSheet(
-            """
-            QTableWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                gridline-color: #3e3e42;
-                selection-background-color: #0e639c;
-            }
-            QHeaderView::section {
-                background-color: #2d2d30;
-                color: #ffffff;
-                padding: 6px;
-                border: 1px solid #3e3e42;
-            }
-        """
-        )
 
         layout.addWidget(self.file_table)
 
@@ -416,63 +800,37 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_file_preview_area(self) -> QWidget:
         """ファイルプレビューエリアを作成"""
         preview_widget = QFrame()
+        preview_widget.setObjectName("previewPanel")
         preview_widget.setFrameStyle(QFrame.Shape.StyledPanel)
-        preview_widget.setStyleSheet(
-            """
-            QFrame {
-                background-color: #2d2d30;
-                border: 1px solid #3e3e42;
-            }
-        """
-        )
 
         layout = QVBoxLayout(preview_widget)
         layout.setContentsMargins(8, 8, 8, 8)
 
         # プレビューラベル
         preview_title = QLabel("ファイルプレビュー")
-        preview_title.setStyleSheet(
-            "color: #ffffff; font-weight: bold; font-size: 14px;"
-        )
+        preview_title.setObjectName("previewTitle")
         layout.addWidget(preview_title)
 
-        # プレビュー画像エリア
-        self.preview_label = QLabel()
-        self.preview_label.setMinimumHeight(200)
-        self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.preview_label.setStyleSheet(
-            """
-            QLabel {
-                border: 1px solid #3e3e42;
-                background-color: #1e1e1e;
-                color: #cccccc;
-            }
-        """
-        )
-        self.preview_label.setText("ファイルを選択してください")
-        layout.addWidget(self.preview_label)
+        # プレビュー表示エリア（モデル/ビュー構成。可視行のみ描画される
+        # ため、プレビュー件数を20件などに切り詰める必要がない）
+        self._preview_model = PreviewListModel(self)
+        self.preview_list = QListView()
+        self.preview_list.setObjectName("previewList")
+        self.preview_list.setModel(self._preview_model)
+        self.preview_list.setMinimumHeight(200)
+        self.preview_list.setWordWrap(True)
+        self._preview_model.set_message("ファイルを選択してください")
+        layout.addWidget(self.preview_list)
 
         # メタデータ表示
         metadata_title = QLabel("メタデータ")
-        metadata_title.setStyleSheet(
-            "color: #ffffff; font-weight: bold; font-size: 12px; margin-top: 16px;"
-        )
+        metadata_title.setObjectName("metadataTitle")
         layout.addWidget(metadata_title)
 
         self.metadata_text = QTextEdit()
+        self.metadata_text.setObjectName("metadataText")
         self.metadata_text.setMaximumHeight(150)
         self.metadata_text.setReadOnly(True)
-        self.metadata_text.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3e3e42;
-                font-family: 'Consolas', monospace;
-                font-size: 10px;
-            }
-        """
-        )
         layout.addWidget(self.metadata_text)
 
         layout.addStretch()
@@ -519,7 +877,7 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_destination_settings(self) -> QGroupBox:
         """コピー先設定グループを作成"""
         group = QGroupBox("コピー先設定")
-        group.setStyleSheet(self._get_groupbox_style())
+        group.setStyleSheet(_GROUPBOX_QSS)
 
         layout = QVBoxLayout(group)
         layout.setSpacing(12)
@@ -530,10 +888,14 @@ class ModernFileManagerWindow(QMainWindow):
 
         self.dest_path_edit = QLineEdit()
         self.dest_path_edit.setPlaceholderText("コピー先フォルダを選択してください")
+        # タブ構築前に選択・適用されたコピー先を反映
+        if self.current_destination_path:
+            self.dest_path_edit.setText(self.current_destination_path)
         dest_layout.addWidget(self.dest_path_edit)
 
-        dest_browse_btn = QPushButton("参照...")
-        dest_browse_btn.clicked.connect(self._browse_destination_folder)
+        dest_browse_btn = self._mk_button(
+            "参照...", clicked=self._browse_destination_folder
+        )
         dest_layout.addWidget(dest_browse_btn)
 
         layout.addLayout(dest_layout)
@@ -543,7 +905,7 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_folder_structure_settings(self) -> QGroupBox:
         """フォルダ構造設定グループを作成"""
         group = QGroupBox("フォルダ構造設定")
-        group.setStyleSheet(self._get_groupbox_style())
+        group.setStyleSheet(_GROUPBOX_QSS)
 
         layout = QVBoxLayout(group)
         layout.setSpacing(12)
@@ -553,14 +915,7 @@ class ModernFileManagerWindow(QMainWindow):
         preset_layout.addWidget(QLabel("プリセット:"))
 
         folder_preset_combo = QComboBox()
-        folder_preset_combo.addItems(
-            [
-                "{撮影年}/{撮影月}/{撮影日}",
-                "{カメラモデル}/{撮影年}-{撮影月}",
-                "{撮影年}/{GPS国}/{GPS都道府県}",
-                "カスタム...",
-            ]
-        )
+        folder_preset_combo.addItems(_FOLDER_PRESET_PATTERNS)
         preset_layout.addWidget(folder_preset_combo)
 
         layout.addLayout(preset_layout)
@@ -577,7 +932,7 @@ class ModernFileManagerWindow(QMainWindow):
 
         # プレビュー
         preview_label = QLabel("プレビュー: 写真/2023/10/27")
-        preview_label.setStyleSheet("color: #0e639c; font-style: italic;")
+        preview_label.setObjectName("patternPreviewLabel")
         layout.addWidget(preview_label)
 
         return group
@@ -585,7 +940,7 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_filename_settings(self) -> QGroupBox:
         """ファイル名設定グループを作成"""
         group = QGroupBox("ファイル名設定")
-        group.setStyleSheet(self._get_groupbox_style())
+        group.setStyleSheet(_GROUPBOX_QSS)
 
         layout = QVBoxLayout(group)
         layout.setSpacing(12)
@@ -599,14 +954,7 @@ class ModernFileManagerWindow(QMainWindow):
         pattern_layout.addWidget(QLabel("命名規則:"))
 
         filename_pattern_combo = QComboBox()
-        filename_pattern_combo.addItems(
-            [
-                "{撮影年月日}_{時分秒}_{連番3桁}",
-                "{カメラモデル}_{撮影年月日}_{元のファイル名}",
-                "{元のファイル名}",
-                "カスタム...",
-            ]
-        )
+        filename_pattern_combo.addItems(_FILENAME_PATTERNS)
         pattern_layout.addWidget(filename_pattern_combo)
 
         layout.addLayout(pattern_layout)
@@ -616,7 +964,7 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_duplicate_settings(self) -> QGroupBox:
         """重複処理設定グループを作成"""
         group = QGroupBox("重複ファイル処理")
-        group.setStyleSheet(self._get_groupbox_style())
+        group.setStyleSheet(_GROUPBOX_QSS)
 
         layout = QVBoxLayout(group)
         layout.setSpacing(8)
@@ -646,32 +994,42 @@ class ModernFileManagerWindow(QMainWindow):
         # プレビューコントロール
         control_layout = QHBoxLayout()
 
-        scan_btn = QPushButton("🔍 ファイルをスキャン")
-        scan_btn.clicked.connect(self._scan_files)
+        scan_btn = self._mk_button(
+            "🔍 ファイルをスキャン", clicked=self._scan_files
+        )
         control_layout.addWidget(scan_btn)
 
         control_layout.addStretch()
 
-        refresh_btn = QPushButton("🔄 更新")
+        refresh_btn = self._mk_button("🔄 更新")
         control_layout.addWidget(refresh_btn)
 
         layout.addLayout(control_layout)
 
         # プレビューテーブル
         self.preview_table = QTableWidget()
+        # ファイルテーブルとスタイルを共有（アプリQSSの#dataTableで解決。
+        # styleSheet()の往復コピーはパース済みスタイルの再パースになる）
+        self.preview_table.setObjectName("dataTable")
         self.preview_table.setColumnCount(5)
         self.preview_table.setHorizontalHeaderLabels(
             ["ソースパス", "コピー先パス", "サイズ", "操作", "状態"]
         )
+        # 空セルの暗黙生成にも表示専用フラグ済みプロトタイプを使わせる
+        proto = QTableWidgetItem()
+        proto.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
+        self.preview_table.setItemPrototype(proto)
 
-        # テーブルスタイリング
-        self.preview_table.setStyleSheet(self.file_table.styleSheet())
         header = self.preview_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
 
         layout.addWidget(self.preview_table)
 
+        # タブ構築前に生成済みのプレビューがあれば反映する
+        if self.preview_files:
+            self._populate_preview_table()
+
         return tab_widget
 
     def _create_log_tab(self) -> QWidget:
@@ -683,34 +1041,26 @@ class ModernFileManagerWindow(QMainWindow):
         # ログコントロール
         control_layout = QHBoxLayout()
 
-        clear_btn = QPushButton("🗑️ ログをクリア")
-        clear_btn.clicked.connect(self._clear_log)
+        clear_btn = self._mk_button("🗑️ ログをクリア", clicked=self._clear_log)
         control_layout.addWidget(clear_btn)
 
         control_layout.addStretch()
 
         log_level_combo = QComboBox()
-        log_level_combo.addItems(["Debug", "Info", "Warning", "Error"])
+        log_level_combo.addItems(_LOG_LEVELS)
         log_level_combo.setCurrentText("Info")
         control_layout.addWidget(QLabel("ログレベル:"))
         control_layout.addWidget(log_level_combo)
 
         layout.addLayout(control_layout)
 
-        # ログ表示エリア
-        self.log_text = QTextEdit()
+        # ログ表示エリア。リッチテキスト描画が不要なログには
+        # QPlainTextEditの方が追記・保持コストともに軽い
+        self.log_text = QPlainTextEdit()
+        self.log_text.setObjectName("logText")
         self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 1px solid #3e3e42;
-                font-family: 'Consolas', monospace;
-                font-size: 11px;
-            }
-        """
-        )
+        # 古いブロックを自動破棄してドキュメントの肥大化を防ぐ
+        self.log_text.setMaximumBlockCount(10000)
         layout.addWidget(self.log_text)
 
         return tab_widget
@@ -718,15 +1068,8 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_bottom_area(self) -> QWidget:
         """下部エリア（進捗バー＆アクションボタン）を作成"""
         bottom_widget = QFrame()
+        bottom_widget.setObjectName("bottomBar")
         bottom_widget.setFrameStyle(QFrame.Shape.StyledPanel)
-        bottom_widget.setStyleSheet(
-            """
-            QFrame {
-                background-color: #3c3c3c;
-                border-top: 1px solid #3e3e42;
-            }
-        """
-        )
         bottom_widget.setFixedHeight(80)
 
         layout = QHBoxLayout(bottom_widget)
@@ -736,26 +1079,11 @@ class ModernFileManagerWindow(QMainWindow):
         progress_layout = QVBoxLayout()
 
         self.progress_label = QLabel("準備完了")
-        self.progress_label.setStyleSheet("color: #ffffff; font-size: 12px;")
+        self.progress_label.setObjectName("progressLabel")
         progress_layout.addWidget(self.progress_label)
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet(
-            """
-            QProgressBar {
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QProgressBar::chunk {
-                background-color: #0e639c;
-                border-radius: 3px;
-            }
-        """
-        )
         progress_layout.addWidget(self.progress_bar)
 
         layout.addLayout(progress_layout)
@@ -766,31 +1094,19 @@ class ModernFileManagerWindow(QMainWindow):
         button_layout = QHBoxLayout()
         button_layout.setSpacing(12)
 
-        self.preview_btn = QPushButton("👁️ プレビュー")
-        self.preview_btn.setFixedSize(120, 36)
-        self.preview_btn.clicked.connect(self._preview_operation)
+        self.preview_btn = self._mk_button(
+            "👁️ プレビュー",
+            clicked=self._preview_operation,
+            fixed_size=(120, 36),
+        )
         button_layout.addWidget(self.preview_btn)
 
-        self.copy_btn = QPushButton("📋 コピー開始")
-        self.copy_btn.setFixedSize(120, 36)
-        self.copy_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0e639c;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1177bb;
-            }
-            QPushButton:pressed {
-                background-color: #0a4d7a;
-            }
-        """
+        self.copy_btn = self._mk_button(
+            "📋 コピー開始",
+            clicked=self._start_copy_operation,
+            fixed_size=(120, 36),
+            object_name="primaryBtn",
         )
-        self.copy_btn.clicked.connect(self._start_copy_operation)
         button_layout.addWidget(self.copy_btn)
 
         layout.addLayout(button_layout)
@@ -801,24 +1117,6 @@ class ModernFileManagerWindow(QMainWindow):
         """ツールバーを作成"""
         toolbar = QToolBar()
         toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
-        toolbar.setStyleSheet(
-            """
-            QToolBar {
-                background-color: #2d2d30;
-                border: none;
-                spacing: 8px;
-            }
-            QToolButton {
-                color: #ffffff;
-                padding: 8px;
-                border: none;
-            }
-            QToolButton:hover {
-                background-color: #3e3e42;
-                border-radius: 4px;
-            }
-        """
-        )
 
         # ツールバーアクション
         new_action = QAction("📁", self)
@@ -853,21 +1151,6 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_menu_bar(self):
         """メニューバーを作成"""
         menubar = self.menuBar()
-        menubar.setStyleSheet(
-            """
-            QMenuBar {
-                background-color: #2d2d30;
-                color: #ffffff;
-                border-bottom: 1px solid #3e3e42;
-            }
-            QMenuBar::item {
-                padding: 4px 8px;
-            }
-            QMenuBar::item:selected {
-                background-color: #3e3e42;
-            }
-        """
-        )
 
         # ファイルメニュー
         file_menu = menubar.addMenu("ファイル(&F)")
@@ -902,22 +1185,13 @@ class ModernFileManagerWindow(QMainWindow):
     def _create_status_bar(self):
         """ステータスバーを作成"""
         status_bar = QStatusBar()
-        status_bar.setStyleSheet(
-            """
-            QStatusBar {
-                background-color: #2d2d30;
-                color: #ffffff;
-                border-top: 1px solid #3e3e42;
-            }
-        """
-        )
 
         # 左側：一般的なステータス
         status_bar.showMessage("準備完了")
 
         # 右側：追加情報
         self.status_files_label = QLabel("ファイル数: 0")
-        self.status_files_label.setStyleSheet("margin-right: 8px;")
+        self.status_files_label.setObjectName("statusFilesLabel")
         status_bar.addPermanentWidget(self.status_files_label)
 
         self.status_size_label = QLabel("合計サイズ: 0 B")
@@ -925,86 +1199,18 @@ class ModernFileManagerWindow(QMainWindow):
 
         self.setStatusBar(status_bar)
 
-    def _get_groupbox_style(self) -> str:
-        """GroupBox共通スタイルを取得"""
-        return """
-            QGroupBox {
-                font-weight: bold;
-                font-size: 14px;
-                color: #ffffff;
-                border: 1px solid #3e3e42;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """
-
     def _apply_modern_styling(self):
         """モダンなスタイリングを適用"""
-        # ダークテーマの適用
-        self.setStyleSheet(
-            """
-            QMainWindow {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                padding: 6px 12px;
-                min-height: 24px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-            QComboBox {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                padding: 4px 8px;
-                min-height: 20px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QLineEdit {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                padding: 4px 8px;
-                min-height: 20px;
-            }
-            QLineEdit:focus {
-                border-color: #0e639c;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QCheckBox {
-                color: #ffffff;
-            }
-            QRadioButton {
-                color: #ffffff;
-            }
-        """
-        )
+        # 統合済みのアプリ全体スタイルシートを1回だけ適用する。
+        # CSSのパースとウィジェットツリーのpolishがここで各1回に集約される
+        QApplication.instance().setStyleSheet(_APP_QSS)
 
     def _setup_connections(self):
         """シグナル・スロット接続を設定"""
         # ファイルテーブルの選択変更
-        self.file_table.itemSelectionChanged.connect(self._file_selection_changed)
+        self.file_table.selectionModel().selectionChanged.connect(
+            self._file_selection_changed
+        )
 
         # プリセット選択変更
         self.preset_combo.currentTextChanged.connect(self._preset_changed)
@@ -1014,15 +1220,76 @@ class ModernFileManagerWindow(QMainWindow):
 
     def _start_device_monitoring(self):
         """デバイス監視を開始"""
-        # デバイス監視タイマー
+        # マウントポイントを監視できる環境ではOSのファイルシステム通知で
+        # 検出を起動し、ポーリングは60秒間隔の安全網に落とす。
+        # （udev/WM_DEVICECHANGE直結はプラットフォーム依存の追加パッケージ
+        # が必要になるため、Qt標準のwatcherで代替している）
+        self._mount_watcher = None
+        watch_dirs = [
+            d
+            for d in ("/Volumes", "/media", "/run/media", "/mnt")
+            if os.path.isdir(d)
+        ]
+        if watch_dirs:
+            self._mount_watcher = QFileSystemWatcher(watch_dirs, self)
+            self._mount_watcher.directoryChanged.connect(self._on_mount_change)
+
+        # デバイス監視タイマー（適応ポーリング）。接続状況に変化が
+        # ない間は間隔を指数的に60秒まで伸ばし、変化を検出したら
+        # 2秒に戻す。push通知が使える環境では安全網として残す
         self.device_timer = QTimer()
         self.device_timer.timeout.connect(self._detect_devices)
-        self.device_timer.start(5000)  # 5秒間隔
+        self.device_timer.start(
+            _DEVICE_POLL_MAX_MS if self._mount_watcher else _DEVICE_POLL_MIN_MS
+        )
+
+    def _on_mount_change(self, path: str):
+        """マウントポイント変化の通知を受けて即時にデバイスを検出"""
+        self._detect_devices()
+
+    def changeEvent(self, event):
+        """最小化中はデバイスポーリングを停止する"""
+        if event.type() == QEvent.Type.WindowStateChange and self.device_timer:
+            if self.windowState() & Qt.WindowState.WindowMinimized:
+                self.device_timer.stop()
+            elif not self.device_timer.isActive():
+                self.device_timer.setInterval(_DEVICE_POLL_MIN_MS)
+                self.device_timer.start()
+        super().changeEvent(event)
 
     # イベントハンドラメソッド
+    def _select_folder(self, title: str) -> str:
+        """
+        フォルダ選択ダイアログを表示
+
+        静的メソッド版（getExistingDirectory）はクリックのたびにダイアログと
+        ファイルシステムモデルを作り直し、環境によってはシェル名前空間の
+        列挙で数秒止まる。1つのQFileDialogを保持して使い回すことで、
+        2回目以降は列挙済みの状態から開く。
+
+        Args:
+            title: ダイアログのタイトル
+
+        Returns:
+            選択されたフォルダパス、キャンセル時は空文字列
+        """
+        dialog = self._folder_dialog_instance
+        if dialog is None:
+            dialog = QFileDialog(self)
+            dialog.setFileMode(QFileDialog.FileMode.Directory)
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            self._folder_dialog_instance = dialog
+
+        dialog.setWindowTitle(title)
+        if dialog.exec():
+            selected = dialog.selectedFiles()
+            if selected:
+                return selected[0]
+        return ""
+
     def _browse_source_folder(self):
         """ソースフォルダを参照"""
-        folder = QFileDialog.getExistingDirectory(self, "ソースフォルダを選択")
+        folder = self._select_folder("ソースフォルダを選択")
         if folder:
             self.current_source_path = folder
             self.source_path_label.setText(folder)
@@ -1030,71 +1297,132 @@ class ModernFileManagerWindow(QMainWindow):
 
     def _browse_destination_folder(self):
         """コピー先フォルダを参照"""
-        folder = QFileDialog.getExistingDirectory(self, "コピー先フォルダを選択")
+        folder = self._select_folder("コピー先フォルダを選択")
         if folder:
             self.current_destination_path = folder
             self.dest_path_edit.setText(folder)
             self._log_message(f"コピー先フォルダを選択: {folder}")
 
     def _detect_devices(self):
-        """デバイス検出"""
-        try:
-            # 実際にデバイスをスキャンする
-            devices = self.device_manager.scan_devices()
-            self.connected_devices = devices
+        """デバイス検出（列挙はワーカースレッドで実行）"""
+        # 前回の列挙がまだ走っている間は新たに起動しない（再入防止）
+        if self._detect_thread is not None and self._detect_thread.isRunning():
+            return
+
+        self._detect_thread = DetectWorkerThread(self.device_manager, self)
+        self._detect_thread.devices_scanned.connect(self._on_devices_scanned)
+        self._detect_thread.scan_failed.connect(self._on_device_scan_failed)
+        self._detect_thread.start()
+
+    def _on_devices_scanned(self, devices):
+        """デバイス列挙完了時の処理"""
+        changed = [
+            (d.device_id, d.connection_status) for d in devices
+        ] != [
+            (d.device_id, d.connection_status) for d in self.connected_devices
+        ]
+        self.connected_devices = devices
+        self._detect_thread = None
+
+        if changed:
             self._update_device_list()
             self._log_message(f"デバイス検出完了: {len(devices)}台発見")
-        except Exception as e:
-            self._log_message(f"デバイス検出エラー: {str(e)}")
-
-    def _update_device_list(self):
-        """デバイスリストを更新"""
-        self.device_list.clear()
-        for device in self.connected_devices:
-            item_text = f"{device.display_name} ({device.device_type.value})"
-            if device.connection_status == ConnectionStatus.CONNECTED:
-                item_text += " ✅"
-            elif device.connection_status == ConnectionStatus.AUTHENTICATING:
-                item_text += " 🔒"
-            elif device.connection_status == ConnectionStatus.AUTHORIZATION_REQUIRED:
-                item_text += " 🔐"
-            elif device.connection_status == ConnectionStatus.ERROR:
-                item_text += " ❌"
-            else:
-                item_text += " ❓"
-
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, device)  # デバイス情報をアイテムに保存
-            self.device_list.addItem(item)
-
-    def _update_file_list(self):
-        """ファイルリストを更新"""
-        self.file_table.setRowCount(0)
+            if self.device_timer:
+                self.device_timer.setInterval(_DEVICE_POLL_MIN_MS)
+        elif self.device_timer:
+            # 変化なし: ポーリング間隔をバックオフ
+            self.device_timer.setInterval(
+                min(self.device_timer.interval() * 2, _DEVICE_POLL_MAX_MS)
+            )
 
-        if not self.selected_files:
-            return
+    def _on_device_scan_failed(self, message: str):
+        """デバイス列挙失敗時の処理"""
+        self._detect_thread = None
+        self._log_message(f"デバイス検出エラー: {message}")
 
-        self.file_table.setRowCount(len(self.selected_files))
+    @staticmethod
+    def _device_item_text(device: DeviceInfo) -> str:
+        """デバイスリストの表示テキストを生成"""
+        suffix = _STATUS_SUFFIX.get(device.connection_status, " ❓")
+        return f"{device.display_name} ({device.device_type.value}){suffix}"
 
-        for row, file_info in enumerate(self.selected_files):
-            # ファイル名
-            filename_item = QTableWidgetItem(file_info.original_filename)
-            self.file_table.setItem(row, 0, filename_item)
+    def _update_device_list(self):
+        """デバイスリストを差分更新"""
+        # clear+再構築はアイテムの破棄・再生成と全面再描画を毎回伴う。
+        # device_idで既存アイテムを追跡し、実際に増減・変化した分だけ
+        # 追加・削除・テキスト更新する（選択状態も自然に維持される）
+        devices_by_id = {d.device_id: d for d in self.connected_devices}
+
+        self.device_list.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.device_list)
+        try:
+            for device_id in [
+                did for did in self._device_items if did not in devices_by_id
+            ]:
+                item = self._device_items.pop(device_id)
+                self.device_list.takeItem(self.device_list.row(item))
+
+            for device_id, device in devices_by_id.items():
+                text = self._device_item_text(device)
+                item = self._device_items.get(device_id)
+                if item is None:
+                    item = QListWidgetItem(text)
+                    self._device_items[device_id] = item
+                    self.device_list.addItem(item)
+                elif item.text() != text:
+                    item.setText(text)
+                item.setData(Qt.UserRole, device)  # デバイス情報をアイテムに保存
+        finally:
+            del blocker
+            self.device_list.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _populate_table(table: QTableWidget, rows) -> None:
+        """
+        テーブルへ行を一括投入
 
-            # ファイルサイズ
-            size_item = QTableWidgetItem(file_info.size_human_readable)
-            self.file_table.setItem(row, 1, size_item)
+        更新・ソート・シグナルを止めてから埋めることで、setItemごとの
+        レイアウト無効化・再ソート・再描画（N行でO(N^2)相当）を防ぎ、
+        反映を最後の1回にまとめる。
 
-            # ファイルタイプ
-            type_item = QTableWidgetItem(file_info.media_type)
-            self.file_table.setItem(row, 2, type_item)
+        Args:
+            table: 対象のQTableWidget
+            rows: 各行のセル文字列のシーケンス
+        """
+        # フラグ計算済みのプロトタイプをclone()して使う。
+        # コンストラクタ経由の生成よりセルあたりの初期化コストが小さく、
+        # 表示専用セルの編集フラグも1回だけ落とせばよい
+        proto = QTableWidgetItem()
+        proto.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
+
+        table.setUpdatesEnabled(False)
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(rows))
+            set_item = table.setItem
+            clone = proto.clone
+            for i, row in enumerate(rows):
+                for j, text in enumerate(row):
+                    item = clone()
+                    item.setText(text)
+                    set_item(i, j, item)
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
+
+        # 列幅の再計測は一括投入後の1回だけ（先頭列はStretchのまま）
+        table.resizeColumnsToContents()
 
-            # 更新日時
-            modified_text = ""
-            if file_info.last_modified:
-                modified_text = file_info.last_modified.strftime("%Y/%m/%d %H:%M")
-            modified_item = QTableWidgetItem(modified_text)
-            self.file_table.setItem(row, 3, modified_item)
+    def _update_file_list(self):
+        """ファイルリストを更新"""
+        # モデルリセットに伴う選択クリアで選択変更ハンドラ
+        # （プレビュー再計算）が走らないようにする
+        with QSignalBlocker(self.file_table.selectionModel()):
+            self.file_model.set_files(self.selected_files)
+        self.file_table.resizeColumnsToContents()
 
     def _scan_files(self):
         """ファイルをスキャン"""
@@ -1102,39 +1430,54 @@ class ModernFileManagerWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "ソースフォルダを選択してください")
             return
 
-        self._log_message("ファイルスキャンを開始...")
+        # 多重スキャンを防ぐ
+        if self._scan_thread is not None and self._scan_thread.isRunning():
+            return
 
-        try:
-            # プログレスバーを表示
-            self.progress_bar.setVisible(True)
-            self.progress_label.setText("ファイルをスキャン中...")
+        self._log_message("ファイルスキャンを開始...")
 
-            # ファイルをスキャン
-            from ..core.file_filter import FileFilter
+        # プログレスバーを表示
+        self.progress_bar.setVisible(True)
+        self.progress_label.setText("ファイルをスキャン中...")
 
-            file_filter = FileFilter()  # デフォルトフィルタ
+        # スキャンはワーカースレッドで実行し、UIスレッドを塞がない。
+        # 結果・エラーはシグナル経由で受け取る
+        self._scan_thread = ScanWorkerThread(
+            self.file_operations,
+            self.current_source_path,
+            self._default_file_filter,
+            self,
+        )
+        self._scan_thread.scan_finished.connect(self._on_scan_finished)
+        self._scan_thread.scan_failed.connect(self._on_scan_failed)
+        self._scan_thread.start()
 
-            self.selected_files = self.file_operations.scan_directory(
-                self.current_source_path, recursive=True, file_filter=file_filter
-            )
+    def _on_scan_finished(self, files, columns):
+        """スキャン完了時の処理"""
+        self.selected_files = files
 
-            # ファイルリストを更新
-            self._update_file_list()
+        # 列データはワーカーで構築済み。差し替えに伴う選択クリアで
+        # プレビュー再計算が走らないようシグナルを止める
+        with QSignalBlocker(self.file_table.selectionModel()):
+            self.file_model.set_columns(columns)
+        self.file_table.resizeColumnsToContents()
 
-            # プログレスバーを非表示
-            self.progress_bar.setVisible(False)
-            self.progress_label.setText("")
+        self.progress_bar.setVisible(False)
+        self.progress_label.setText("")
 
-            self._log_message(
-                f"スキャン完了: {len(self.selected_files)}件のファイルが見つかりました"
-            )
+        self._log_message(
+            f"スキャン完了: {len(self.selected_files)}件のファイルが見つかりました"
+        )
+        self._scan_thread = None
 
-        except Exception as e:
-            self.progress_bar.setVisible(False)
-            self.progress_label.setText("")
-            error_msg = f"ファイルスキャンエラー: {str(e)}"
-            self._log_message(error_msg)
-            QMessageBox.critical(self, "エラー", error_msg)
+    def _on_scan_failed(self, message: str):
+        """スキャン失敗時の処理"""
+        self.progress_bar.setVisible(False)
+        self.progress_label.setText("")
+        error_msg = f"ファイルスキャンエラー: {message}"
+        self._log_message(error_msg)
+        QMessageBox.critical(self, "エラー", error_msg)
+        self._scan_thread = None
 
     def _preview_operation(self):
         """操作のプレビュー"""
@@ -1151,31 +1494,11 @@ class ModernFileManagerWindow(QMainWindow):
         self._log_message("プレビューを生成中...")
 
         try:
-            # プリセット設定を取得（現在は簡単な例）
-            folder_pattern = "写真/{撮影年}/{撮影月}"
-            filename_pattern = "{元のファイル名}"
-
-            # パスを生成
-            from ..core.path_generator import (
-                LiteralElement,
-                MetadataElement,
-                OriginalFilenameElement,
-                PathGenerator,
-            )
-
-            folder_elements = [
-                LiteralElement("写真"),
-                MetadataElement("year"),
-                MetadataElement("month"),
-            ]
-
-            filename_elements = [OriginalFilenameElement()]
-
-            # ターゲットパスを生成
+            # ターゲットパスを生成（要素リストは__init__で構築済み）
             self.file_operations.generate_target_paths(
                 self.selected_files,
-                folder_elements,
-                filename_elements,
+                self._default_folder_elements,
+                self._default_filename_elements,
                 self.current_destination_path,
             )
 
@@ -1194,19 +1517,31 @@ class ModernFileManagerWindow(QMainWindow):
 
     def _update_preview_list(self):
         """プレビューリストを更新"""
-        # プレビュータブ内のテキストエリアに結果を表示
-        preview_text = "コピープレビュー:\n\n"
-
-        for file_info in self.preview_files[:20]:  # 最初の20件のみ表示
-            source_path = file_info.original_path
-            target_path = file_info.target_path
-            preview_text += f"● {source_path}\n   → {target_path}\n\n"
-
-        if len(self.preview_files) > 20:
-            preview_text += f"... 他 {len(self.preview_files) - 20} 件"
-
-        # プレビューラベルを更新
-        self.preview_label.setText(preview_text)
+        # モデルリセット1回で全件差し替え。描画されるのは可視行のみ
+        if self.preview_files:
+            self._preview_model.set_files(self.preview_files)
+        else:
+            self._preview_model.set_message("プレビュー対象がありません")
+
+        # プレビュータブのテーブルにも反映（タブ未構築時は構築時に反映）
+        if self.preview_table is not None:
+            self._populate_preview_table()
+
+    def _populate_preview_table(self):
+        """プレビューテーブルへ現在のプレビュー内容を一括投入"""
+        self._populate_table(
+            self.preview_table,
+            [
+                (
+                    f.original_path,
+                    f.target_path or "",
+                    f.size_human_readable,
+                    "コピー",
+                    f.status.value,
+                )
+                for f in self.preview_files
+            ],
+        )
 
     def _start_copy_operation(self):
         """コピー操作を開始"""
@@ -1220,61 +1555,92 @@ class ModernFileManagerWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "ファイルをスキャンしてください")
             return
 
-        reply = QMessageBox.question(
-            self,
-            "確認",
-            f"{len(self.selected_files)}件のファイルをコピーしますか？",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        # 確認はexec()のネストしたイベントループではなくopen()+finishedで
+        # 非同期に行い、メインのイベントループを止めない
+        box = QMessageBox(self)
+        box.setWindowTitle("確認")
+        box.setText(f"{len(self.selected_files)}件のファイルをコピーしますか？")
+        box.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.finished.connect(self._on_copy_confirmed)
+        box.open()
 
-        if reply == QMessageBox.StandardButton.Yes:
-            self._log_message("コピー操作を開始...")
-            self.progress_bar.setVisible(True)
-            self.progress_label.setText("コピー中...")
+    def _on_copy_confirmed(self, result: int):
+        """コピー確認ダイアログの応答処理"""
+        if result != QMessageBox.StandardButton.Yes:
+            return
+        self._begin_copy()
+
+    def _begin_copy(self):
+        """コピーのワーカースレッドを起動"""
+        self._log_message("コピー操作を開始...")
+        self.progress_bar.setVisible(True)
+        # バー内テキストの再描画はファイルごとには不要（ラベル側で表示）
+        self.progress_bar.setTextVisible(False)
+        self.progress_label.setText("コピー中...")
+        self.copy_btn.setEnabled(False)
+
+        # 進捗描画の間引き用タイマー（_on_copy_progress参照）
+        self._copy_progress_timer = QElapsedTimer()
+        self._copy_progress_timer.start()
+
+        # コピーはワーカースレッドで実行。進捗・完了・失敗はシグナルで
+        # UIスレッドへキューイングされるため、processEvents()は不要
+        self.worker_thread = CopyWorkerThread(
+            self.file_operations, self.selected_files, self
+        )
+        self.worker_thread.progress.connect(self._on_copy_progress)
+        self.worker_thread.copy_finished.connect(self._on_copy_finished)
+        self.worker_thread.copy_failed.connect(self._on_copy_failed)
+        self.worker_thread.start()
 
-            try:
-                # プログレスコールバック
-                def progress_callback(current, total, filename):
-                    progress_percent = (current / total) * 100
-                    self.progress_bar.setValue(int(progress_percent))
-                    self.progress_label.setText(
-                        f"コピー中: {filename} ({current}/{total})"
-                    )
-                    QApplication.processEvents()  # UIを更新
-
-                # コピーを実行
-                copied_count = self.file_operations.copy_files(
-                    self.selected_files, progress_callback=progress_callback
-                )
+    def _on_copy_progress(self, current: int, total: int, filename: str):
+        """コピー進捗の表示更新
 
-                # 完了
-                self.progress_bar.setVisible(False)
-                self.progress_label.setText("")
+        コピーはモニタのリフレッシュよりはるかに速く進むため、描画は
+        約30fps（33ms）に間引く。最終件だけは必ず反映して100%で終わらせる。
+        """
+        if self._copy_progress_timer.elapsed() < 33 and current != total:
+            return
+        self._copy_progress_timer.restart()
+        self.progress_bar.setValue(int((current / total) * 100))
+        self.progress_label.setText(f"コピー中: {filename} ({current}/{total})")
 
-                self._log_message(
-                    f"コピー完了: {copied_count}件のファイルをコピーしました"
-                )
-                QMessageBox.information(
-                    self, "完了", f"{copied_count}件のファイルのコピーが完了しました。"
-                )
+    def _on_copy_finished(self, copied_count: int):
+        """コピー完了時の処理"""
+        self.progress_bar.setVisible(False)
+        self.progress_label.setText("")
+        self.copy_btn.setEnabled(True)
+        self.worker_thread = None
+
+        self._log_message(f"コピー完了: {copied_count}件のファイルをコピーしました")
+        QMessageBox.information(
+            self, "完了", f"{copied_count}件のファイルのコピーが完了しました。"
+        )
 
-                # ファイルリストを更新
-                self._update_file_list()
+        # ファイルリストを更新
+        self._update_file_list()
+
+    def _on_copy_failed(self, message: str):
+        """コピー失敗時の処理"""
+        self.progress_bar.setVisible(False)
+        self.progress_label.setText("")
+        self.copy_btn.setEnabled(True)
+        self.worker_thread = None
 
-            except Exception as e:
-                self.progress_bar.setVisible(False)
-                self.progress_label.setText("")
-                error_msg = f"コピーエラー: {str(e)}"
-                self._log_message(error_msg)
-                QMessageBox.critical(self, "エラー", error_msg)
+        error_msg = f"コピーエラー: {message}"
+        self._log_message(error_msg)
+        QMessageBox.critical(self, "エラー", error_msg)
 
-    def _file_selection_changed(self):
+    def _file_selection_changed(self, *args):
         """ファイル選択変更時の処理"""
-        selected_items = self.file_table.selectedItems()
-        if selected_items:
+        selected_rows = self.file_table.selectionModel().selectedRows()
+        if selected_rows:
             # プレビュー更新
-            self.preview_label.setText(
-                "選択されたファイル:\n" + str(len(selected_items)) + "件"
+            self._preview_model.set_message(
+                f"選択されたファイル:\n{len(selected_rows)}件"
             )
             # TODO: 実際のプレビュー表示処理
 
@@ -1288,7 +1654,9 @@ class ModernFileManagerWindow(QMainWindow):
                 # コピー先設定を適用
                 if preset_config.get("destination_path"):
                     self.current_destination_path = preset_config["destination_path"]
-                    self.dest_path_edit.setText(self.current_destination_path)
+                    # 設定タブが未構築ならパスの保持のみ（構築時に反映される）
+                    if self.dest_path_edit is not None:
+                        self.dest_path_edit.setText(self.current_destination_path)
 
                 self._log_message(f"プリセット '{preset_name}' を適用しました")
             else:
@@ -1298,8 +1666,6 @@ class ModernFileManagerWindow(QMainWindow):
 
     def _create_new_preset(self):
         """新規プリセットを作成"""
-        from .preset_dialog import PresetManagementDialog
-
         dialog = PresetManagementDialog(self)
         if dialog.exec() == QMessageBox.StandardButton.Ok:
             # プリセットコンボボックスを更新
@@ -1315,8 +1681,6 @@ class ModernFileManagerWindow(QMainWindow):
             )
             return
 
-        from .preset_dialog import PresetManagementDialog
-
         dialog = PresetManagementDialog(self, current_preset)
         if dialog.exec() == QMessageBox.StandardButton.Ok:
             # プリセットコンボボックスを更新
@@ -1328,20 +1692,26 @@ class ModernFileManagerWindow(QMainWindow):
         try:
             presets = self.config_manager.list_presets()
 
+            # 内容が変わっていなければ再構築しない
+            if presets == [
+                self.preset_combo.itemText(i)
+                for i in range(self.preset_combo.count())
+            ]:
+                return
+
             # 現在の選択を保存
             current_selection = self.preset_combo.currentText()
 
-            # アイテムをクリア
-            self.preset_combo.clear()
+            # 再構築中のcurrentTextChanged発火（クリア時・追加時の中間
+            # 状態でのプリセット適用）を抑止する
+            with QSignalBlocker(self.preset_combo):
+                self.preset_combo.clear()
+                self.preset_combo.addItems(presets)
 
-            # プリセットを追加
-            for preset in presets:
-                self.preset_combo.addItem(preset)
-
-            # 以前の選択を復元
-            index = self.preset_combo.findText(current_selection)
-            if index >= 0:
-                self.preset_combo.setCurrentIndex(index)
+                # 以前の選択を復元
+                index = self.preset_combo.findText(current_selection)
+                if index >= 0:
+                    self.preset_combo.setCurrentIndex(index)
 
         except Exception as e:
             self._log_message(f"プリセット読み込みエラー: {str(e)}")
@@ -1351,17 +1721,23 @@ class ModernFileManagerWindow(QMainWindow):
         self.log_text.clear()
 
     def _log_message(self, message: str):
-        """ログメッセージを追加"""
-        import datetime
+        """ログメッセージをバッファに追加（表示はタイマーで一括反映）"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._log_buffer.append(f"[{timestamp}] {message}")
+
+    def _flush_log(self):
+        """溜まったログをカーソル挿入1回でまとめて表示に反映"""
+        # ログタブが未構築の間はバッファに保持し続ける（構築後の
+        # 次のタイマー発火でまとめて反映される）
+        if not self._log_buffer or self.log_text is None:
+            return
 
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        self.log_text.append(formatted_message)
+        lines = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
 
-        # ログを最下部にスクロール
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.log_text.setTextCursor(cursor)
+        # appendPlainTextは末尾に1ブロック追加し、カーソルが末尾に
+        # ある間は自動スクロールする（カーソル操作は不要）
+        self.log_text.appendPlainText(lines)
 
     def _device_selected(self, item: QListWidgetItem):
         """デバイス選択時の処理"""
@@ -4,12 +4,10 @@
 フォルダ構造、ファイル名規則、その他の設定を管理
 """
 
-import os
-import sys
 from typing import Dict, List, Optional
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, Signal
+from PySide6.QtGui import QFont, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QButtonGroup,
     QCheckBox,
@@ -27,16 +25,203 @@ from PySide6.QtWidgets import (
     QSplitter,
     QTabWidget,
     QTextEdit,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
-# 親ディレクトリをパスに追加
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ..core.config_manager import ConfigManager
+
+# 変数パネルの静的ツリー定義（カテゴリ, 変数例のタプル）。
+# ダイアログを開くたびにQTreeWidgetItemを数十個生成し直さないよう、
+# ここからQStandardItemModelを1回だけ構築して全インスタンスで共有する
+_VARIABLE_TREE = (
+    (
+        "📅 日時",
+        (
+            "{撮影年} - 例: 2023",
+            "{撮影月} - 例: 10",
+            "{撮影日} - 例: 27",
+            "{撮影年月日} - 例: 20231027",
+            "{時} - 例: 14",
+            "{分} - 例: 30",
+            "{秒} - 例: 45",
+        ),
+    ),
+    (
+        "📷 カメラ情報",
+        (
+            "{カメラメーカー} - 例: Canon",
+            "{カメラモデル} - 例: EOS R5",
+            "{レンズ} - 例: RF24-70mm F2.8 L IS USM",
+            "{焦点距離} - 例: 50mm",
+        ),
+    ),
+    (
+        "📄 ファイル情報",
+        (
+            "{ファイル種別} - 例: 動画, 写真, RAW",
+            "{元のファイル名} - 例: IMG_001",
+            "{拡張子} - 例: .jpg",
+        ),
+    ),
+    (
+        "🌍 位置情報",
+        (
+            "{GPS国} - 例: Japan",
+            "{GPS都道府県} - 例: Tokyo",
+            "{GPS市町村} - 例: Shibuya",
+        ),
+    ),
+    (
+        "🔧 その他",
+        (
+            "{連番} - 例: 001",
+            "{連番2桁} - 例: 01",
+            "{連番3桁} - 例: 001",
+            "{プロジェクト名} - 例: 旅行2023",
+        ),
+    ),
+)
+
+
+# プレビューのサンプル表示はパターンに依らず固定なので、キーストローク
+# ごとにリスト構築+joinをやり直さずモジュール定数を使い回す
+_FOLDER_PREVIEW_SAMPLE = (
+    "写真/2023/10/27\n"
+    "動画/2023/10/28\n"
+    "RAW/2023/10/29\n"
+    "Canon EOS R5/2023-10\n"
+    "イベント/2023/Japan/Tokyo"
+)
+_FILENAME_PREVIEW_SAMPLE = (
+    "20231027_143000_001.jpg\n"
+    "20231027_143001_002.mp4\n"
+    "Canon_EOS_R5_20231027_IMG_001.cr3"
+)
 
-from core.config_manager import ConfigManager
+# テンプレート名 -> (フォルダパターン, ファイル名変更の有無, ファイル名パターン)。
+# if/elifの逐次比較ではなく辞書引きで適用し、全テンプレートに定義を持たせる
+_TEMPLATES = {
+    "旅行写真用": (
+        "{撮影年}/{GPS国}/{GPS都道府県}",
+        True,
+        "{撮影年月日}_{時分秒}_{連番3桁}",
+    ),
+    "イベント動画用": (
+        "イベント/{撮影年}/{撮影月}/{撮影日}",
+        True,
+        "Event_{撮影年月日}_{連番3桁}",
+    ),
+    "RAW写真管理用": (
+        "RAW/{撮影年}/{撮影月}",
+        True,
+        "{カメラモデル}_{撮影年月日}_{元のファイル名}",
+    ),
+    "日常写真用": (
+        "{撮影年}/{撮影月}",
+        False,
+        "",
+    ),
+    "プロ向け設定": (
+        "{プロジェクト名}/{撮影年月日}/{ファイル種別}",
+        True,
+        "{プロジェクト名}_{撮影年月日}_{連番3桁}",
+    ),
+}
+
+# ダイアログのスタイルシート。内容は不変なのでモジュール定数として
+# 1回だけ確保し、インスタンスごとの文字列組み立てを省く
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #2d2d30;
+        color: #ffffff;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #3e3e42;
+        border-radius: 6px;
+        margin-top: 8px;
+        padding-top: 8px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QPushButton {
+        background-color: #3c3c3c;
+        color: #ffffff;
+        border: 1px solid #3e3e42;
+        border-radius: 4px;
+        padding: 6px 12px;
+        min-height: 24px;
+    }
+    QPushButton:hover {
+        background-color: #4a4a4a;
+    }
+    QPushButton:pressed {
+        background-color: #2a2a2a;
+    }
+    QPushButton:default {
+        background-color: #0e639c;
+    }
+    QPushButton:default:hover {
+        background-color: #1177bb;
+    }
+    QLineEdit, QComboBox, QSpinBox {
+        background-color: #3c3c3c;
+        color: #ffffff;
+        border: 1px solid #3e3e42;
+        border-radius: 4px;
+        padding: 4px 8px;
+        min-height: 20px;
+    }
+    QLineEdit:focus, QComboBox:focus, QSpinBox:focus {
+        border-color: #0e639c;
+    }
+    QTextEdit {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        border: 1px solid #3e3e42;
+        border-radius: 4px;
+    }
+    QTreeView {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        border: 1px solid #3e3e42;
+        border-radius: 4px;
+    }
+    QTreeView::item:selected {
+        background-color: #0e639c;
+    }
+    QCheckBox, QRadioButton {
+        color: #ffffff;
+        spacing: 8px;
+    }
+    QCheckBox::indicator, QRadioButton::indicator {
+        width: 16px;
+        height: 16px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #3e3e42;
+        background-color: #2d2d30;
+    }
+    QTabBar::tab {
+        background-color: #3c3c3c;
+        color: #ffffff;
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    QTabBar::tab:selected {
+        background-color: #0e639c;
+    }
+    QTabBar::tab:hover {
+        background-color: #4a4a4a;
+    }
+"""
 
 
 class PresetManagementDialog(QDialog):
@@ -44,13 +229,62 @@ class PresetManagementDialog(QDialog):
 
     preset_saved = Signal(str)  # プリセット保存時のシグナル
 
+    # 変数ツリーの共有モデル（初回アクセス時に構築）
+    _variables_model = None
+
+    # 設定マネージャの共有インスタンス（初回アクセス時に構築）
+    _config_manager_instance = None
+
+    @classmethod
+    def _get_config_manager(cls) -> ConfigManager:
+        """設定マネージャを取得（全ダイアログで共有）
+
+        ConfigManagerの生成は設定ファイルの読み込みを伴うため、
+        ダイアログを開くたびに作り直さない。
+        """
+        if cls._config_manager_instance is None:
+            cls._config_manager_instance = ConfigManager()
+        return cls._config_manager_instance
+
+    @classmethod
+    def _get_variables_model(cls) -> QStandardItemModel:
+        """変数ツリーのモデルを取得（全ダイアログで共有）"""
+        if cls._variables_model is None:
+            model = QStandardItemModel()
+            model.setHorizontalHeaderLabels(["変数"])
+            root = model.invisibleRootItem()
+            for category, variables in _VARIABLE_TREE:
+                cat_item = QStandardItem(category)
+                cat_item.setEditable(False)
+                children = []
+                for variable in variables:
+                    child = QStandardItem(variable)
+                    child.setEditable(False)
+                    children.append(child)
+                cat_item.appendRows(children)
+                root.appendRow(cat_item)
+            cls._variables_model = model
+        return cls._variables_model
+
     def __init__(self, parent=None, preset_name: str = ""):
         super().__init__(parent)
 
-        self.config_manager = ConfigManager()
+        self.config_manager = self._get_config_manager()
         self.preset_name = preset_name
         self.is_new_preset = not preset_name
 
+        # パターン入力のプレビュー更新はキーストロークごとではなく、
+        # 入力が150ms途切れたタイミングにまとめる（デバウンス）
+        self._folder_preview_timer = QTimer(self)
+        self._folder_preview_timer.setSingleShot(True)
+        self._folder_preview_timer.setInterval(150)
+        self._folder_preview_timer.timeout.connect(self._update_folder_preview)
+
+        self._filename_preview_timer = QTimer(self)
+        self._filename_preview_timer.setSingleShot(True)
+        self._filename_preview_timer.setInterval(150)
+        self._filename_preview_timer.timeout.connect(self._update_filename_preview)
+
         self._setup_ui()
         self._setup_connections()
         self._load_preset_data()
@@ -80,28 +314,24 @@ class PresetManagementDialog(QDialog):
 
         layout.addLayout(name_layout)
 
-        # タブウィジェット
+        # タブウィジェット。最初に表示されるフォルダ構造タブだけ即時構築し、
+        # 残り4タブは初回表示時まで中身を作らない（ダイアログの開きを速く
+        # する。メインウィンドウのタブと同じ方式）
         self.tab_widget = QTabWidget()
 
-        # フォルダ構造タブ
         folder_tab = self._create_folder_structure_tab()
         self.tab_widget.addTab(folder_tab, "📁 フォルダ構造")
 
-        # ファイル名規則タブ
-        filename_tab = self._create_filename_rules_tab()
-        self.tab_widget.addTab(filename_tab, "📝 ファイル名規則")
-
-        # フィルタ設定タブ
-        filter_tab = self._create_filter_settings_tab()
-        self.tab_widget.addTab(filter_tab, "🔍 フィルタ設定")
-
-        # 処理オプションタブ
-        options_tab = self._create_processing_options_tab()
-        self.tab_widget.addTab(options_tab, "⚙️ 処理オプション")
-
-        # プレビュータブ
-        preview_tab = self._create_preview_tab()
-        self.tab_widget.addTab(preview_tab, "👁️ プレビュー")
+        self._tab_factories = {
+            1: (self._create_filename_rules_tab, "📝 ファイル名規則"),
+            2: (self._create_filter_settings_tab, "🔍 フィルタ設定"),
+            3: (self._create_processing_options_tab, "⚙️ 処理オプション"),
+            4: (self._create_preview_tab, "👁️ プレビュー"),
+        }
+        self._tabs_built = {0}
+        for index in sorted(self._tab_factories):
+            self.tab_widget.addTab(QWidget(), self._tab_factories[index][1])
+        self.tab_widget.currentChanged.connect(self._build_tab_on_demand)
 
         layout.addWidget(self.tab_widget)
 
@@ -127,6 +357,50 @@ class PresetManagementDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    @staticmethod
+    def _labeled_row(label_text: str, field_widget, parent_layout, stretch=False):
+        """「ラベル: フィールド」の1行を構築して親レイアウトへ追加
+
+        各タブで繰り返されるQHBoxLayout+QLabel+フィールドの定型を
+        1呼び出しにまとめる。
+
+        Args:
+            label_text: 行頭ラベルの文字列
+            field_widget: ラベルの右に置くウィジェット
+            parent_layout: 行を追加する親レイアウト
+            stretch: フィールドの後ろに伸縮スペースを入れるか
+        """
+        row = QHBoxLayout()
+        row.addWidget(QLabel(label_text))
+        row.addWidget(field_widget)
+        if stretch:
+            row.addStretch()
+        parent_layout.addLayout(row)
+
+    def _build_tab_on_demand(self, index: int):
+        """未構築のタブを初回表示時に構築する"""
+        if index in self._tabs_built or index not in self._tab_factories:
+            return
+
+        factory, label = self._tab_factories[index]
+        widget = factory()
+        self._tabs_built.add(index)
+
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, label)
+        self.tab_widget.setCurrentIndex(index)
+
+    def _ensure_all_tabs_built(self):
+        """全タブを構築済みにする
+
+        保存やプレビュー生成は全タブのウィジェット値を読むため、
+        その前に未構築タブを実体化しておく。
+        """
+        current = self.tab_widget.currentIndex()
+        for index in sorted(self._tab_factories):
+            self._build_tab_on_demand(index)
+        self.tab_widget.setCurrentIndex(current)
+
     def _create_folder_structure_tab(self) -> QWidget:
         """フォルダ構造タブを作成"""
         tab_widget = QWidget()
@@ -162,49 +436,12 @@ class PresetManagementDialog(QDialog):
         widget = QGroupBox("利用可能な変数")
         layout = QVBoxLayout(widget)
 
-        # 変数リスト
-        self.variables_list = QTreeWidget()
-        self.variables_list.setHeaderLabel("変数")
-
-        # 変数を分類して追加
-        date_item = QTreeWidgetItem(["📅 日時"])
-        date_item.addChild(QTreeWidgetItem(["{撮影年} - 例: 2023"]))
-        date_item.addChild(QTreeWidgetItem(["{撮影月} - 例: 10"]))
-        date_item.addChild(QTreeWidgetItem(["{撮影日} - 例: 27"]))
-        date_item.addChild(QTreeWidgetItem(["{撮影年月日} - 例: 20231027"]))
-        date_item.addChild(QTreeWidgetItem(["{時} - 例: 14"]))
-        date_item.addChild(QTreeWidgetItem(["{分} - 例: 30"]))
-        date_item.addChild(QTreeWidgetItem(["{秒} - 例: 45"]))
-        self.variables_list.addTopLevelItem(date_item)
-
-        camera_item = QTreeWidgetItem(["📷 カメラ情報"])
-        camera_item.addChild(QTreeWidgetItem(["{カメラメーカー} - 例: Canon"]))
-        camera_item.addChild(QTreeWidgetItem(["{カメラモデル} - 例: EOS R5"]))
-        camera_item.addChild(
-            QTreeWidgetItem(["{レンズ} - 例: RF24-70mm F2.8 L IS USM"])
-        )
-        camera_item.addChild(QTreeWidgetItem(["{焦点距離} - 例: 50mm"]))
-        self.variables_list.addTopLevelItem(camera_item)
-
-        file_item = QTreeWidgetItem(["📄 ファイル情報"])
-        file_item.addChild(QTreeWidgetItem(["{ファイル種別} - 例: 動画, 写真, RAW"]))
-        file_item.addChild(QTreeWidgetItem(["{元のファイル名} - 例: IMG_001"]))
-        file_item.addChild(QTreeWidgetItem(["{拡張子} - 例: .jpg"]))
-        self.variables_list.addTopLevelItem(file_item)
-
-        location_item = QTreeWidgetItem(["🌍 位置情報"])
-        location_item.addChild(QTreeWidgetItem(["{GPS国} - 例: Japan"]))
-        location_item.addChild(QTreeWidgetItem(["{GPS都道府県} - 例: Tokyo"]))
-        location_item.addChild(QTreeWidgetItem(["{GPS市町村} - 例: Shibuya"]))
-        self.variables_list.addTopLevelItem(location_item)
-
-        other_item = QTreeWidgetItem(["🔧 その他"])
-        other_item.addChild(QTreeWidgetItem(["{連番} - 例: 001"]))
-        other_item.addChild(QTreeWidgetItem(["{連番2桁} - 例: 01"]))
-        other_item.addChild(QTreeWidgetItem(["{連番3桁} - 例: 001"]))
-        other_item.addChild(QTreeWidgetItem(["{プロジェクト名} - 例: 旅行2023"]))
-        self.variables_list.addTopLevelItem(other_item)
-
+        # 変数リスト（共有モデル + QTreeView。アイテムウィジェットの
+        # 生成がなく、行高を固定することでsizeHintの再計算も省ける）
+        self.variables_list = QTreeView()
+        self.variables_list.setModel(self._get_variables_model())
+        self.variables_list.setUniformRowHeights(True)
+        self.variables_list.setEditTriggers(QTreeView.EditTrigger.NoEditTriggers)
         self.variables_list.expandAll()
         layout.addWidget(self.variables_list)
 
@@ -236,24 +473,24 @@ class PresetManagementDialog(QDialog):
             ("イベント/{撮影年}/{撮影月}/{撮影日}", "イベント別"),
         ]
 
+        # ボタンごとにクロージャを作らず、パターンはプロパティに載せて
+        # 共通スロット1つで受ける
         for pattern, name in quick_presets:
             btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, p=pattern: self._set_folder_pattern(p))
+            btn.setProperty("pattern", pattern)
+            btn.clicked.connect(self._on_folder_preset_clicked)
             preset_layout.addWidget(btn)
 
         preset_layout.addStretch()
         layout.addLayout(preset_layout)
 
         # フォルダパターン入力
-        pattern_layout = QHBoxLayout()
-        pattern_layout.addWidget(QLabel("フォルダパターン:"))
-
         self.folder_pattern_edit = QLineEdit()
         self.folder_pattern_edit.setPlaceholderText("例: {撮影年}/{撮影月}/{撮影日}")
-        self.folder_pattern_edit.textChanged.connect(self._update_folder_preview)
-        pattern_layout.addWidget(self.folder_pattern_edit)
-
-        layout.addLayout(pattern_layout)
+        self.folder_pattern_edit.textChanged.connect(
+            self._folder_preview_timer.start
+        )
+        self._labeled_row("フォルダパターン:", self.folder_pattern_edit, layout)
 
         # プレビュー
         preview_group = QGroupBox("プレビュー")
@@ -281,9 +518,6 @@ class PresetManagementDialog(QDialog):
         options_layout.addWidget(self.preserve_structure_check)
 
         # 未知の値の処理
-        unknown_layout = QHBoxLayout()
-        unknown_layout.addWidget(QLabel("メタデータが取得できない場合:"))
-
         self.unknown_handling_combo = QComboBox()
         self.unknown_handling_combo.addItems(
             [
@@ -293,9 +527,11 @@ class PresetManagementDialog(QDialog):
                 "元のファイル名を使用",
             ]
         )
-        unknown_layout.addWidget(self.unknown_handling_combo)
-
-        options_layout.addLayout(unknown_layout)
+        self._labeled_row(
+            "メタデータが取得できない場合:",
+            self.unknown_handling_combo,
+            options_layout,
+        )
 
         layout.addWidget(options_group)
 
@@ -333,26 +569,24 @@ class PresetManagementDialog(QDialog):
 
         for pattern, name in filename_presets:
             btn = QPushButton(name)
-            btn.clicked.connect(
-                lambda checked, p=pattern: self._set_filename_pattern(p)
-            )
+            btn.setProperty("pattern", pattern)
+            btn.clicked.connect(self._on_filename_preset_clicked)
             pattern_preset_layout.addWidget(btn)
 
         pattern_preset_layout.addStretch()
         filename_options_layout.addLayout(pattern_preset_layout)
 
         # パターン入力
-        filename_pattern_layout = QHBoxLayout()
-        filename_pattern_layout.addWidget(QLabel("ファイル名パターン:"))
-
         self.filename_pattern_edit = QLineEdit()
         self.filename_pattern_edit.setPlaceholderText(
             "例: {撮影年月日}_{時分秒}_{連番3桁}"
         )
-        self.filename_pattern_edit.textChanged.connect(self._update_filename_preview)
-        filename_pattern_layout.addWidget(self.filename_pattern_edit)
-
-        filename_options_layout.addLayout(filename_pattern_layout)
+        self.filename_pattern_edit.textChanged.connect(
+            self._filename_preview_timer.start
+        )
+        self._labeled_row(
+            "ファイル名パターン:", self.filename_pattern_edit, filename_options_layout
+        )
 
         # プレビュー
         filename_preview_group = QGroupBox("プレビュー")
@@ -390,9 +624,6 @@ class PresetManagementDialog(QDialog):
         filename_detail_layout.addLayout(counter_layout)
 
         # 重複処理
-        duplicate_layout = QHBoxLayout()
-        duplicate_layout.addWidget(QLabel("重複ファイル名の処理:"))
-
         self.duplicate_handling_combo = QComboBox()
         self.duplicate_handling_combo.addItems(
             [
@@ -402,22 +633,23 @@ class PresetManagementDialog(QDialog):
                 "エラーとして処理",
             ]
         )
-        duplicate_layout.addWidget(self.duplicate_handling_combo)
-
-        filename_detail_layout.addLayout(duplicate_layout)
+        self._labeled_row(
+            "重複ファイル名の処理:",
+            self.duplicate_handling_combo,
+            filename_detail_layout,
+        )
 
         # 大文字小文字の処理
-        case_layout = QHBoxLayout()
-        case_layout.addWidget(QLabel("大文字小文字:"))
-
         self.case_handling_combo = QComboBox()
         self.case_handling_combo.addItems(
             ["変更しない", "すべて小文字", "すべて大文字", "最初だけ大文字"]
         )
-        case_layout.addWidget(self.case_handling_combo)
-
-        case_layout.addStretch()
-        filename_detail_layout.addLayout(case_layout)
+        self._labeled_row(
+            "大文字小文字:",
+            self.case_handling_combo,
+            filename_detail_layout,
+            stretch=True,
+        )
 
         filename_options_layout.addWidget(filename_detail_group)
 
@@ -459,16 +691,11 @@ class PresetManagementDialog(QDialog):
         filetype_layout.addLayout(filetype_checks_layout)
 
         # カスタム拡張子
-        custom_ext_layout = QHBoxLayout()
-        custom_ext_layout.addWidget(QLabel("追加拡張子:"))
-
         self.custom_extensions_edit = QLineEdit()
         self.custom_extensions_edit.setPlaceholderText(
             "例: .tiff, .bmp, .gif (カンマ区切り)"
         )
-        custom_ext_layout.addWidget(self.custom_extensions_edit)
-
-        filetype_layout.addLayout(custom_ext_layout)
+        self._labeled_row("追加拡張子:", self.custom_extensions_edit, filetype_layout)
 
         layout.addWidget(filetype_group)
 
@@ -555,15 +782,12 @@ class PresetManagementDialog(QDialog):
         related_layout.addWidget(self.copy_related_check)
 
         # 関連ファイルの詳細設定
-        related_detail_layout = QHBoxLayout()
-        related_detail_layout.addWidget(QLabel("関連ファイル拡張子:"))
-
         self.related_extensions_edit = QLineEdit()
         self.related_extensions_edit.setText(".xmp,.thm,.aae,.gpx")
         self.related_extensions_edit.setPlaceholderText("例: .xmp,.thm,.aae,.gpx")
-        related_detail_layout.addWidget(self.related_extensions_edit)
-
-        related_layout.addLayout(related_detail_layout)
+        self._labeled_row(
+            "関連ファイル拡張子:", self.related_extensions_edit, related_layout
+        )
 
         layout.addWidget(related_group)
 
@@ -572,16 +796,15 @@ class PresetManagementDialog(QDialog):
         performance_layout = QVBoxLayout(performance_group)
 
         # 並列処理数
-        parallel_layout = QHBoxLayout()
-        parallel_layout.addWidget(QLabel("同時処理ファイル数:"))
-
         self.parallel_count_spin = QSpinBox()
         self.parallel_count_spin.setRange(1, 10)
         self.parallel_count_spin.setValue(3)
-        parallel_layout.addWidget(self.parallel_count_spin)
-
-        parallel_layout.addStretch()
-        performance_layout.addLayout(parallel_layout)
+        self._labeled_row(
+            "同時処理ファイル数:",
+            self.parallel_count_spin,
+            performance_layout,
+            stretch=True,
+        )
 
         # ハッシュ計算
         self.calculate_hash_check = QCheckBox(
@@ -622,7 +845,7 @@ class PresetManagementDialog(QDialog):
     def _setup_connections(self):
         """シグナル・スロット接続を設定"""
         # 変数リストのダブルクリック
-        self.variables_list.itemDoubleClicked.connect(self._insert_variable)
+        self.variables_list.doubleClicked.connect(self._insert_variable)
 
         # プリセット名の変更
         self.preset_name_edit.textChanged.connect(self._validate_preset_name)
@@ -636,60 +859,76 @@ class PresetManagementDialog(QDialog):
         """サイズフィルタの有効/無効を切り替え"""
         self.size_filter_widget.setEnabled(enabled)
 
+    def _on_folder_preset_clicked(self):
+        """クイックプリセットボタンのフォルダパターンを適用"""
+        self._set_folder_pattern(self.sender().property("pattern"))
+
+    def _on_filename_preset_clicked(self):
+        """クイックプリセットボタンのファイル名パターンを適用"""
+        self._set_filename_pattern(self.sender().property("pattern"))
+
     def _set_folder_pattern(self, pattern: str):
         """フォルダパターンを設定"""
-        self.folder_pattern_edit.setText(pattern)
+        # プログラムからのsetTextではtextChanged→デバウンスタイマーを
+        # 起動させず、プレビューを直接1回だけ更新する
+        with QSignalBlocker(self.folder_pattern_edit):
+            self.folder_pattern_edit.setText(pattern)
         self._update_folder_preview()
 
     def _set_filename_pattern(self, pattern: str):
         """ファイル名パターンを設定"""
-        self.filename_pattern_edit.setText(pattern)
+        with QSignalBlocker(self.filename_pattern_edit):
+            self.filename_pattern_edit.setText(pattern)
         self._update_filename_preview()
 
-    def _update_folder_preview(self):
-        """フォルダプレビューを更新"""
-        pattern = self.folder_pattern_edit.text()
-        if not pattern:
-            self.folder_preview_text.setPlainText("パターンを入力してください")
+    def _set_preview_text(self, widget: QTextEdit, cache_attr: str, text: str):
+        """プレビューの内容が前回から変わったときだけsetPlainTextする
+
+        setPlainTextは同一内容でもドキュメントレイアウトを無効化する
+        ため、最後に設定した文字列を属性にキャッシュして比較する
+        （toPlainText()の往復より安い）。
+
+        Args:
+            widget: 対象のQTextEdit
+            cache_attr: 前回値を保持する属性名
+            text: 設定する文字列
+        """
+        if getattr(self, cache_attr, None) == text:
             return
+        setattr(self, cache_attr, text)
+        widget.setPlainText(text)
 
+    def _update_folder_preview(self):
+        """フォルダプレビューを更新"""
         # サンプルデータでプレビュー生成
-        examples = [
-            "写真/2023/10/27",
-            "動画/2023/10/28",
-            "RAW/2023/10/29",
-            "Canon EOS R5/2023-10",
-            "イベント/2023/Japan/Tokyo",
-        ]
-
-        self.folder_preview_text.setPlainText("\n".join(examples))
+        text = (
+            _FOLDER_PREVIEW_SAMPLE
+            if self.folder_pattern_edit.text()
+            else "パターンを入力してください"
+        )
+        self._set_preview_text(
+            self.folder_preview_text, "_last_folder_preview", text
+        )
 
     def _update_filename_preview(self):
         """ファイル名プレビューを更新"""
         if not self.enable_rename_check.isChecked():
-            self.filename_preview_text.setPlainText("ファイル名変更が無効です")
-            return
-
-        pattern = self.filename_pattern_edit.text()
-        if not pattern:
-            self.filename_preview_text.setPlainText("パターンを入力してください")
-            return
-
-        # サンプルでプレビュー生成
-        examples = [
-            "20231027_143000_001.jpg",
-            "20231027_143001_002.mp4",
-            "Canon_EOS_R5_20231027_IMG_001.cr3",
-        ]
-
-        self.filename_preview_text.setPlainText("\n".join(examples))
+            text = "ファイル名変更が無効です"
+        elif not self.filename_pattern_edit.text():
+            text = "パターンを入力してください"
+        else:
+            # サンプルでプレビュー生成
+            text = _FILENAME_PREVIEW_SAMPLE
+        self._set_preview_text(
+            self.filename_preview_text, "_last_filename_preview", text
+        )
 
-    def _insert_variable(self, item: QTreeWidgetItem):
+    def _insert_variable(self, index):
         """変数をフォルダパターンに挿入"""
-        if item.parent():  # 子アイテムの場合
-            text = item.text(0)
+        if index.parent().isValid():  # 子アイテム（変数行）の場合
+            text = index.data()
             # 変数部分のみを抽出
-            if " - " in text:
+            if text and " - " in text:
                 variable = text.split(" - ")[0]
                 current_text = self.folder_pattern_edit.text()
                 cursor_pos = self.folder_pattern_edit.cursorPosition()
@@ -709,63 +948,62 @@ class PresetManagementDialog(QDialog):
 
     def _load_from_template(self):
         """テンプレートから設定を読み込み"""
-        templates = [
-            "旅行写真用",
-            "イベント動画用",
-            "RAW写真管理用",
-            "日常写真用",
-            "プロ向け設定",
-        ]
-
         template, ok = QInputDialog.getItem(
             self,
             "テンプレート選択",
             "テンプレートを選択してください:",
-            templates,
+            list(_TEMPLATES),
             0,
             False,
         )
 
-        if ok and template:
-            # テンプレート設定を適用
-            if template == "旅行写真用":
-                self.folder_pattern_edit.setText("{撮影年}/{GPS国}/{GPS都道府県}")
-                self.enable_rename_check.setChecked(True)
-                self.filename_pattern_edit.setText("{撮影年月日}_{時分秒}_{連番3桁}")
-            elif template == "イベント動画用":
-                self.folder_pattern_edit.setText("イベント/{撮影年}/{撮影月}/{撮影日}")
-                self.enable_rename_check.setChecked(True)
-                self.filename_pattern_edit.setText("Event_{撮影年月日}_{連番3桁}")
-            # 他のテンプレートも同様に設定
+        config = _TEMPLATES.get(template) if ok else None
+        if config:
+            # テンプレートはファイル名規則タブのウィジェットにも書き込む
+            self._ensure_all_tabs_built()
+
+            # テンプレート設定を適用。途中経過でプレビュー更新が走らない
+            # ようシグナルを止め、最後に1回ずつ更新する
+            folder_pattern, rename_enabled, filename_pattern = config
+            with QSignalBlocker(self.folder_pattern_edit):
+                self.folder_pattern_edit.setText(folder_pattern)
+            with QSignalBlocker(self.enable_rename_check):
+                self.enable_rename_check.setChecked(rename_enabled)
+            self.filename_options_widget.setEnabled(rename_enabled)
+            with QSignalBlocker(self.filename_pattern_edit):
+                self.filename_pattern_edit.setText(filename_pattern)
 
             self._update_folder_preview()
             self._update_filename_preview()
 
     def _update_preview(self):
         """プレビューを更新"""
-        preview_text = "=== プリセット設定プレビュー ===\n\n"
+        # 全タブのウィジェット値を読むため、未構築タブを実体化する
+        self._ensure_all_tabs_built()
+
+        # +=の連鎖は部分文字列の再確保を繰り返すため、リストに集めて
+        # join1回で組み立てる
+        parts = ["=== プリセット設定プレビュー ===\n\n"]
 
         # フォルダ構造
-        preview_text += "【フォルダ構造】\n"
-        preview_text += f"パターン: {self.folder_pattern_edit.text()}\n"
-        preview_text += "プレビュー:\n"
-        preview_text += "  写真/2023/10/27/\n"
-        preview_text += "  動画/2023/10/27/\n\n"
+        parts.append("【フォルダ構造】\n")
+        parts.append(f"パターン: {self.folder_pattern_edit.text()}\n")
+        parts.append("プレビュー:\n  写真/2023/10/27/\n  動画/2023/10/27/\n\n")
 
         # ファイル名規則
-        preview_text += "【ファイル名規則】\n"
+        parts.append("【ファイル名規則】\n")
         if self.enable_rename_check.isChecked():
-            preview_text += f"パターン: {self.filename_pattern_edit.text()}\n"
-            preview_text += "プレビュー:\n"
-            preview_text += "  20231027_143000_001.jpg\n"
-            preview_text += "  20231027_143001_002.mp4\n"
+            parts.append(f"パターン: {self.filename_pattern_edit.text()}\n")
+            parts.append(
+                "プレビュー:\n  20231027_143000_001.jpg\n  20231027_143001_002.mp4\n"
+            )
         else:
-            preview_text += "ファイル名変更無効（元のファイル名を保持）\n"
+            parts.append("ファイル名変更無効（元のファイル名を保持）\n")
 
-        preview_text += "\n"
+        parts.append("\n")
 
         # フィルタ設定
-        preview_text += "【フィルタ設定】\n"
+        parts.append("【フィルタ設定】\n")
         file_types = []
         if self.include_photos_check.isChecked():
             file_types.append("写真")
@@ -776,19 +1014,25 @@ class PresetManagementDialog(QDialog):
         if self.include_others_check.isChecked():
             file_types.append("その他")
 
-        preview_text += f"対象ファイル: {', '.join(file_types)}\n\n"
+        parts.append(f"対象ファイル: {', '.join(file_types)}\n\n")
 
         # 処理オプション
-        preview_text += "【処理オプション】\n"
-        duplicate_options = ["スキップ", "上書き", "名前変更", "確認"]
+        parts.append("【処理オプション】\n")
+        duplicate_options = ("スキップ", "上書き", "名前変更", "確認")
         selected_duplicate = self.duplicate_button_group.checkedId()
         if selected_duplicate >= 0:
-            preview_text += f"重複処理: {duplicate_options[selected_duplicate]}\n"
+            parts.append(f"重複処理: {duplicate_options[selected_duplicate]}\n")
 
-        preview_text += f"関連ファイル: {'コピーする' if self.copy_related_check.isChecked() else 'コピーしない'}\n"
-        preview_text += f"ハッシュ計算: {'有効' if self.calculate_hash_check.isChecked() else '無効'}\n"
+        parts.append(
+            f"関連ファイル: {'コピーする' if self.copy_related_check.isChecked() else 'コピーしない'}\n"
+        )
+        parts.append(
+            f"ハッシュ計算: {'有効' if self.calculate_hash_check.isChecked() else '無効'}\n"
+        )
 
-        self.preview_text.setPlainText(preview_text)
+        self._set_preview_text(
+            self.preview_text, "_last_settings_preview", "".join(parts)
+        )
 
     def _save_preset(self):
         """プリセットを保存"""
@@ -798,6 +1042,9 @@ class PresetManagementDialog(QDialog):
             QMessageBox.warning(self, "エラー", "プリセット名を入力してください。")
             return
 
+        # 全タブのウィジェット値を読むため、未構築タブを実体化する
+        self._ensure_all_tabs_built()
+
         # 設定データを収集
         preset_data = {
             "folder_structure": {
@@ -858,98 +1105,7 @@ class PresetManagementDialog(QDialog):
 
     def _apply_styling(self):
         """スタイリングを適用"""
-        self.setStyleSheet(
-            """
-            QDialog {
-                background-color: #2d2d30;
-                color: #ffffff;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #3e3e42;
-                border-radius: 6px;
-                margin-top: 8px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                padding: 6px 12px;
-                min-height: 24px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-            QPushButton:default {
-                background-color: #0e639c;
-            }
-            QPushButton:default:hover {
-                background-color: #1177bb;
-            }
-            QLineEdit, QComboBox, QSpinBox {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                padding: 4px 8px;
-                min-height: 20px;
-            }
-            QLineEdit:focus, QComboBox:focus, QSpinBox:focus {
-                border-color: #0e639c;
-            }
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-            }
-            QTreeWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #0e639c;
-            }
-            QCheckBox, QRadioButton {
-                color: #ffffff;
-                spacing: 8px;
-            }
-            QCheckBox::indicator, QRadioButton::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #3e3e42;
-                background-color: #2d2d30;
-            }
-            QTabBar::tab {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #0e639c;
-            }
-            QTabBar::tab:hover {
-                background-color: #4a4a4a;
-            }
-        """
-        )
+        self.setStyleSheet(_DIALOG_QSS)
 
 
 def main():
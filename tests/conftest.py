@@ -0,0 +1,61 @@
+"""
+テスト共通のフィクスチャ定義
+
+FileInfoは合成したstat結果から構築し、実ファイルを一切作成しない。
+共有状態を持たないため、pytest-xdist（pytest -n auto）による
+並列実行にも対応する。
+"""
+
+import os
+
+import pytest
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.file_info import FileInfo
+
+# 合成stat用の固定値（mtimeは負キャッシュのキーにも使われる）
+_FAKE_SIZE = 12
+_FAKE_MTIME = 1_700_000_000
+
+
+def make_file_info(filename: str, media_type: str, metadata: dict) -> FileInfo:
+    """テスト用FileInfoオブジェクトを作成（実ファイル不要）
+
+    FileInfoはstat_resultを外から渡せるため、存在しないパスに対して
+    合成したos.stat_resultで構築できる。
+    """
+    stat = os.stat_result(
+        (0o100644, 0, 0, 1, 0, 0, _FAKE_SIZE, _FAKE_MTIME, _FAKE_MTIME, _FAKE_MTIME)
+    )
+    file_info = FileInfo(
+        os.path.join("/nonexistent/filter_tests", filename), stat_result=stat
+    )
+    file_info.media_type = media_type
+    file_info.metadata = metadata
+    return file_info
+
+
+@pytest.fixture(scope="session")
+def test_files():
+    """テスト用のファイル情報一式（セッション全体で1回だけ構築）
+
+    各テストは読み取り専用で参照するため共有しても安全。
+    """
+    return [
+        # 通常の画像ファイル
+        make_file_info("photo001.jpg", "image", {"datetime": "2024:01:15 12:30:45"}),
+
+        # スクリーンショット
+        make_file_info("IMG_0123.PNG", "image", {"width": 750, "height": 1334}),
+
+        # 動画ファイル
+        make_file_info("video001.mp4", "video", {"datetime": "2024:06:15 14:20:30"}),
+
+        # 古い写真
+        make_file_info("old_photo.jpg", "image", {"datetime": "2020:12:01 10:15:20"}),
+
+        # RAWファイル
+        make_file_info("raw_image.arw", "raw", {"datetime": "2024:02:20 16:45:10"}),
+    ]